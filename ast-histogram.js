@@ -0,0 +1,98 @@
+#!/usr/bin/env node
+
+// Parse files without type information and count their AST nodes by type.
+// .svelte files are parsed with svelte-eslint-parser, TypeScript files with
+// @typescript-eslint/parser and everything else with espree.
+//
+// Usage: ast-histogram.js <files.json>
+//
+// files.json is a list of paths relative to the current directory. Prints
+// {"files": {"<path>": {"nodes": {"<type>": count}, "tokens": n, "bytes": n, "parse_ms": ms}}}.
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+const { performance } = require("perf_hooks");
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const requireFromTarget = name => require(resolveFromTarget(name));
+
+const eslintRequire = createRequire(resolveFromTarget("eslint"));
+const espree = eslintRequire("espree");
+const defaultVisitorKeys = eslintRequire("eslint-visitor-keys").KEYS;
+
+const typescriptExtensions = new Set([".ts", ".mts", ".cts", ".tsx"]);
+const parserOptions = {
+    ecmaVersion: "latest",
+    sourceType: "module",
+    range: true,
+    loc: true,
+    tokens: true,
+    comment: true,
+};
+
+const parse = (filename, text) => {
+    const extension = path.extname(filename);
+    if (extension === ".svelte") {
+        return requireFromTarget("svelte-eslint-parser").parseForESLint(text, {
+            ...parserOptions,
+            filePath: filename,
+            parser: requireFromTarget("@typescript-eslint/parser"),
+        });
+    }
+    if (typescriptExtensions.has(extension)) {
+        return requireFromTarget("@typescript-eslint/parser").parseForESLint(text, {
+            ...parserOptions,
+            filePath: filename,
+            jsx: extension === ".tsx",
+        });
+    }
+    return { ast: espree.parse(text, { ...parserOptions, ecmaFeatures: { jsx: extension === ".jsx" } }) };
+};
+
+const countNodes = (ast, visitorKeys) => {
+    const nodes = {};
+    const stack = [ast];
+    while (stack.length > 0) {
+        const node = stack.pop();
+        nodes[node.type] = (nodes[node.type] || 0) + 1;
+        const keys = visitorKeys[node.type] || Object.keys(node).filter(key => !["parent", "loc", "range", "tokens", "comments"].includes(key));
+        for (const key of keys) {
+            const child = node[key];
+            for (const value of Array.isArray(child) ? child : [child]) {
+                if (value && typeof value === "object" && typeof value.type === "string") {
+                    stack.push(value);
+                }
+            }
+        }
+    }
+    return nodes;
+};
+
+const files = {};
+for (const filename of JSON.parse(fs.readFileSync(process.argv[2], "utf8"))) {
+    const text = fs.readFileSync(filename, "utf8");
+    const start = performance.now();
+    let result;
+    try {
+        result = parse(path.resolve(filename), text);
+    } catch (error) {
+        files[filename] = { error: String(error.message || error) };
+        continue;
+    }
+    const parseMs = performance.now() - start;
+    files[filename] = {
+        nodes: countNodes(result.ast, { ...defaultVisitorKeys, ...result.visitorKeys }),
+        tokens: (result.ast.tokens || []).length,
+        bytes: Buffer.byteLength(text),
+        parse_ms: parseMs,
+    };
+}
+console.log(JSON.stringify({ files }));
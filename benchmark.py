@@ -0,0 +1,727 @@
+#!/usr/bin/env python
+
+# End-to-end lint benchmark.
+#
+#   benchmark.py corpus DIR [--files N] [--mix ts=6,svelte=3,js=1] [--seed S]
+#       Generate a synthetic corpus of TypeScript modules, Svelte components
+#       and plain JavaScript files.
+#
+#   benchmark.py run DIR [--variants ...] [--threshold 0.1]
+#       Lint the corpus with each generated config variant, append wall time,
+#       per-phase time and peak RSS to the results history and fail if a
+#       variant got slower than the recent baseline by more than the threshold.
+#
+#   benchmark.py compare DIR BASELINE VARIANT
+#       Lint the corpus with two variants and show the difference, e.g.
+#       `compare DIR svelte svelte:svelte-check` on a `--mix svelte=1` corpus,
+#       or `compare DIR svelte svelte@errors-only` to see what the warnings cost.
+#
+#   benchmark.py options DIR CONFIG RULE... [--costs option-costs.json]
+#       Lint the corpus with each rule alone, once per option variant found in
+#       the rule's schema, and record the cost and findings of each variant.
+#       make_eslintrc.py --option-costs warns about configured options that
+#       cost much more than a variant with the same findings.
+#
+#   benchmark.py registry [--rules 1000 10000 50000] [--sources 20]
+#       Time indexing and validating synthetic rule registries, to check that
+#       the cost per rule stays flat as sources are added.
+
+import argparse
+import datetime
+import hashlib
+import json
+import random
+import statistics
+import string
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+from rule_registry import RuleRegistry, extension_prefix
+
+
+default_history = lint_runner.here / "benchmark-history.json"
+default_option_costs = lint_runner.here / "option-costs.json"
+
+corpus_tsconfig = {
+    "compilerOptions": {
+        "allowJs": True,
+        "allowUnreachableCode": False,
+        "allowUnusedLabels": False,
+        "module": "ESNext",
+        "moduleResolution": "node",
+        "noEmit": True,
+        "noFallthroughCasesInSwitch": True,
+        "strict": True,
+        "target": "ES2020",
+    },
+    "include": ["src/**/*.ts", "src/**/*.js", "src/**/*.svelte"],
+}
+
+words = [
+    "account", "audit", "basket", "cache", "channel", "config", "cursor", "draft",
+    "entry", "event", "filter", "invoice", "job", "ledger", "member", "message",
+    "order", "payment", "profile", "queue", "report", "session", "ticket", "upload",
+]
+
+
+def pascal(name):
+    return "".join(part.capitalize() for part in name.split("-"))
+
+
+def camel(name):
+    name = pascal(name)
+    return name[0].lower() + name[1:]
+
+
+def ts_function(rng, name):
+    kind = rng.choice(["sum", "filter", "switch", "async"])
+    if kind == "sum":
+        return f"""\
+export function total{pascal(name)}(items: readonly Item[]): number {{
+    let total = 0;
+    for (const item of items) {{
+        if (item.tags.includes("{name}")) {{
+            total += item.id * 2;
+        }} else if (item.name.length > 10) {{
+            total += item.id;
+        }}
+    }}
+    return total;
+}}
+"""
+    if kind == "filter":
+        return f"""\
+export function select{pascal(name)}(items: readonly Item[], query: string): Item[] {{
+    const normalized = query.trim().toLowerCase();
+    return items
+        .filter(item => item.name.toLowerCase().includes(normalized))
+        .map(item => ({{ ...item, tags: [...item.tags, "{name}"] }}))
+        .sort((a, b) => a.id - b.id);
+}}
+"""
+    if kind == "switch":
+        return f"""\
+export function describe{pascal(name)}(state: State): string {{
+    switch (state.kind) {{
+        case "idle":
+            return "idle";
+        case "loading":
+            return `loading ${{state.progress}}%`;
+        case "failed":
+            return `failed: ${{state.error.message}}`;
+        default:
+            return "unknown";
+    }}
+}}
+"""
+    return f"""\
+export async function fetch{pascal(name)}(url: string, signal?: AbortSignal): Promise<Item[]> {{
+    const response = await fetch(`${{url}}/{name}`, {{ signal }});
+    if (!response.ok) {{
+        throw new Error(`Request failed with status ${{response.status}}`);
+    }}
+    const body = (await response.json()) as {{ items?: Item[] }};
+    return body.items ?? [];
+}}
+"""
+
+
+def ts_module(rng, index, size):
+    name = f"{rng.choice(words)}-{index}"
+    lines = []
+    if index > 0:
+        imported = rng.randrange(index)
+        lines.append(f'import {{ Store{imported} }} from "./module-{imported}";\n')
+    lines.append(f"""\
+export interface Item {{
+    id: number;
+    name: string;
+    tags: readonly string[];
+}}
+
+export type State =
+    | {{ kind: "idle" }}
+    | {{ kind: "loading"; progress: number }}
+    | {{ kind: "failed"; error: Error }};
+
+export class Store{index} {{
+    private readonly items = new Map<number, Item>();
+
+    public add(item: Item): void {{
+        this.items.set(item.id, item);
+    }}
+
+    public find(id: number): Item | undefined {{
+        return this.items.get(id);
+    }}
+
+    public get size(): number {{
+        return this.items.size;
+    }}
+}}
+""")
+    if rng.random() < 0.2:
+        lines.append(f"""\
+export enum {pascal(name)}Kind {{
+    Primary = "primary",
+    Secondary = "secondary",
+}}
+""")
+    for function_index in range(size):
+        lines.append(ts_function(rng, f"{name}-{function_index}"))
+    return "\n".join(lines)
+
+
+def svelte_component(rng, index, size, module_count):
+    name = rng.choice(words)
+    script = ""
+    if rng.random() < 0.9:
+        # Without TypeScript modules in the corpus, e.g. with --mix svelte=1,
+        # the component declares the type itself.
+        if module_count:
+            item_type = f'import type {{ Item }} from "../lib/module-{rng.randrange(module_count)}";'
+        else:
+            item_type = "type Item = { id: number; name: string; tags: readonly string[] };"
+        script = f"""\
+<script lang="ts">
+    import {{ onMount }} from "svelte";
+    {item_type}
+
+    export let title: string;
+    export let items: Item[] = [];
+
+    let count = 0;
+    let expanded = false;
+
+    $: total = items.length + count;
+    $: visible = expanded ? items : items.slice(0, 5);
+
+    function increment(): void {{
+        count += 1;
+    }}
+
+    onMount(() => {{
+        expanded = items.length < 10;
+    }});
+</script>
+
+"""
+    blocks = []
+    for block_index in range(size):
+        blocks.append(f"""\
+    {{#each visible as item (item.id)}}
+        <p class:active={{item.id === count}}>{{item.name}} #{block_index}</p>
+    {{:else}}
+        <p>No {name}s</p>
+    {{/each}}
+    {{#if total > {block_index * 5}}}
+        <span class="badge">{{total}}</span>
+    {{/if}}""")
+    markup = "\n".join(blocks) if script else f"    <p>Static {name} {index}</p>"
+    buttons = (
+        '\n    <button type="button" on:click={increment}>Add</button>' if script else ""
+    )
+    heading = "{title}" if script else pascal(name)
+    return f"""\
+{script}<section class="card">
+    <h2>{heading}</h2>
+{markup}{buttons}
+</section>
+
+<style>
+    .card {{
+        padding: 1rem;
+    }}
+</style>
+"""
+
+
+def js_module(rng, index, size):
+    name = f"{rng.choice(words)}-{index}"
+    functions = "\n".join(
+        f"""\
+export function {camel(name)}{function_index}(values, factor = 2) {{
+    const result = [];
+    for (const value of values) {{
+        if (typeof value === "number") {{
+            result.push(value * factor);
+        }}
+    }}
+    return result;
+}}
+"""
+        for function_index in range(size)
+    )
+    return f"""\
+const defaults = {{ name: "{name}", retries: 3 }};
+
+export default defaults;
+
+{functions}"""
+
+
+def parse_mix(mix):
+    weights = {}
+    for part in mix.split(","):
+        kind, _, weight = part.partition("=")
+        if kind not in ("ts", "svelte", "js"):
+            raise argparse.ArgumentTypeError(f"Unknown file kind '{kind}'")
+        weights[kind] = float(weight)
+    return weights
+
+
+def generate_corpus(directory, files, mix, size, seed):
+    rng = random.Random(seed)
+    total_weight = sum(mix.values())
+    counts = {kind: round(files * weight / total_weight) for kind, weight in mix.items()}
+
+    (directory / "src" / "lib").mkdir(parents=True, exist_ok=True)
+    (directory / "src" / "components").mkdir(parents=True, exist_ok=True)
+    (directory / "tsconfig.json").write_text(json.dumps(corpus_tsconfig, indent=4) + "\n")
+
+    # ESLint resolves parsers and plugins relative to the linted directory.
+    node_modules = directory / "node_modules"
+    if not node_modules.exists() and (lint_runner.here / "node_modules").exists():
+        node_modules.symlink_to(lint_runner.here / "node_modules")
+
+    for index in range(counts.get("ts", 0)):
+        module_size = rng.randint(1, 2 * size)
+        (directory / "src" / "lib" / f"module-{index}.ts").write_text(
+            ts_module(rng, index, module_size)
+        )
+    for index in range(counts.get("svelte", 0)):
+        component_size = rng.randint(1, size)
+        (directory / "src" / "components" / f"Component{index}.svelte").write_text(
+            svelte_component(rng, index, component_size, counts.get("ts", 0))
+        )
+    for index in range(counts.get("js", 0)):
+        module_size = rng.randint(1, size)
+        (directory / "src" / "lib" / f"util-{index}.js").write_text(js_module(rng, index, module_size))
+
+    spec = {"files": files, "mix": mix, "size": size, "seed": seed, "counts": counts}
+    (directory / "corpus.json").write_text(json.dumps(spec, indent=4) + "\n")
+    return spec
+
+
+# Optimizations benchmarked as "<config>:<name>" variants, each returning
+# (config, report) like the make_eslintrc.py functions they wrap. Each profile
+# from make_eslintrc.config_profiles is benchmarked as "<config>@<profile>".
+variant_optimizations = {
+    "tsc": lambda config: make_eslintrc.add_tsc_overrides(config, corpus_tsconfig["compilerOptions"]),
+    "svelte-check": make_eslintrc.turn_off_svelte_check_rules,
+    "parsers": make_eslintrc.add_parser_overrides,
+}
+
+
+def benchmark_variants():
+    # name: (target config, config dict)
+    variants = {}
+    for config_name in make_eslintrc.configs:
+        config = make_eslintrc.make_config(config_name)
+        variants[config_name] = (config_name, config)
+        for profile in make_eslintrc.config_profiles:
+            variants[f"{config_name}@{profile}"] = (config_name, make_eslintrc.make_config(config_name, profile))
+        for optimization_name, optimize in variant_optimizations.items():
+            optimized_config, _ = optimize(config)
+            if optimized_config != config:
+                variants[f"{config_name}:{optimization_name}"] = (config_name, optimized_config)
+    return variants
+
+
+def summarize_run(results):
+    files = results["files"].values()
+    parse_ms = sum(stats["parse_ms"] for stats in files)
+    rules = Counter()
+    for stats in files:
+        rules.update(stats["rules"])
+    rules_ms = sum(rules.values())
+    return {
+        "wall_ms": round(results["wall_ms"], 1),
+        "peak_rss_mb": round(results["peak_rss_mb"], 1),
+        "phases_ms": {
+            "startup": round(results["startup_ms"], 1),
+            "parse": round(parse_ms, 1),
+            "rules": round(rules_ms, 1),
+            "other": round(results["lint_ms"] - parse_ms - rules_ms, 1),
+        },
+        "files": len(results["files"]),
+        "rules_ms": {rule: round(duration, 2) for rule, duration in rules.most_common()},
+    }
+
+
+def run_variant(directory, config_name, config, repeat):
+    # The fastest of the repeated runs is the least noisy estimate.
+    runs = [
+        summarize_run(lint_runner.run_instrumented(directory, config_name, config, ["src"]))
+        for _ in range(repeat)
+    ]
+    return min(runs, key=lambda run: run["wall_ms"])
+
+
+def git_revision():
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=lint_runner.here,
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def source_versions():
+    return {name: source["version"] for name, source in make_eslintrc.rule_sources.items()}
+
+
+def check_regression(history, corpus, variant, result, threshold, baseline_runs):
+    previous = [
+        entry for entry in history
+        if entry["corpus"] == corpus and variant in entry["variants"]
+    ][-baseline_runs:]
+    if not previous:
+        return None
+
+    baseline = statistics.median(entry["variants"][variant]["wall_ms"] for entry in previous)
+    change = result["wall_ms"] / baseline - 1
+    message = f"{variant}: {result['wall_ms']:.0f} ms vs baseline {baseline:.0f} ms ({change:+.1%})"
+    if change <= threshold:
+        return None
+
+    # Point at what changed since the last run and which rules got slower.
+    last_entry = previous[-1]
+    last = last_entry["variants"][variant]
+    details = []
+    if last["fingerprint"] != result["fingerprint"]:
+        details.append("  - generated config changed")
+    for source_name, version in source_versions().items():
+        last_version = last_entry["versions"].get(source_name)
+        if last_version != version:
+            details.append(f"  - {source_name} version {last_version} -> {version}")
+    rule_changes = Counter(result["rules_ms"])
+    rule_changes.subtract(last["rules_ms"])
+    for rule, change_ms in rule_changes.most_common(5):
+        if change_ms > 0:
+            details.append(f"  - {rule}: +{change_ms:.0f} ms")
+    return "\n".join([message, *details])
+
+
+def run_benchmark(directory, variant_names, repeat, history_path, threshold, baseline_runs):
+    corpus = json.loads((directory / "corpus.json").read_text())
+    variants = benchmark_variants()
+    history = json.loads(history_path.read_text()) if history_path.exists() else []
+
+    entry = {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "versions": source_versions(),
+        "corpus": corpus,
+        "variants": {},
+    }
+    regressions = []
+    for variant in variant_names or variants:
+        config_name, config = variants[variant]
+        result = run_variant(directory, config_name, config, repeat)
+        result["fingerprint"] = lint_runner.config_fingerprint(config)
+        phases = ", ".join(f"{phase} {duration:.0f} ms" for phase, duration in result["phases_ms"].items())
+        print(
+            f"{variant}: {result['wall_ms']:.0f} ms wall, {result['peak_rss_mb']:.0f} MB peak RSS"
+            f" ({phases})"
+        )
+        regression = check_regression(history, corpus, variant, result, threshold, baseline_runs)
+        if regression:
+            regressions.append(regression)
+        entry["variants"][variant] = result
+
+    history.append(entry)
+    history_path.write_text(json.dumps(history, indent=4) + "\n")
+
+    if regressions:
+        print(f"Lint time regressed by more than {threshold:.0%}:", file=sys.stderr)
+        print("\n".join(regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+def compare_variants(directory, baseline_variant, variant, repeat):
+    variants = benchmark_variants()
+    results = {
+        name: run_variant(directory, *variants[name], repeat)
+        for name in (baseline_variant, variant)
+    }
+    baseline, result = results[baseline_variant], results[variant]
+
+    def change(before, after):
+        return f"{before:>10.0f} ms {after:>10.0f} ms {after - before:>+10.0f} ms"
+
+    lines = [
+        f"{'':<40}{baseline_variant:>13} {variant:>13} {'change':>13}",
+        f"{'wall':<40}{change(baseline['wall_ms'], result['wall_ms'])}",
+    ]
+    for phase in baseline["phases_ms"]:
+        lines.append(f"{phase:<40}{change(baseline['phases_ms'][phase], result['phases_ms'][phase])}")
+    lines.append(f"{'peak RSS':<40}{baseline['peak_rss_mb']:>10.0f} MB {result['peak_rss_mb']:>10.0f} MB")
+    changed_rules = sorted(
+        set(baseline["rules_ms"]) ^ set(result["rules_ms"]),
+        key=lambda rule: -baseline["rules_ms"].get(rule, 0),
+    )
+    for rule in changed_rules:
+        lines.append(f"{rule:<40}{change(baseline['rules_ms'].get(rule, 0), result['rules_ms'].get(rule, 0))}")
+    return "\n".join(lines)
+
+
+def rule_schemas(directory, config_name, rules):
+    plugins = {
+        make_eslintrc.rule_sources[source_name]["package"]: make_eslintrc.rule_sources[source_name]["prefix"]
+        for source_name in make_eslintrc.configs[config_name]["rule_sources"]
+        if make_eslintrc.rule_sources[source_name]["prefix"]
+    }
+    result = subprocess.run(
+        ["node", str(lint_runner.here / "get-rule-schemas.js"), json.dumps(plugins), *rules],
+        cwd=directory,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def resolve_schema(schema, root):
+    # Only local references such as "#/definitions/options" are followed.
+    while isinstance(schema, dict) and "$ref" in schema:
+        if not schema["$ref"].startswith("#/"):
+            return {}
+        reference = schema["$ref"]
+        schema = root
+        for part in reference[2:].split("/"):
+            schema = schema.get(part, {}) if isinstance(schema, dict) else {}
+    return schema
+
+
+def option_lists(schema, root):
+    # The item schemas of each form the options array can take.
+    schema = resolve_schema(schema, root)
+    if isinstance(schema, list):
+        return [schema]
+    for key in ("anyOf", "oneOf"):
+        if key in schema:
+            return [items for branch in schema[key] for items in option_lists(branch, root)]
+    if schema.get("type") == "array":
+        items = schema.get("items", [])
+        return [items if isinstance(items, list) else [items]]
+    return []
+
+
+def enum_values(schema, root):
+    schema = resolve_schema(schema, root)
+    if "enum" in schema:
+        return schema["enum"]
+    return [
+        value
+        for key in ("anyOf", "oneOf") if key in schema
+        for branch in schema[key] for value in enum_values(branch, root)
+    ]
+
+
+def option_variants(schema, configured, max_variants):
+    # The configured options, no options, and the configured options with a
+    # single enum value or object property changed.
+    variants = [configured, []]
+    for items in option_lists(schema, schema):
+        for index, item in enumerate(items[:len(configured) + 1]):
+            for value in enum_values(item, schema):
+                variants.append(configured[:index] + [value] + configured[index + 1:len(items)])
+            item = resolve_schema(item, schema)
+            current = configured[index] if index < len(configured) and isinstance(configured[index], dict) else {}
+            for name, property_schema in item.get("properties", {}).items():
+                property_schema = resolve_schema(property_schema, schema)
+                if property_schema.get("type") == "boolean":
+                    values = [not current.get(name, property_schema.get("default", False))]
+                else:
+                    values = enum_values(property_schema, schema)
+                for value in values:
+                    variants.append(configured[:index] + [current | {name: value}] + configured[index + 1:len(items)])
+
+    unique = {}
+    for variant in variants:
+        unique.setdefault(json.dumps(variant, sort_keys=True), variant)
+    return list(unique.values())[:max_variants]
+
+
+def measure_option_variant(directory, config_name, rule, severity, options, patterns, repeat):
+    config = make_eslintrc.make_config(config_name) | {"rules": {rule: [severity, *options]}}
+    runs = []
+    for _ in range(repeat):
+        results = lint_runner.run_instrumented(directory, config_name, config, patterns, check=False, diagnostics=True)
+        if results is None:
+            return None
+        runs.append(results)
+    findings = sorted(
+        (path, diagnostic["line"], diagnostic["column"], diagnostic["message"])
+        for path, stats in runs[0]["files"].items()
+        for diagnostic in stats.get("diagnostics", [])
+        if diagnostic["ruleId"] == rule
+    )
+    rule_ms = min(sum(stats["rules"].get(rule, 0) for stats in run["files"].values()) for run in runs)
+    return {
+        "ms_per_file": round(rule_ms / max(len(runs[0]["files"]), 1), 4),
+        "findings": len(findings),
+        "findings_hash": hashlib.sha256(json.dumps(findings).encode()).hexdigest()[:16],
+    }
+
+
+def sweep_options(directory, config_name, rules, patterns, repeat, max_variants, costs_path):
+    configured_rules = make_eslintrc.make_config(config_name)["rules"]
+    schemas = rule_schemas(directory, config_name, rules)
+    costs = json.loads(costs_path.read_text()) if costs_path.exists() else {}
+    corpus_path = directory / "corpus.json"
+    corpus = json.loads(corpus_path.read_text()) if corpus_path.exists() else str(directory)
+
+    for rule in rules:
+        if schemas.get(rule) is None:
+            print(f"Unknown rule '{rule}' for config '{config_name}'", file=sys.stderr)
+            sys.exit(1)
+        value = configured_rules.get(rule, "off")
+        configured = value[1:] if isinstance(value, list) else []
+        severity = make_eslintrc.rule_severity(value)
+        if severity == "off":
+            severity = "warn"
+
+        variants = {}
+        for options in option_variants(schemas[rule], configured, max_variants):
+            key = json.dumps(options, sort_keys=True)
+            result = measure_option_variant(directory, config_name, rule, severity, options, patterns, repeat)
+            if result is None:
+                print(f"{rule} {key}: rejected by ESLint")
+                continue
+            variants[key] = result
+            print(f"{rule} {key}: {result['ms_per_file']:.3f} ms/file, {result['findings']} findings")
+        costs[rule] = {
+            "configured": json.dumps(configured, sort_keys=True),
+            "corpus": corpus,
+            "versions": source_versions(),
+            "variants": variants,
+        }
+    costs_path.write_text(json.dumps(costs, indent=4) + "\n")
+
+
+def synthetic_sources(rule_count, source_count, seed=0):
+    # Sources shaped like the real ones: a core source, plugins reusing a few
+    # of its rule names, the first one as extension rules, and some deprecated
+    # rules in every plugin.
+    rng = random.Random(seed)
+    per_source = rule_count // source_count
+    sources = {}
+    core_names = []
+    for index in range(source_count):
+        names = set()
+        while len(names) < per_source:
+            names.add("-".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 8))) for _ in range(3)))
+        if index == 0:
+            core_names = sorted(names)
+        else:
+            names |= set(rng.sample(core_names, min(10, len(core_names))))
+        rules = {name: ["error", {"option": rng.random() < 0.5}] for name in sorted(names)}
+        deprecated = [f"old-rule-{number}" for number in range(per_source // 50)]
+        sources[f"source-{index}"] = {
+            "prefix": "" if index == 0 else extension_prefix if index == 1 else f"plugin-{index}",
+            "rules": rules,
+            "from_js": list(rules),
+            "from_js_deprecated": deprecated,
+        }
+    return sources
+
+
+def benchmark_registry(rule_counts, source_count, repeat):
+    lines = [f"{'rules':>8} {'sources':>8} {'index ms':>10} {'validate ms':>12} {'us/rule':>8}"]
+    for rule_count in rule_counts:
+        sources = synthetic_sources(rule_count, source_count)
+        index_times = []
+        validate_times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            registry = RuleRegistry(sources)
+            middle = time.perf_counter()
+            errors = registry.validate()
+            end = time.perf_counter()
+            index_times.append((middle - start) * 1000)
+            validate_times.append((end - middle) * 1000)
+        if errors:
+            print("\n".join(errors), file=sys.stderr)
+            sys.exit(1)
+        index_ms = min(index_times)
+        validate_ms = min(validate_times)
+        per_rule = (index_ms + validate_ms) * 1000 / len(registry.rules)
+        lines.append(f"{len(registry.rules):>8} {source_count:>8} {index_ms:>10.1f} {validate_ms:>12.1f} {per_rule:>8.2f}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="End-to-end lint benchmark.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    corpus_parser = subparsers.add_parser("corpus", help="generate a synthetic corpus")
+    corpus_parser.add_argument("directory", type=Path)
+    corpus_parser.add_argument("--files", type=int, default=200)
+    corpus_parser.add_argument("--mix", type=parse_mix, default="ts=6,svelte=3,js=1")
+    corpus_parser.add_argument("--size", type=int, default=4, help="typical functions/blocks per file")
+    corpus_parser.add_argument("--seed", type=int, default=0)
+
+    run_parser = subparsers.add_parser("run", help="lint the corpus and record the results")
+    run_parser.add_argument("directory", type=Path)
+    run_parser.add_argument("--variants", nargs="+", choices=benchmark_variants())
+    run_parser.add_argument("--repeat", type=int, default=1)
+    run_parser.add_argument("--history", type=Path, default=default_history)
+    run_parser.add_argument("--threshold", type=float, default=0.1, help="allowed slowdown, 0.1 = 10%%")
+    run_parser.add_argument("--baseline-runs", type=int, default=5, help="history entries to compare against")
+
+    compare_parser = subparsers.add_parser("compare", help="compare two variants on the corpus")
+    compare_parser.add_argument("directory", type=Path)
+    compare_parser.add_argument("baseline", choices=benchmark_variants())
+    compare_parser.add_argument("variant", choices=benchmark_variants())
+    compare_parser.add_argument("--repeat", type=int, default=3)
+
+    options_parser = subparsers.add_parser("options", help="measure the cost of rule option variants")
+    options_parser.add_argument("directory", type=Path)
+    options_parser.add_argument("config", choices=make_eslintrc.configs)
+    options_parser.add_argument("rules", nargs="+")
+    options_parser.add_argument("--patterns", nargs="+", default=["src"], help="files to lint")
+    options_parser.add_argument("--repeat", type=int, default=3)
+    options_parser.add_argument("--max-variants", type=int, default=20, help="variants per rule")
+    options_parser.add_argument("--costs", type=Path, default=default_option_costs)
+
+    registry_parser = subparsers.add_parser("registry", help="time rule registry validation on synthetic sources")
+    registry_parser.add_argument("--rules", type=int, nargs="+", default=[1000, 10000, 50000])
+    registry_parser.add_argument("--sources", type=int, default=20)
+    registry_parser.add_argument("--repeat", type=int, default=5)
+
+    args = parser.parse_args()
+    if args.command == "options":
+        sweep_options(
+            args.directory.resolve(),
+            args.config,
+            args.rules,
+            args.patterns,
+            args.repeat,
+            args.max_variants,
+            args.costs,
+        )
+    elif args.command == "registry":
+        print(benchmark_registry(args.rules, args.sources, args.repeat))
+    elif args.command == "compare":
+        print(compare_variants(args.directory.resolve(), args.baseline, args.variant, args.repeat))
+    elif args.command == "corpus":
+        spec = generate_corpus(args.directory, args.files, args.mix, args.size, args.seed)
+        print(f"Generated {sum(spec['counts'].values())} files in {args.directory}")
+    else:
+        make_eslintrc.run_checks_once()
+        run_benchmark(
+            args.directory.resolve(),
+            args.variants,
+            args.repeat,
+            args.history,
+            args.threshold,
+            args.baseline_runs,
+        )
@@ -0,0 +1,49 @@
+#!/usr/bin/env node
+
+// Print the parserOptions.project and tsconfigRootDir that the config gives
+// each file, after the overrides are applied, as JSON. Used by shard_planner.py.
+//
+// Usage: config-projects.js <options.json>
+//
+// options.json: {
+//     "config": "path/to/generated/config.json",
+//     "files": ["src/app.ts", ...]
+// }
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+
+const options = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const { ESLint } = require(resolveFromTarget("eslint"));
+
+const main = async () => {
+    const eslint = new ESLint({
+        cwd: process.cwd(),
+        useEslintrc: false,
+        overrideConfigFile: options.config,
+    });
+    const projects = {};
+    for (const file of options.files) {
+        const { parserOptions = {} } = await eslint.calculateConfigForFile(file);
+        projects[file] = {
+            project: parserOptions.project || null,
+            tsconfigRootDir: parserOptions.tsconfigRootDir || null,
+        };
+    }
+    console.log(JSON.stringify(projects));
+};
+
+main().catch(error => {
+    console.error(error);
+    process.exitCode = 1;
+});
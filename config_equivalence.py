@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+
+# Check that an optimized config still reports everything the baseline does.
+#
+# Lints a repository with the plain generated config and with the config built
+# from the given make_eslintrc.py options, diffs the diagnostics per file and
+# rule, and fails if any finding disappears that is not in the allowlist.
+#
+#   config_equivalence.py svelte --tsconfig tsconfig.json --cwd REPO
+#
+# The allowlist is a JSON list of {"rule": glob, "file": glob, "reason": text};
+# "file" defaults to every file.
+
+import argparse
+import json
+import sys
+from collections import Counter, defaultdict
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+ts_prefix = make_eslintrc.rule_sources["typescript-eslint"]["prefix"]
+
+
+def normalize_rule(rule):
+    # Extension rules may be swapped for their base rule (see
+    # add_parser_overrides), which reports the same findings.
+    if rule and rule.startswith(f"{ts_prefix}/"):
+        return make_eslintrc.get_rule_registry().base_rule(rule)
+    return rule or "(fatal)"
+
+
+def findings(results):
+    return Counter(
+        (path, normalize_rule(diagnostic["ruleId"]), diagnostic["line"], diagnostic["column"], diagnostic["message"])
+        for path, stats in results["files"].items()
+        for diagnostic in stats.get("diagnostics", [])
+    )
+
+
+def is_allowed(allowlist, path, rule):
+    return any(
+        fnmatchcase(rule, entry["rule"]) and fnmatchcase(path, entry.get("file", "*"))
+        for entry in allowlist
+    )
+
+
+def format_findings(title, counter, limit=5):
+    by_rule = defaultdict(list)
+    for (path, rule, line, column, message), count in sorted(counter.items()):
+        by_rule[rule] += [f"{path}:{line}:{column} {message}"] * count
+    lines = [f"{title}:"]
+    for rule, locations in sorted(by_rule.items(), key=lambda item: -len(item[1])):
+        lines.append(f"  - {rule}: {len(locations)}")
+        lines += [f"      {location}" for location in locations[:limit]]
+        if len(locations) > limit:
+            lines.append(f"      ... and {len(locations) - limit} more")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check an optimized config against the baseline.")
+    make_eslintrc.add_generator_arguments(parser)
+    parser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+    parser.add_argument("--patterns", nargs="+", default=["."], help="files to lint")
+    parser.add_argument("--allowlist", type=Path, help="JSON list of findings allowed to disappear")
+    args = parser.parse_args()
+    if args.oxlint:
+        print(
+            "--oxlint is not supported: only ESLint's findings are compared, so every finding of the"
+            " rules moved to oxlint would count as lost",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    make_eslintrc.run_checks_once()
+    baseline_config = make_eslintrc.make_config(args.config)
+    optimized_config, reports = make_eslintrc.make_config_from_args(args)
+    if optimized_config == baseline_config:
+        print("The options do not change the config, nothing to compare", file=sys.stderr)
+        sys.exit(1)
+    for title, report in reports.items():
+        make_eslintrc.print_report(title, report)
+    allowlist = json.loads(args.allowlist.read_text()) if args.allowlist else []
+
+    cwd = args.cwd.resolve()
+    baseline = lint_runner.run_instrumented(cwd, args.config, baseline_config, args.patterns, diagnostics=True)
+    optimized = lint_runner.run_instrumented(cwd, args.config, optimized_config, args.patterns, diagnostics=True)
+
+    baseline_findings = findings(baseline)
+    optimized_findings = findings(optimized)
+    lost = baseline_findings - optimized_findings
+    gained = optimized_findings - baseline_findings
+    allowed = Counter({key: count for key, count in lost.items() if is_allowed(allowlist, key[0], key[1])})
+    unexpected = lost - allowed
+
+    saved_ms = baseline["wall_ms"] - optimized["wall_ms"]
+    print(
+        f"Baseline {baseline['wall_ms']:.0f} ms, optimized {optimized['wall_ms']:.0f} ms,"
+        f" saved {saved_ms:.0f} ms ({saved_ms / baseline['wall_ms']:.1%})"
+    )
+    print(f"Findings: {sum(baseline_findings.values())} baseline, {sum(optimized_findings.values())} optimized")
+    if allowed:
+        print(format_findings("Allowed to disappear", allowed))
+    if gained:
+        print(format_findings("New findings", gained))
+    if unexpected:
+        print(format_findings("Findings that disappeared", unexpected), file=sys.stderr)
+        sys.exit(1)
+    print("No findings were lost")
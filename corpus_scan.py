@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+
+# Fast pre-scan of a repository for the syntax families its code uses, and
+# for the script language of its Svelte components.
+#
+# The patterns are deliberately loose: they look at raw text, including
+# comments and strings, so a family is only reported missing when it really
+# is, and a component only counts as JavaScript when no script in it could be
+# TypeScript. Results are cached per file content hash (and syntax families
+# per tree hash) in node_modules/.cache/make-eslintrc/ of the scanned repository.
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+
+syntax_families = {
+    "async": re.compile(r"\b(?:async|await)\b"),
+    "classes": re.compile(r"\bclass\b"),
+    "debugger": re.compile(r"\bdebugger\b"),
+    "enums": re.compile(r"\benum\s+[A-Za-z_$]"),
+    "for-in": re.compile(r"\bfor\s*\([^;]*?\bin\b"),
+    "generators": re.compile(
+        r"\bfunction\s*\*|\byield\b"
+        r"|(?:^|[{,;])\s*(?:(?:static|public|private|protected|override|async)\s+)*\*\s*[\w$\[#\"']",
+        re.M,
+    ),
+    "getters-setters": re.compile(r"\b(?:get|set)\b"),
+    # Any statement can be labelled, so every "name:" at the start of a
+    # statement counts, object keys and type annotations included.
+    "labels": re.compile(r"(?:^|[;{})]|\belse)\s*[A-Za-z_$][\w$]*\s*:(?![:=])", re.M),
+    "namespaces": re.compile(r"\b(?:namespace|module)\s+[\w$\"']"),
+    "octal": re.compile(r"(?<![\w.])0[0-7]+(?![\w.])|\\[0-7]"),
+    "switch": re.compile(r"\bswitch\s*\("),
+    "templates": re.compile(r"`"),
+    "triple-slash": re.compile(r"///\s*<reference"),
+    "with": re.compile(r"\bwith\s*\("),
+}
+
+# File extensions that can only contain JSX.
+jsx_extensions = {".jsx", ".tsx"}
+
+# Other files that can contain JSX, for which any tag-like text counts.
+jsx_possible_extensions = {".js", ".cjs", ".mjs"}
+jsx_tag = re.compile(r"<(?:>|/?[A-Za-z][\w.:-]*(?:\s|/?>))")
+
+source_extensions = {".js", ".cjs", ".mjs", ".jsx", ".ts", ".cts", ".mts", ".tsx", ".svelte"}
+
+max_cached_trees = 20
+
+svelte_script = re.compile(r"<script\b([^>]*)>", re.I)
+svelte_typescript = re.compile(r"""\b(?:lang|type)\s*=\s*["']?(?:text/)?(?:ts|typescript)\b""", re.I)
+
+
+def scan_text(text, extension):
+    families = {family for family, pattern in syntax_families.items() if pattern.search(text)}
+    if extension in jsx_extensions or (extension in jsx_possible_extensions and jsx_tag.search(text)):
+        families.add("jsx")
+    return sorted(families)
+
+
+def content_hash(path):
+    # Same as `git hash-object`, so git's index can be used without reading files.
+    data = path.read_bytes()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def git_files(root):
+    def git(*args):
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True)
+        if result.returncode != 0:
+            return None
+        return [name for name in result.stdout.decode().split("\0") if name]
+
+    staged = git("ls-files", "-s", "-z")
+    if staged is None:
+        return None
+    files = {}
+    for line in staged:
+        info, _, name = line.partition("\t")
+        files[name] = info.split()[1]
+    for name in git("ls-files", "-d", "-z") or []:
+        files.pop(name, None)
+    for name in git("ls-files", "-m", "-o", "--exclude-standard", "-z") or []:
+        if (root / name).is_file():
+            files[name] = content_hash(root / name)
+    return files
+
+
+def walk_files(root):
+    files = {}
+    for directory, subdirectories, names in os.walk(root):
+        subdirectories[:] = [name for name in subdirectories if name not in ("node_modules", ".git")]
+        for name in names:
+            path = Path(directory) / name
+            files[path.relative_to(root).as_posix()] = content_hash(path)
+    return files
+
+
+def source_files(root):
+    files = git_files(root)
+    if files is None:
+        files = walk_files(root)
+    return {
+        name: blob for name, blob in sorted(files.items())
+        if Path(name).suffix in source_extensions and "node_modules/" not in name
+    }
+
+
+def cache_path(root, name="syntax-scan.json"):
+    return root / "node_modules" / ".cache" / "make-eslintrc" / name
+
+
+def scan_repository(root):
+    root = Path(root).resolve()
+    files = source_files(root)
+    tree_hash = hashlib.sha1(json.dumps(files).encode()).hexdigest()
+
+    path = cache_path(root)
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        cache = {"trees": {}, "blobs": {}}
+    if tree_hash in cache["trees"]:
+        return cache["trees"][tree_hash]
+
+    families = set()
+    blobs = {}
+    for name, blob in files.items():
+        if blob not in cache["blobs"]:
+            text = (root / name).read_text(errors="replace")
+            cache["blobs"][blob] = scan_text(text, Path(name).suffix)
+        blobs[blob] = cache["blobs"][blob]
+        families.update(blobs[blob])
+
+    # Keep only the blobs of the current tree and the most recent trees.
+    trees = list(cache["trees"].items())[-(max_cached_trees - 1):]
+    cache = {"trees": dict(trees) | {tree_hash: sorted(families)}, "blobs": blobs}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(cache))
+    return sorted(families)
+
+
+def svelte_script_kind(text):
+    # "ts" if any <script> may be TypeScript, "js" if there are only plain
+    # scripts, "none" for markup-only components.
+    scripts = svelte_script.findall(text)
+    if any(svelte_typescript.search(attributes) for attributes in scripts):
+        return "ts"
+    return "js" if scripts else "none"
+
+
+def scan_svelte_components(root):
+    root = Path(root).resolve()
+    components = {name: blob for name, blob in source_files(root).items() if name.endswith(".svelte")}
+
+    path = cache_path(root, "svelte-components.json")
+    try:
+        cache = json.loads(path.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    kinds = {}
+    blobs = {}
+    for name, blob in components.items():
+        kind = cache.get(blob) or svelte_script_kind((root / name).read_text(errors="replace"))
+        blobs[blob] = kinds[name] = kind
+
+    # Only the blobs of the current tree are kept.
+    if blobs != cache:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(blobs))
+    return kinds
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List the syntax families used in a repository.")
+    parser.add_argument("root", nargs="?", default=".")
+    args = parser.parse_args()
+
+    families = scan_repository(args.root)
+    unused = sorted((set(syntax_families) | {"jsx"}) - set(families))
+    print(f"Used: {', '.join(families) or '(none)'}")
+    print(f"Unused: {', '.join(unused) or '(none)'}", file=sys.stderr)
+    kinds = list(scan_svelte_components(args.root).values())
+    if kinds:
+        print(f"Svelte components: {', '.join(f'{kinds.count(kind)} {kind}' for kind in ('ts', 'js', 'none'))}")
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+
+# Static lint-cost model for repositories without timing history.
+#
+#   cost_model.py listeners CONFIG --cwd REPO
+#       List the AST selectors of every enabled rule and flag the rules that
+#       need type information, listen on every node or re-scan the file at
+#       Program:exit.
+#
+#   cost_model.py predict CONFIG --cwd REPO [--output FILE]
+#       Predict lint time per rule and per file from the rules' selectors and
+#       the node types of every file. --output writes the per-file predictions
+#       for `shard_planner.py plan --predicted`.
+#
+#   cost_model.py calibrate CONFIG --cwd REPO
+#       Lint a repository with timings and fit the model's coefficients to it.
+#
+# All commands accept the make_eslintrc.py options. Selectors come from calling
+# each rule's create() with a stub context (get-rule-listeners.js), node types
+# from parsing without type information (ast-histogram.js).
+
+import argparse
+import json
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import Counter
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+default_model = lint_runner.here / "cost-model.json"
+
+# Used until `calibrate` fits them: ms per file and rule, ms per node a rule
+# listens to, the slowdown of rules that query the type checker, ms per token
+# for rules that re-scan the file at Program:exit, and the cost of parsing with
+# a TypeScript program relative to parsing the file alone.
+default_coefficients = {
+    "setup_ms": 0.005,
+    "node_ms": 0.0005,
+    "type_aware_factor": 20,
+    "program_exit_token_ms": 0.0002,
+    "typed_parse_factor": 4,
+}
+
+function_types = {"FunctionDeclaration", "FunctionExpression", "ArrowFunctionExpression"}
+
+typescript_extensions = {".ts", ".mts", ".cts", ".tsx", ".svelte"}
+
+
+def split_top_level(text, separator):
+    # Split on separator outside of parentheses, brackets and quotes.
+    parts = [""]
+    depth = 0
+    quote = None
+    for char in text:
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "\"'":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif depth == 0 and re.fullmatch(separator, char):
+            parts.append("")
+            continue
+        parts[-1] += char
+    return [part.strip() for part in parts if part.strip()]
+
+
+def selector_types(selector):
+    # Node types a listener runs for, or None if it runs for every node.
+    selector = selector.removesuffix(":exit")
+    if selector.startswith("onCodePath"):
+        return function_types | {"Program"}
+    types = set()
+    for alternative in split_top_level(selector, ","):
+        # The subject is the last compound selector.
+        subject = split_top_level(alternative, r"[\s>+~]")[-1]
+        if ":function" in subject:
+            types |= function_types
+        names = set(re.findall(r"(?:^|[(,]\s*)([A-Z][A-Za-z]*)", subject))
+        if not names and ":function" not in subject:
+            return None
+        types |= names
+    return types
+
+
+def enabled_rules(config):
+    return {
+        rule: value[1:] if isinstance(value, list) else []
+        for rule, value in config["rules"].items()
+        if make_eslintrc.rule_severity(value) != "off"
+    }
+
+
+def run_node_script(cwd, script, data):
+    with tempfile.TemporaryDirectory() as tmp:
+        input_path = Path(tmp) / "input.json"
+        input_path.write_text(json.dumps(data))
+        result = subprocess.run(
+            ["node", str(lint_runner.here / script), str(input_path)],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        print(f"{script} failed:\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    return json.loads(result.stdout)
+
+
+def rule_listeners(cwd, config_name, config):
+    sources = [make_eslintrc.rule_sources[name] for name in make_eslintrc.configs[config_name]["rule_sources"]]
+    listeners = run_node_script(cwd, "get-rule-listeners.js", {
+        "plugins": {source["package"]: source["prefix"] for source in sources if source["prefix"]},
+        "extensions": make_eslintrc.configs[config_name]["extensions"],
+        "rules": enabled_rules(config),
+    })
+    for listener in listeners.values():
+        listener["types"] = {selector: selector_types(selector) for selector in listener["selectors"]}
+        listener["every_node"] = any(types is None for types in listener["types"].values())
+        listener["program_exit"] = "Program:exit" in listener["selectors"]
+    return listeners
+
+
+def ast_histograms(cwd, files):
+    return run_node_script(cwd, "ast-histogram.js", files)["files"]
+
+
+def matched_nodes(listener, nodes):
+    total = sum(nodes.values())
+    matched = 0
+    for types in listener["types"].values():
+        matched += total if types is None else sum(nodes.get(node_type, 0) for node_type in types)
+    return matched
+
+
+def load_model(path):
+    model = json.loads(path.read_text()) if path and path.exists() else {}
+    return {"coefficients": default_coefficients | model.get("coefficients", {}), "rules": model.get("rules", {})}
+
+
+def predict_rule_ms(rule, listener, file_stats, model):
+    coefficients = model["coefficients"]
+    node_ms = model["rules"].get(rule, {}).get("node_ms")
+    if node_ms is None:
+        node_ms = coefficients["node_ms"] * (coefficients["type_aware_factor"] if listener["type_aware"] else 1)
+    ms = coefficients["setup_ms"] + node_ms * matched_nodes(listener, file_stats["nodes"])
+    if listener["program_exit"]:
+        ms += coefficients["program_exit_token_ms"] * file_stats["tokens"]
+    return ms
+
+
+def predict(listeners, histograms, model):
+    typed = any(listener["type_aware"] for listener in listeners.values())
+    files = {}
+    for path, file_stats in histograms.items():
+        if "error" in file_stats:
+            continue
+        parse_ms = file_stats["parse_ms"]
+        if typed and Path(path).suffix in typescript_extensions:
+            parse_ms *= model["coefficients"]["typed_parse_factor"]
+        rules = {
+            rule: predict_rule_ms(rule, listener, file_stats, model)
+            for rule, listener in listeners.items()
+        }
+        files[path] = {"total_ms": parse_ms + sum(rules.values()), "parse_ms": parse_ms, "rules": rules}
+    return files
+
+
+def calibrate(cwd, config_name, config, listeners, histograms, model):
+    results = lint_runner.run_instrumented(cwd, config_name, config, list(histograms))
+    coefficients = model["coefficients"]
+    measured = Counter()
+    matched = Counter()
+    files = 0
+    for path, file_stats in histograms.items():
+        if "error" in file_stats or path not in results["files"]:
+            continue
+        files += 1
+        measured.update(results["files"][path]["rules"])
+        for rule, listener in listeners.items():
+            matched[rule] += matched_nodes(listener, file_stats["nodes"])
+
+    rules = {}
+    for rule, listener in listeners.items():
+        if matched[rule] > 0 and rule in measured:
+            node_ms = max(measured[rule] - coefficients["setup_ms"] * files, 0) / matched[rule]
+            rules[rule] = {"node_ms": node_ms, "type_aware": listener["type_aware"]}
+
+    # Rules that were not measured get the median of their kind.
+    plain = [rule["node_ms"] for rule in rules.values() if not rule["type_aware"]]
+    typed = [rule["node_ms"] for rule in rules.values() if rule["type_aware"]]
+    if plain:
+        coefficients["node_ms"] = statistics.median(plain)
+        if typed and coefficients["node_ms"] > 0:
+            coefficients["type_aware_factor"] = statistics.median(typed) / coefficients["node_ms"]
+
+    typescript_files = [
+        path for path in histograms
+        if Path(path).suffix in typescript_extensions and path in results["files"] and "error" not in histograms[path]
+    ]
+    fast_parse_ms = sum(histograms[path]["parse_ms"] for path in typescript_files)
+    if any(listener["type_aware"] for listener in listeners.values()) and fast_parse_ms > 0:
+        coefficients["typed_parse_factor"] = (
+            sum(results["files"][path]["parse_ms"] for path in typescript_files) / fast_parse_ms
+        )
+    return {"coefficients": coefficients, "rules": rules}
+
+
+def format_listeners(listeners):
+    lines = []
+    for title, key in [
+        ("Type-aware rules", "type_aware"),
+        ("Rules listening on every node", "every_node"),
+        ("Rules re-scanning at Program:exit", "program_exit"),
+    ]:
+        rules = sorted(rule for rule, listener in listeners.items() if listener[key])
+        lines.append(f"{title} ({len(rules)}):")
+        lines += [f"  - {rule}: {', '.join(listeners[rule]['selectors'])}" for rule in rules]
+    failed = sorted(rule for rule, listener in listeners.items() if "error" in listener)
+    if failed:
+        lines.append(f"Rules whose create() failed with a stub context ({len(failed)}):")
+        lines += [f"  - {rule}: {listeners[rule]['error']}" for rule in failed]
+    return "\n".join(lines)
+
+
+def format_prediction(files, top):
+    rules = Counter()
+    for file_prediction in files.values():
+        rules.update(file_prediction["rules"])
+    total_ms = sum(file_prediction["total_ms"] for file_prediction in files.values())
+    parse_ms = sum(file_prediction["parse_ms"] for file_prediction in files.values())
+    lines = [f"Predicted {total_ms / 1000:.1f} s for {len(files)} files ({parse_ms / 1000:.1f} s parsing)", "Rules:"]
+    lines += [f"  {ms:>10.1f} ms  {rule}" for rule, ms in rules.most_common(top)]
+    lines.append("Files:")
+    slowest = sorted(files.items(), key=lambda item: -item[1]["total_ms"])[:top]
+    lines += [f"  {file_prediction['total_ms']:>10.1f} ms  {path}" for path, file_prediction in slowest]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Predict lint cost from rule selectors and AST statistics.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for command, help_text in [
+        ("listeners", "list rule selectors and flag expensive listeners"),
+        ("predict", "predict lint time per rule and file"),
+        ("calibrate", "fit the model to a repository's timings"),
+    ]:
+        subparser = subparsers.add_parser(command, help=help_text)
+        make_eslintrc.add_generator_arguments(subparser)
+        subparser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+        subparser.add_argument("--model", type=Path, default=default_model)
+        if command == "predict":
+            subparser.add_argument("--top", type=int, default=15)
+            subparser.add_argument("--output", type=Path, help="write per-file predictions as JSON")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    cwd = args.cwd.resolve()
+    config, _ = make_eslintrc.make_config_from_args(args)
+    listeners = rule_listeners(cwd, args.config, config)
+    if args.command == "listeners":
+        print(format_listeners(listeners))
+        sys.exit(0)
+
+    histograms = ast_histograms(cwd, lint_runner.lint_files(cwd, args.config, config))
+    model = load_model(args.model)
+    if args.command == "calibrate":
+        model = calibrate(cwd, args.config, config, listeners, histograms, model)
+        args.model.write_text(json.dumps(model, indent=4) + "\n")
+        print(f"Fitted {len(model['rules'])} rules, wrote {args.model}")
+    else:
+        files = predict(listeners, histograms, model)
+        print(format_prediction(files, args.top))
+        if args.output:
+            args.output.write_text(json.dumps(
+                {path: round(file_prediction["total_ms"], 2) for path, file_prediction in files.items()},
+                indent=4,
+            ) + "\n")
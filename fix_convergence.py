@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+# Measure how many `eslint --fix` passes each file needs with a generated
+# config and find rules whose fixes keep coming back because another rule
+# undoes them. Nothing is written to the linted files.
+#
+# Pairs found here can be added to conflicting_fixers in make_eslintrc.py so
+# that run_checks() rejects the combination.
+
+import argparse
+import pprint
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+# ESLint gives up after this many passes (MAX_AUTOFIX_PASSES).
+max_fix_passes = 10
+
+
+def file_conflicts(fix_passes):
+    # Rules that fix something in more than one pass, and pairs of them that
+    # fix the same lines in consecutive passes.
+    rule_passes = defaultdict(set)
+    for index, fixes in enumerate(fix_passes):
+        for fix in fixes:
+            rule_passes[fix["ruleId"]].add(index)
+    returning = {rule for rule, passes in rule_passes.items() if len(passes) > 1}
+
+    pairs = set()
+    for fixes, next_fixes in zip(fix_passes, fix_passes[1:]):
+        for fix in fixes:
+            for next_fix in next_fixes:
+                if (
+                    fix["ruleId"] != next_fix["ruleId"]
+                    and fix["ruleId"] in returning
+                    and next_fix["ruleId"] in returning
+                    and abs(fix["line"] - next_fix["line"]) <= 1
+                ):
+                    pairs.add(tuple(sorted((fix["ruleId"], next_fix["ruleId"]))))
+    return returning, pairs
+
+
+def analyze(results):
+    analysis = {
+        "passes": Counter(),
+        "not_converged": [],
+        "returning": Counter(),
+        "pairs": Counter(),
+        "slowest": [],
+    }
+    for path, stats in results["files"].items():
+        fix_passes = stats.get("fix_passes", [])
+        # After the last pass ESLint checks the fixed text once more, so a file
+        # that still has fixes then records one more non-empty pass than it
+        # was given; converging on the last pass is not a failure.
+        passes = min(len(fix_passes), max_fix_passes)
+        analysis["passes"][passes] += 1
+        if len(fix_passes) > max_fix_passes:
+            analysis["not_converged"].append(path)
+        analysis["slowest"].append((passes, path))
+        returning, pairs = file_conflicts(fix_passes)
+        analysis["returning"].update(returning)
+        analysis["pairs"].update(pairs)
+    analysis["slowest"].sort(reverse=True)
+    return analysis
+
+
+def suggested_entries(pairs, rules, min_files):
+    entries = []
+    for (first, second), files in pairs.most_common():
+        if files < min_files:
+            break
+        entries.append({
+            "rules": {
+                rule: rules[rule][1:] if isinstance(rules[rule], list) else []
+                for rule in (first, second)
+            },
+            "reason": f"fixes undo each other, found in {files} files by fix_convergence.py",
+        })
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure fix-pass convergence and find conflicting fixers.")
+    parser.add_argument("config", choices=make_eslintrc.configs)
+    parser.add_argument("patterns", nargs="*", default=["."])
+    parser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+    parser.add_argument("--min-files", type=int, default=2, help="files a pair must conflict in to be suggested")
+    parser.add_argument("--top", type=int, default=10, help="files to list by number of passes")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    config = make_eslintrc.make_config(args.config)
+    results = lint_runner.run_instrumented(args.cwd.resolve(), args.config, config, args.patterns, fix=True)
+    analysis = analyze(results)
+
+    print("Files by number of fix passes:")
+    for passes, files in sorted(analysis["passes"].items()):
+        print(f"  {passes:>3} passes: {files} files")
+    print("\nFiles needing the most passes:")
+    for passes, path in analysis["slowest"][:args.top]:
+        print(f"  {passes:>3}  {path}")
+    if analysis["returning"]:
+        print("\nRules whose fixes come back in later passes (files):")
+        for rule, files in analysis["returning"].most_common():
+            print(f"  {files:>5}  {rule}")
+    if analysis["pairs"]:
+        print("\nRule pairs fixing the same lines in consecutive passes (files):")
+        for (first, second), files in analysis["pairs"].most_common():
+            print(f"  {files:>5}  {first} <-> {second}")
+
+    entries = suggested_entries(analysis["pairs"], config["rules"], args.min_files)
+    if entries:
+        print("\nSuggested conflicting_fixers entries:")
+        print(pprint.pformat(entries, sort_dicts=False))
+    if analysis["not_converged"]:
+        print(
+            f"\n{len(analysis['not_converged'])} files did not converge in {max_fix_passes} passes",
+            file=sys.stderr,
+        )
+        sys.exit(1)
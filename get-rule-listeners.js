@@ -0,0 +1,121 @@
+#!/usr/bin/env node
+
+// Call every given rule's create() against a stub context and print the AST
+// selectors it listens to, and whether it needs type information, as JSON.
+// Packages are loaded from the current directory like lint-instrumented.js.
+//
+// Usage: get-rule-listeners.js <options.json>
+//
+// options.json: {
+//     "plugins": {"eslint-plugin-svelte": "svelte", ...},
+//     "extensions": [".ts", ".svelte", ...],
+//     "rules": {"<rule id>": [<options>], ...}
+// }
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+
+const options = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const requireFromTarget = name => require(resolveFromTarget(name));
+
+const { SourceCode } = requireFromTarget("eslint");
+const espree = createRequire(resolveFromTarget("eslint"))("espree");
+
+const rules = new Map(requireFromTarget("eslint/use-at-your-own-risk").builtinRules);
+for (const [packageName, prefix] of Object.entries(options.plugins || {})) {
+    for (const [name, rule] of Object.entries(requireFromTarget(packageName).rules || {})) {
+        rules.set(`${prefix}/${name}`, rule);
+    }
+}
+
+// Any property access or call on a stub returns another stub, so that rules
+// can set up parser services, type checkers and helpers without a program.
+const stub = () => new Proxy(function () {}, {
+    get: (target, property) => {
+        if (property === Symbol.toPrimitive) {
+            return () => "";
+        }
+        if (property === Symbol.iterator) {
+            return function* () {};
+        }
+        if (property === "then") {
+            return undefined;
+        }
+        return stub();
+    },
+    apply: () => stub(),
+    construct: () => stub(),
+});
+
+const text = "";
+const ast = espree.parse(text, {
+    ecmaVersion: "latest",
+    sourceType: "module",
+    range: true,
+    loc: true,
+    tokens: true,
+    comment: true,
+});
+const sourceCode = new SourceCode(text, ast);
+
+const stubContext = (ruleId, ruleOptions, filename) => ({
+    id: ruleId,
+    options: ruleOptions,
+    settings: {},
+    parserOptions: {},
+    parserPath: "",
+    parserServices: stub(),
+    sourceCode,
+    getSourceCode: () => sourceCode,
+    getFilename: () => filename,
+    getPhysicalFilename: () => filename,
+    getCwd: () => process.cwd(),
+    getScope: () => stub(),
+    getAncestors: () => [],
+    getDeclaredVariables: () => [],
+    markVariableAsUsed: () => false,
+    report: () => {},
+});
+
+const listenersOf = (ruleId, rule, ruleOptions) => {
+    // Some rules only listen for the file types they handle.
+    const extensions = [...new Set([".ts", ...(options.extensions || [])])];
+    let error = null;
+    for (const extension of extensions) {
+        try {
+            const listeners = rule.create(stubContext(ruleId, ruleOptions, path.join(process.cwd(), `stub${extension}`)));
+            const selectors = Object.keys(listeners || {});
+            if (selectors.length > 0) {
+                return { selectors };
+            }
+        } catch (caught) {
+            error = String(caught && caught.message || caught);
+        }
+    }
+    return error ? { selectors: [], error } : { selectors: [] };
+};
+
+const result = {};
+for (const [ruleId, ruleOptions] of Object.entries(options.rules)) {
+    const rule = rules.get(ruleId);
+    if (!rule || typeof rule.create !== "function") {
+        result[ruleId] = { selectors: [], type_aware: false, error: "rule not found" };
+        continue;
+    }
+    const docs = rule.meta && rule.meta.docs || {};
+    result[ruleId] = {
+        ...listenersOf(ruleId, rule, ruleOptions),
+        type_aware: Boolean(docs.requiresTypeChecking),
+    };
+}
+console.log(JSON.stringify(result));
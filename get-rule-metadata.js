@@ -0,0 +1,55 @@
+#!/usr/bin/env node
+
+// Print the versions of ESLint and the given plugins and the metadata of all
+// their rules as JSON, loading them from the current directory.
+//
+// Usage: get-rule-metadata.js '{"eslint-plugin-svelte": "svelte", ...}'
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+
+// package.json may not be exported, so walk up from the package's main file.
+const packageVersion = name => {
+    let directory = path.dirname(targetRequire.resolve(name));
+    while (directory !== path.dirname(directory)) {
+        const packagePath = path.join(directory, "package.json");
+        if (fs.existsSync(packagePath)) {
+            const packageJson = JSON.parse(fs.readFileSync(packagePath, "utf8"));
+            if (packageJson.name === name) {
+                return packageJson.version;
+            }
+        }
+        directory = path.dirname(directory);
+    }
+    return null;
+};
+
+const metadata = rule => {
+    const meta = rule.meta || {};
+    const docs = meta.docs || {};
+    return {
+        deprecated: Boolean(meta.deprecated),
+        replaced_by: meta.replacedBy || [],
+        fixable: meta.fixable || null,
+        has_suggestions: Boolean(meta.hasSuggestions),
+        type_aware: Boolean(docs.requiresTypeChecking),
+        recommended: Boolean(docs.recommended),
+    };
+};
+
+const plugins = JSON.parse(process.argv[2]);
+const packages = { eslint: packageVersion("eslint") };
+const rules = {};
+for (const [name, rule] of targetRequire("eslint/use-at-your-own-risk").builtinRules) {
+    rules[name] = metadata(rule);
+}
+for (const [packageName, prefix] of Object.entries(plugins)) {
+    packages[packageName] = packageVersion(packageName);
+    for (const [name, rule] of Object.entries(targetRequire(packageName).rules || {})) {
+        rules[`${prefix}/${name}`] = metadata(rule);
+    }
+}
+console.log(JSON.stringify({ packages, rules }));
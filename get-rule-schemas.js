@@ -0,0 +1,33 @@
+#!/usr/bin/env node
+
+// Print the option schemas (meta.schema) of the given rules as JSON, loading
+// ESLint and the plugins from the current directory like lint-instrumented.js.
+//
+// Usage: get-rule-schemas.js '{"eslint-plugin-svelte": "svelte", ...}' <rule>...
+
+const path = require("path");
+const { createRequire } = require("module");
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const requireFromTarget = name => {
+    try {
+        return targetRequire(name);
+    } catch {
+        return require(name);
+    }
+};
+
+const plugins = JSON.parse(process.argv[2]);
+const rules = new Map(requireFromTarget("eslint/use-at-your-own-risk").builtinRules);
+for (const [packageName, prefix] of Object.entries(plugins)) {
+    for (const [name, rule] of Object.entries(requireFromTarget(packageName).rules || {})) {
+        rules.set(`${prefix}/${name}`, rule);
+    }
+}
+
+const schemas = {};
+for (const ruleId of process.argv.slice(3)) {
+    const rule = rules.get(ruleId);
+    schemas[ruleId] = rule && rule.meta ? rule.meta.schema || [] : null;
+}
+console.log(JSON.stringify(schemas));
@@ -0,0 +1,47 @@
+#!/usr/bin/env node
+
+// Print which of the given files the config's ignorePatterns exclude, as a
+// JSON list, as ESLint decides it. Used by lint_runner.py.
+//
+// Usage: ignored-files.js <options.json>
+//
+// options.json: {
+//     "config": "path/to/generated/config.json",
+//     "files": ["src/app.ts", ...]
+// }
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+
+const options = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const { ESLint } = require(resolveFromTarget("eslint"));
+
+const main = async () => {
+    const eslint = new ESLint({
+        cwd: process.cwd(),
+        useEslintrc: false,
+        overrideConfigFile: options.config,
+    });
+    const ignored = [];
+    for (const file of options.files) {
+        if (await eslint.isPathIgnored(file)) {
+            ignored.push(file);
+        }
+    }
+    console.log(JSON.stringify(ignored));
+};
+
+main().catch(error => {
+    console.error(error);
+    process.exitCode = 1;
+});
@@ -0,0 +1,62 @@
+#!/usr/bin/env node
+
+// Lint files one at a time in the given order and stop at the first file with
+// an error, printing it with the stylish formatter. Exits with 1 if an error
+// was found. Used by lint_gate.py.
+//
+// Usage: lint-gate.js <options.json>
+//
+// options.json: {
+//     "config": "path/to/generated/config.json",
+//     "extensions": [".js", ".ts"],
+//     "files": ["src/most-likely-to-fail.ts", ...]
+// }
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+const { performance } = require("perf_hooks");
+
+const options = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const { ESLint } = require(resolveFromTarget("eslint"));
+
+const main = async () => {
+    const start = performance.now();
+    // One instance for all files, so that configs, plugins and TypeScript
+    // programs are loaded once.
+    const eslint = new ESLint({
+        cwd: process.cwd(),
+        useEslintrc: false,
+        overrideConfigFile: options.config,
+        extensions: options.extensions,
+        errorOnUnmatchedPattern: false,
+    });
+    const formatter = await eslint.loadFormatter("stylish");
+    for (const [index, file] of options.files.entries()) {
+        const results = await eslint.lintFiles([file]);
+        const failed = results.filter(result => result.errorCount > 0);
+        if (failed.length > 0) {
+            console.log(formatter.format(failed));
+            const seconds = ((performance.now() - start) / 1000).toFixed(1);
+            console.error(`Failed at file ${index + 1} of ${options.files.length} after ${seconds} s`);
+            process.exitCode = 1;
+            return;
+        }
+    }
+    const seconds = ((performance.now() - start) / 1000).toFixed(1);
+    console.error(`No errors in ${options.files.length} files (${seconds} s)`);
+};
+
+main().catch(error => {
+    console.error(error);
+    process.exitCode = 2;
+});
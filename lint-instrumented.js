@@ -0,0 +1,340 @@
+#!/usr/bin/env node
+
+// Lint files with ESLint while timing every rule listener, every parse and every
+// file, per file. Used by the Python tooling via lint_runner.run_instrumented().
+//
+// Usage: lint-instrumented.js <options.json>
+//
+// options.json: {
+//     "config": "path/to/generated/config.json",
+//     "extensions": [".js", ".ts"],
+//     "patterns": ["."],
+//     "plugins": {"eslint-plugin-svelte": "svelte", ...},
+//     "parsers": ["@typescript-eslint/parser", ...],
+//     "fix": false,
+//     "diagnostics": false,
+//     "memory": {"gc": false, "snapshot_thresholds_mb": [], "snapshot_dir": "..."},
+//     "output": "path/to/results.json"
+// }
+//
+// With "memory", the heap is sampled after every file and the TypeScript
+// programs that typescript-estree creates for parserOptions.project are
+// recorded, with the files in each. "gc" collects garbage before each sample so
+// that it shows the retained heap, and a heap snapshot is written the first time
+// the heap exceeds each threshold.
+
+const fs = require("fs");
+const path = require("path");
+const { createRequire } = require("module");
+const { performance } = require("perf_hooks");
+const v8 = require("v8");
+const vm = require("vm");
+
+const startupStart = performance.now();
+
+const options = JSON.parse(fs.readFileSync(process.argv[2], "utf8"));
+
+// Resolve packages the same way ESLint does, from the linted repository.
+const targetRequire = createRequire(path.join(process.cwd(), "__placeholder__.js"));
+const resolveFromTarget = name => {
+    try {
+        return targetRequire.resolve(name);
+    } catch {
+        return require.resolve(name);
+    }
+};
+const requireFromTarget = name => require(resolveFromTarget(name));
+
+const { ESLint, Linter } = requireFromTarget("eslint");
+const eslintRequire = createRequire(resolveFromTarget("eslint"));
+
+const relativePath = filename => path.relative(process.cwd(), filename).split(path.sep).join("/");
+
+const files = new Map();
+const fileStats = filename => {
+    if (!files.has(filename)) {
+        files.set(filename, {
+            total_ms: 0,
+            parse_ms: 0,
+            rules: {},
+            messages: {},
+        });
+    }
+    return files.get(filename);
+};
+
+// Extension rules call into the base ESLint rule's create() and listeners,
+// which are wrapped too; only the outermost call is timed so that time is
+// attributed to the configured rule.
+let depth = 0;
+const timed = (stats, key, fn) => {
+    if (depth > 0) {
+        return fn();
+    }
+    depth += 1;
+    const start = performance.now();
+    try {
+        return fn();
+    } finally {
+        stats[key] = (stats[key] || 0) + performance.now() - start;
+        depth -= 1;
+    }
+};
+
+const instrumentRule = (ruleId, rule) => {
+    if (typeof rule !== "object" || typeof rule.create !== "function") {
+        return;
+    }
+    const originalCreate = rule.create;
+    rule.create = function (context) {
+        const { rules } = fileStats(context.getFilename());
+        const listeners = timed(rules, ruleId, () => originalCreate.call(this, context));
+        for (const [selector, listener] of Object.entries(listeners)) {
+            listeners[selector] = function (...args) {
+                return timed(rules, ruleId, () => listener.apply(this, args));
+            };
+        }
+        return listeners;
+    };
+};
+
+for (const [name, rule] of requireFromTarget("eslint/use-at-your-own-risk").builtinRules) {
+    instrumentRule(name, rule);
+}
+for (const [packageName, prefix] of Object.entries(options.plugins || {})) {
+    const plugin = requireFromTarget(packageName);
+    for (const [name, rule] of Object.entries(plugin.rules || {})) {
+        instrumentRule(`${prefix}/${name}`, rule);
+    }
+}
+
+const instrumentParser = parser => {
+    for (const method of ["parse", "parseForESLint"]) {
+        const original = parser[method];
+        if (typeof original !== "function") {
+            continue;
+        }
+        parser[method] = function (text, parserOptions) {
+            const stats = fileStats(parserOptions && parserOptions.filePath);
+            const start = performance.now();
+            let result;
+            try {
+                result = original.call(this, text, parserOptions);
+                return result;
+            } finally {
+                stats.parse_ms += performance.now() - start;
+                // The Svelte parser passes the options on to the TypeScript
+                // parser; the outermost call has them as configured.
+                if (memory && parserOptions && !("project" in stats)) {
+                    stats.project = parserOptions.project || null;
+                }
+                const services = result && result.services;
+                if (memory && services && services.program && stats.program === undefined) {
+                    stats.program = programIndex(services.program);
+                }
+            }
+        };
+    }
+};
+
+// espree is the default parser and comes from ESLint's own dependencies.
+instrumentParser(eslintRequire("espree"));
+for (const parserName of options.parsers || []) {
+    try {
+        instrumentParser(requireFromTarget(parserName));
+    } catch {
+        // Not installed; the config will fail to load if it is needed.
+    }
+}
+
+const memory = options.memory ? {
+    samples: [],
+    programs: [],
+    snapshots: [],
+    thresholds: [...(options.memory.snapshot_thresholds_mb || [])].sort((a, b) => a - b),
+    gc: null,
+    file: null,
+} : null;
+
+const megabytes = bytes => Math.round(bytes / 1024 / 1024 * 10) / 10;
+
+if (memory) {
+    if (options.memory.gc) {
+        v8.setFlagsFromString("--expose-gc");
+        memory.gc = vm.runInNewContext("gc");
+    }
+    // typescript-estree creates one watch program per tsconfig it is given.
+    try {
+        const parserRequire = createRequire(resolveFromTarget("@typescript-eslint/parser"));
+        const estreeRequire = createRequire(parserRequire.resolve("@typescript-eslint/typescript-estree"));
+        const ts = estreeRequire("typescript");
+        const originalCreateWatchProgram = ts.createWatchProgram;
+        ts.createWatchProgram = function (host, ...args) {
+            const heapBefore = process.memoryUsage().heapUsed;
+            const watch = originalCreateWatchProgram.call(this, host, ...args);
+            memory.programs.push({
+                tsconfig: host.configFileName ? relativePath(host.configFileName) : null,
+                created_by: memory.file,
+                created_at_ms: performance.now() - startupStart,
+                heap_before_mb: megabytes(heapBefore),
+                watch,
+            });
+            return watch;
+        };
+    } catch {
+        // No TypeScript parser, so no programs.
+    }
+}
+
+const currentProgram = watch => {
+    const builderProgram = watch.getCurrentProgram();
+    return builderProgram && builderProgram.getProgram();
+};
+
+const programIndex = program => memory.programs.findIndex(entry => currentProgram(entry.watch) === program);
+
+const programFiles = entry => {
+    const program = currentProgram(entry.watch);
+    const sourceFiles = program ? program.getSourceFiles() : [];
+    return {
+        files: sourceFiles.length,
+        project_files: sourceFiles.filter(
+            sourceFile => !sourceFile.fileName.includes("/node_modules/") && !program.isSourceFileDefaultLibrary(sourceFile)
+        ).length,
+    };
+};
+
+const sampleMemory = filename => {
+    if (memory.gc) {
+        memory.gc();
+    }
+    const usage = process.memoryUsage();
+    memory.samples.push({
+        t_ms: Math.round(performance.now() - startupStart),
+        file: filename ? relativePath(filename) : null,
+        heap_used_mb: megabytes(usage.heapUsed),
+        rss_mb: megabytes(usage.rss),
+        programs: memory.programs.length,
+        program_files: memory.programs.reduce((total, entry) => total + programFiles(entry).files, 0),
+    });
+    while (memory.thresholds.length > 0 && usage.heapUsed >= memory.thresholds[0] * 1024 * 1024) {
+        const threshold = memory.thresholds.shift();
+        const snapshotPath = path.join(options.memory.snapshot_dir, `heap-${threshold}mb.heapsnapshot`);
+        v8.writeHeapSnapshot(snapshotPath);
+        memory.snapshots.push({ threshold_mb: threshold, file: filename ? relativePath(filename) : null, path: snapshotPath });
+    }
+    return usage.heapUsed;
+};
+
+// With fix enabled, verifyAndFix() calls verify() once per fix pass; record
+// which rules offered fixes on which lines in each pass.
+let fixPasses = null;
+
+const originalVerify = Linter.prototype.verify;
+Linter.prototype.verify = function (...args) {
+    const messages = originalVerify.apply(this, args);
+    if (fixPasses) {
+        fixPasses.push(messages
+            .filter(message => message.fix)
+            .map(message => ({ ruleId: message.ruleId, line: message.line })));
+    }
+    return messages;
+};
+
+const originalVerifyAndFix = Linter.prototype.verifyAndFix;
+Linter.prototype.verifyAndFix = function (text, config, verifyOptions) {
+    const filename = typeof verifyOptions === "string" ? verifyOptions : verifyOptions.filename;
+    const stats = fileStats(filename);
+    const shouldFix = typeof verifyOptions === "object" && verifyOptions.fix;
+    fixPasses = shouldFix ? [] : null;
+    if (memory) {
+        memory.file = filename;
+    }
+    const start = performance.now();
+    try {
+        return originalVerifyAndFix.call(this, text, config, verifyOptions);
+    } finally {
+        stats.total_ms += performance.now() - start;
+        if (memory) {
+            const heapBefore = memory.samples.length > 0 ? memory.samples[memory.samples.length - 1].heap_used_mb : 0;
+            stats.heap_delta_mb = Math.round((megabytes(sampleMemory(filename)) - heapBefore) * 10) / 10;
+            memory.file = null;
+        }
+        if (fixPasses) {
+            // The last verify() only re-checks the fixed text.
+            stats.fix_passes = fixPasses.filter(pass => pass.length > 0);
+            fixPasses = null;
+        }
+    }
+};
+
+const main = async () => {
+    const eslint = new ESLint({
+        cwd: process.cwd(),
+        useEslintrc: false,
+        overrideConfigFile: options.config,
+        extensions: options.extensions,
+        fix: Boolean(options.fix),
+    });
+    const startupMs = performance.now() - startupStart;
+    if (memory) {
+        sampleMemory(null);
+    }
+
+    const lintStart = performance.now();
+    const results = await eslint.lintFiles(options.patterns);
+    const lintMs = performance.now() - lintStart;
+
+    for (const result of results) {
+        const stats = fileStats(result.filePath);
+        const { messages } = stats;
+        if (options.diagnostics) {
+            stats.diagnostics = result.messages.map(message => ({
+                ruleId: message.ruleId,
+                severity: message.severity,
+                line: message.line,
+                column: message.column,
+                message: message.message,
+            }));
+        }
+        for (const message of result.messages) {
+            const ruleId = message.ruleId || "(fatal)";
+            const severity = message.severity === 2 ? "error" : "warning";
+            messages[ruleId] = messages[ruleId] || { error: 0, warning: 0 };
+            messages[ruleId][severity] += 1;
+        }
+    }
+
+    // Drop stats for pseudo-filenames such as "<input>".
+    const relativeFiles = {};
+    for (const [filename, stats] of files) {
+        if (filename && path.isAbsolute(filename)) {
+            relativeFiles[relativePath(filename)] = stats;
+        }
+    }
+
+    const output = {
+        startup_ms: startupMs,
+        lint_ms: lintMs,
+        files: relativeFiles,
+    };
+    if (memory) {
+        output.memory = {
+            samples: memory.samples,
+            peak_heap_mb: Math.max(...memory.samples.map(sample => sample.heap_used_mb)),
+            heap_statistics: v8.getHeapStatistics(),
+            programs: memory.programs.map(({ watch, ...entry }) => ({
+                ...entry,
+                created_by: entry.created_by ? relativePath(entry.created_by) : null,
+                ...programFiles({ watch }),
+            })),
+            snapshots: memory.snapshots,
+        };
+    }
+    fs.writeFileSync(options.output, JSON.stringify(output));
+};
+
+main().catch(error => {
+    console.error(error);
+    process.exitCode = 2;
+});
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+
+# Fail-fast lint gate for blocking checks that only need to know whether there
+# is an error.
+#
+#   lint_gate.py run CONFIG --cwd REPO [--base origin/main]
+#       Lint with the errors-only profile of the generated config, the files
+#       most likely to fail first, and stop at the first error. The full
+#       report run with all severities follows separately.
+#
+#   lint_gate.py record CONFIG --cwd REPO [--report eslint.json]
+#       After a full run, record which files had errors from which rules into
+#       lint-failures.json in the repository. --report reads the output of
+#       `eslint --format json` instead of linting again.
+#
+# Files are ordered by a score: changed since --base or not committed, changed
+# in recent commits, and the recorded failure rate of the file for the rules
+# that are errors in the gate's config. Older records count less with each run.
+# Both commands accept the make_eslintrc.py options. With --oxlint, `run` lints
+# with oxlint first, which takes seconds for the whole repository, and `record`
+# refuses because its history only covers the rules that ESLint runs.
+
+import argparse
+import datetime
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+# Weight of each record after a newer one is added.
+history_decay = 0.8
+# Weight of a change n commits ago is recent_decay ** n.
+recent_decay = 0.9
+recent_commits = 100
+
+score_weights = {
+    "changed": 4,
+    "recent": 1,
+    "history": 2,
+}
+
+
+def failures_path(cwd):
+    return cwd / "lint-failures.json"
+
+
+def read_failures(path):
+    return json.loads(path.read_text()) if path.exists() else {"runs": 0, "files": {}}
+
+
+def eslint_report_errors(report, cwd):
+    # Rules with errors per file, from `eslint --format json` output. Files
+    # outside the repository, from a report of another checkout, are skipped.
+    errors = {}
+    outside = 0
+    for result in report:
+        path = Path(result["filePath"]).resolve()
+        if not path.is_relative_to(cwd):
+            outside += 1
+            continue
+        rules = {message.get("ruleId") or "(fatal)" for message in result["messages"] if message["severity"] == 2}
+        errors[path.relative_to(cwd).as_posix()] = rules
+    if outside:
+        print(f"Skipped {outside} files of the report that are not in {cwd}", file=sys.stderr)
+    return errors
+
+
+def lint_errors(cwd, config_name, config, patterns):
+    results = lint_runner.run_instrumented(cwd, config_name, config, patterns)
+    return {
+        path: {rule for rule, counts in stats["messages"].items() if counts["error"]}
+        for path, stats in results["files"].items()
+    }
+
+
+def record_failures(failures, errors):
+    for file_failures in failures["files"].values():
+        for rule in file_failures:
+            file_failures[rule] *= history_decay
+    failures["runs"] = failures["runs"] * history_decay + 1
+    for path, rules in errors.items():
+        file_failures = failures["files"].setdefault(path, {})
+        for rule in rules:
+            file_failures[rule] = file_failures.get(rule, 0) + 1
+    # Drop records that have decayed to nothing.
+    failures["files"] = {
+        path: rounded
+        for path, file_failures in failures["files"].items()
+        if (rounded := {rule: round(count, 3) for rule, count in file_failures.items() if count >= 0.01})
+    }
+    failures["date"] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    return failures
+
+
+def git_lines(cwd, *args):
+    result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return None
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(cwd, base):
+    changed = set(git_lines(cwd, "diff", "--name-only", "--relative", "HEAD") or [])
+    changed |= set(git_lines(cwd, "ls-files", "--others", "--exclude-standard") or [])
+    since_base = git_lines(cwd, "diff", "--name-only", "--relative", f"{base}...HEAD")
+    if since_base is None:
+        print(f"Cannot diff against '{base}', only uncommitted changes are used", file=sys.stderr)
+    return changed | set(since_base or [])
+
+
+def recent_changes(cwd):
+    # Commits are listed newest first, each after a NUL character.
+    result = subprocess.run(
+        ["git", "log", f"-{recent_commits}", "--name-only", "--relative", "--format=%x00"],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+    )
+    weights = {}
+    if result.returncode != 0:
+        return weights
+    for age, commit in enumerate(result.stdout.split("\0")[1:]):
+        for path in commit.splitlines():
+            if not path:
+                continue
+            weights[path] = weights.get(path, 0) + recent_decay ** age
+    return weights
+
+
+def failure_rates(failures, config):
+    # Per file, the highest recorded failure rate among the rules that are
+    # errors in the config; "(fatal)" parse errors always count.
+    error_rules = {
+        rule for rule, value in config["rules"].items() if make_eslintrc.rule_severity(value) == "error"
+    } | {"(fatal)"}
+    runs = failures["runs"] or 1
+    return {
+        path: max((count / runs for rule, count in file_failures.items() if rule in error_rules), default=0)
+        for path, file_failures in failures["files"].items()
+    }
+
+
+def order_files(cwd, files, config, failures, base):
+    changed = changed_files(cwd, base)
+    recent = recent_changes(cwd)
+    rates = failure_rates(failures, config)
+    scores = {}
+    for path in files:
+        recent_weight = recent.get(path, 0)
+        scores[path] = (
+            score_weights["changed"] * (path in changed)
+            + score_weights["recent"] * recent_weight / (recent_weight + 1)
+            + score_weights["history"] * min(rates.get(path, 0), 1)
+        )
+    # Among equally likely files, the smaller ones are linted first.
+    return sorted(files, key=lambda path: (-scores[path], (cwd / path).stat().st_size, path)), scores
+
+
+def run_oxlint(cwd, oxlint_config_path):
+    result = subprocess.run(["npx", "--no-install", "oxlint", "-c", str(oxlint_config_path.resolve()), "."], cwd=cwd)
+    return result.returncode
+
+
+def run_gate(cwd, config_name, config, files):
+    with tempfile.TemporaryDirectory() as tmp, lint_runner.generated_config_file(config, cwd) as config_path:
+        options_path = Path(tmp) / "options.json"
+        options_path.write_text(json.dumps({
+            "config": str(config_path),
+            "extensions": make_eslintrc.configs[config_name]["extensions"],
+            "files": files,
+        }))
+        return subprocess.run(["node", str(lint_runner.here / "lint-gate.js"), str(options_path)], cwd=cwd).returncode
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fail-fast lint gate ordered by failure likelihood.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="lint the likeliest failures first and stop at the first error")
+    make_eslintrc.add_generator_arguments(run_parser)
+    run_parser.set_defaults(profile="errors-only")
+    run_parser.add_argument("--base", default="origin/main", help="revision the changes are compared to")
+    run_parser.add_argument("--show-order", type=int, metavar="N", help="print the first N files and their scores")
+
+    record_parser = subparsers.add_parser("record", help="record the files and rules with errors")
+    make_eslintrc.add_generator_arguments(record_parser)
+    record_parser.add_argument("--patterns", nargs="+", default=["."], help="files to lint")
+    record_parser.add_argument("--report", type=Path, help="output of `eslint --format json` to read instead of linting")
+
+    for subparser in (run_parser, record_parser):
+        subparser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+        subparser.add_argument("--failures", type=Path, help="failure history (default: lint-failures.json in the repository)")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    cwd = args.cwd.resolve()
+    path = args.failures or failures_path(cwd)
+    failures = read_failures(path)
+
+    if args.command == "record":
+        if args.oxlint:
+            print("record does not support --oxlint: the rules oxlint runs would not be recorded", file=sys.stderr)
+            sys.exit(1)
+        if args.report:
+            errors = eslint_report_errors(json.loads(args.report.read_text()), cwd)
+        else:
+            config, _ = make_eslintrc.make_config_from_args(args)
+            errors = lint_errors(cwd, args.config, config, args.patterns)
+        record_failures(failures, errors)
+        path.write_text(json.dumps(failures, indent=4) + "\n")
+        failed = sum(1 for rules in errors.values() if rules)
+        print(f"Recorded {failed} of {len(errors)} files with errors in {path}")
+    else:
+        config, reports = make_eslintrc.make_config_from_args(args)
+        for title, report in reports.items():
+            make_eslintrc.print_report(title, report)
+        files, scores = order_files(cwd, lint_runner.lint_files(cwd, args.config, config), config, failures, args.base)
+        if args.show_order:
+            for name in files[:args.show_order]:
+                print(f"{scores[name]:>6.2f}  {name}", file=sys.stderr)
+        # The rules moved to oxlint are off in the ESLint config.
+        if args.oxlint and run_oxlint(cwd, Path(args.oxlint)) != 0:
+            sys.exit(1)
+        sys.exit(run_gate(cwd, args.config, config, files))
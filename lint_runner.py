@@ -0,0 +1,145 @@
+import contextlib
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path, PurePosixPath
+
+import corpus_scan
+import make_eslintrc
+
+
+here = Path(__file__).resolve().parent
+
+
+def find_node_module(name, cwd):
+    # Prefer the linted repo's own installation, fall back to ours.
+    for base in (Path(cwd), here):
+        path = base / "node_modules" / name
+        if path.exists():
+            return path
+    print(f"Cannot find node module '{name}' in {cwd} or {here}", file=sys.stderr)
+    sys.exit(1)
+
+
+def config_fingerprint(config):
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=make_eslintrc.json_default).encode()).hexdigest()[:16]
+
+
+def lint_files(cwd, config_name, config):
+    # The files `eslint .` lints with the config: its extensions, without the
+    # files its ignorePatterns exclude, which ESLint itself matches.
+    extensions = make_eslintrc.configs[config_name]["extensions"]
+    files = [name for name in corpus_scan.source_files(cwd) if PurePosixPath(name).suffix in extensions]
+    if not config.get("ignorePatterns") or not files:
+        return files
+    with tempfile.TemporaryDirectory() as tmp, generated_config_file(config, cwd) as config_path:
+        options_path = Path(tmp) / "options.json"
+        options_path.write_text(json.dumps({"config": str(config_path), "files": files}))
+        result = subprocess.run(
+            ["node", str(here / "ignored-files.js"), str(options_path)],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        print(f"Cannot match the files against ignorePatterns:\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    ignored = set(json.loads(result.stdout))
+    return [name for name in files if name not in ignored]
+
+
+def eslint_bin(cwd):
+    return find_node_module("eslint", cwd) / "bin" / "eslint.js"
+
+
+@contextlib.contextmanager
+def generated_config_file(config, cwd):
+    # The config file has to live inside the linted repo so that ESLint
+    # resolves parsers relative to the repo's node_modules.
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cwd, prefix=".eslintrc.generated.", suffix=".json", delete=False
+    ) as config_file:
+        json.dump(config, config_file, indent=4, default=make_eslintrc.json_default)
+    try:
+        yield Path(config_file.name)
+    finally:
+        os.unlink(config_file.name)
+
+
+def eslint_args(config_name, config_path, patterns):
+    extensions = ",".join(make_eslintrc.configs[config_name]["extensions"])
+    return ["--no-eslintrc", "-c", str(config_path), "--ext", extensions, *patterns]
+
+
+def run_eslint(cwd, config_name, config_path, patterns, node_args=(), eslint_extra_args=(), **kwargs):
+    command = [
+        "node",
+        *node_args,
+        str(eslint_bin(cwd)),
+        *eslint_args(config_name, config_path, patterns),
+        *eslint_extra_args,
+    ]
+    return subprocess.run(command, cwd=cwd, **kwargs)
+
+
+def instrumented_options(config_name, config, config_path, patterns, output_path, **extra):
+    sources = [
+        make_eslintrc.rule_sources[source_name]
+        for source_name in make_eslintrc.configs[config_name]["rule_sources"]
+    ]
+    parsers = set()
+    for section in (config, *config.get("overrides", [])):
+        if "parser" in section:
+            parsers.add(section["parser"])
+        if "parser" in section.get("parserOptions", {}):
+            parsers.add(section["parserOptions"]["parser"])
+    return {
+        "config": str(config_path),
+        "extensions": make_eslintrc.configs[config_name]["extensions"],
+        "patterns": list(patterns),
+        "plugins": {
+            source["package"]: source["prefix"] for source in sources if source["prefix"]
+        },
+        "parsers": sorted(parsers),
+        "output": str(output_path),
+    } | extra
+
+
+def run_instrumented(cwd, config_name, config, patterns, check=True, **extra):
+    # Returns per-file timings and message counts, see lint-instrumented.js.
+    # With check=False a failed run returns None instead of exiting, for
+    # configs that may be rejected by ESLint.
+    with tempfile.TemporaryDirectory() as tmp, generated_config_file(config, cwd) as config_path:
+        options_path = Path(tmp) / "options.json"
+        output_path = Path(tmp) / "results.json"
+        options = instrumented_options(
+            config_name, config, config_path, patterns, output_path, **extra
+        )
+        options_path.write_text(json.dumps(options))
+        start = time.perf_counter()
+        process = subprocess.Popen(["node", str(here / "lint-instrumented.js"), str(options_path)], cwd=cwd)
+        # wait4() gives the resource usage of this child alone.
+        _, status, rusage = os.wait4(process.pid, 0)
+        wall_ms = (time.perf_counter() - start) * 1000
+        returncode = os.waitstatus_to_exitcode(status)
+        process.returncode = returncode
+        if returncode != 0:
+            if not check:
+                return None
+            print(f"Instrumented lint failed with exit code {returncode}", file=sys.stderr)
+            sys.exit(returncode)
+        return json.loads(output_path.read_text()) | {
+            "wall_ms": wall_ms,
+            "peak_rss_mb": peak_rss_mb(rusage),
+        }
+
+
+def peak_rss_mb(rusage):
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    if sys.platform == "darwin":
+        return rusage.ru_maxrss / 1024 / 1024
+    return rusage.ru_maxrss / 1024
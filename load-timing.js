@@ -0,0 +1,87 @@
+#!/usr/bin/env node
+
+// Measure how long require() of the given packages takes and how much memory
+// they retain, with the time split by the package each loaded module belongs to.
+// Run with --expose-gc for stable memory numbers.
+//
+// Usage: node --expose-gc load-timing.js <package>...
+
+const Module = require("module");
+const path = require("path");
+const { performance } = require("perf_hooks");
+
+const targetRequire = Module.createRequire(path.join(process.cwd(), "__placeholder__.js"));
+
+const packageOf = filename => {
+    if (!path.isAbsolute(filename)) {
+        return "(node)";
+    }
+    const parts = filename.split(path.sep);
+    const index = parts.lastIndexOf("node_modules");
+    if (index === -1) {
+        return "(project)";
+    }
+    const name = parts[index + 1];
+    return name.startsWith("@") ? `${name}/${parts[index + 2]}` : name;
+};
+
+const selfTimes = {};
+const loadedFiles = new Set();
+// Time spent in nested loads, per level of the require() stack.
+const childTimes = [];
+
+const originalLoad = Module._load;
+Module._load = function (request, parent, isMain) {
+    const start = performance.now();
+    childTimes.push(0);
+    try {
+        return originalLoad.call(this, request, parent, isMain);
+    } finally {
+        const total = performance.now() - start;
+        const childTime = childTimes.pop();
+        if (childTimes.length > 0) {
+            childTimes[childTimes.length - 1] += total;
+        }
+        let filename;
+        try {
+            filename = Module._resolveFilename(request, parent, isMain);
+        } catch {
+            filename = request;
+        }
+        loadedFiles.add(filename);
+        const packageName = packageOf(filename);
+        selfTimes[packageName] = (selfTimes[packageName] || 0) + total - childTime;
+    }
+};
+
+const memory = () => {
+    if (global.gc) {
+        global.gc();
+    }
+    const { heapUsed, rss } = process.memoryUsage();
+    return { heapUsed, rss };
+};
+
+const results = [];
+for (const packageName of process.argv.slice(2)) {
+    const before = memory();
+    const filesBefore = loadedFiles.size;
+    const start = performance.now();
+    try {
+        targetRequire(packageName);
+    } catch (error) {
+        results.push({ package: packageName, error: error.message });
+        continue;
+    }
+    const ms = performance.now() - start;
+    const after = memory();
+    results.push({
+        package: packageName,
+        ms,
+        heap_mb: (after.heapUsed - before.heapUsed) / 1024 / 1024,
+        rss_mb: (after.rss - before.rss) / 1024 / 1024,
+        modules: loadedFiles.size - filesBefore,
+    });
+}
+
+console.log(JSON.stringify({ results, packages: selfTimes }));
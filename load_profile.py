@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+
+# Measure the startup cost of the plugins and parsers a generated config needs.
+#
+# Each rule source's packages (plugin and parser) are loaded in a fresh Node
+# process to get their cost in isolation, then all of them together in config
+# order to get the real startup cost with shared dependencies loaded once.
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+def source_packages(config_name):
+    # Packages per rule source, and parsers named in eslint_base that no
+    # rule source accounts for.
+    config = make_eslintrc.configs[config_name]
+    # Plugin sources without a parser of their own have "parser": null.
+    packages = {
+        source_name: [
+            package for package in (
+                make_eslintrc.rule_sources[source_name]["package"],
+                make_eslintrc.rule_sources[source_name]["parser"],
+            ) if package
+        ]
+        for source_name in config["rule_sources"]
+    }
+    known = {package for source in packages.values() for package in source}
+    base = config["eslint_base"]
+    parsers = []
+    for section in (base, *base.get("overrides", [])):
+        parsers += [section.get("parser"), section.get("parserOptions", {}).get("parser")]
+    extra = sorted({parser for parser in parsers if parser and parser not in known})
+    if extra:
+        packages["(eslint_base)"] = extra
+    return packages
+
+
+def load_packages(cwd, packages, repeat):
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            ["node", "--expose-gc", str(lint_runner.here / "load-timing.js"), *packages],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout))
+    for run in runs:
+        for package_result in run["results"]:
+            if "error" in package_result:
+                print(f"Cannot load {package_result['package']}: {package_result['error']}", file=sys.stderr)
+                sys.exit(1)
+
+    # Median over the runs, per requested package and per loaded package.
+    results = [
+        {
+            key: statistics.median(run["results"][index][key] for run in runs)
+            for key in ("ms", "heap_mb", "rss_mb", "modules")
+        }
+        for index in range(len(packages))
+    ]
+    loaded = Counter({
+        package: statistics.median(run["packages"].get(package, 0) for run in runs)
+        for package in set().union(*(run["packages"] for run in runs))
+    })
+    return results, loaded
+
+
+def profile_config(cwd, config_name, repeat):
+    packages = source_packages(config_name)
+    profile = {"sources": {}, "combined": {}}
+    for source_name, package_names in packages.items():
+        results, loaded = load_packages(cwd, package_names, repeat)
+        profile["sources"][source_name] = {
+            "packages": dict(zip(package_names, results)),
+            "ms": sum(result["ms"] for result in results),
+            "heap_mb": sum(result["heap_mb"] for result in results),
+            "loaded_packages": dict(loaded.most_common()),
+        }
+
+    # Load ESLint itself first, as the CLI does, then every source in order.
+    all_packages = list(dict.fromkeys(
+        ["eslint", *(package for source in packages.values() for package in source)]
+    ))
+    results, loaded = load_packages(cwd, all_packages, repeat)
+    profile["combined"] = {
+        "packages": dict(zip(all_packages, results)),
+        "ms": sum(result["ms"] for result in results),
+        "heap_mb": sum(result["heap_mb"] for result in results),
+        "loaded_packages": dict(loaded.most_common()),
+    }
+    return profile
+
+
+def format_profile(profile, top):
+    lines = ["Rule sources loaded in isolation:"]
+    sources = sorted(profile["sources"].items(), key=lambda item: -item[1]["ms"])
+    for source_name, source in sources:
+        lines.append(f"  {source_name:<20} {source['ms']:>8.0f} ms {source['heap_mb']:>8.1f} MB heap")
+        for package, result in source["packages"].items():
+            lines.append(
+                f"    {package:<36} {result['ms']:>8.0f} ms {result['heap_mb']:>8.1f} MB heap"
+                f" {result['modules']:>6.0f} modules"
+            )
+        heaviest = list(source["loaded_packages"].items())[:top]
+        lines.append("    heaviest dependencies: " + ", ".join(f"{name} {ms:.0f} ms" for name, ms in heaviest))
+
+    combined = profile["combined"]
+    lines += ["", f"All packages in one process: {combined['ms']:.0f} ms, {combined['heap_mb']:.1f} MB heap"]
+    for package, result in combined["packages"].items():
+        lines.append(f"    {package:<36} {result['ms']:>8.0f} ms {result['heap_mb']:>8.1f} MB heap")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure plugin and parser load time for a config.")
+    parser.add_argument("config", choices=make_eslintrc.configs)
+    parser.add_argument("--cwd", type=Path, default=Path("."), help="repository whose node_modules to load from")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=5, help="dependencies to show per source")
+    parser.add_argument("--json", action="store_true", help="print the raw profile as JSON")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    profile = profile_config(args.cwd, args.config, args.repeat)
+    if args.json:
+        print(json.dumps(profile, indent=4))
+    else:
+        print(format_profile(profile, args.top))
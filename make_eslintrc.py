@@ -1,7 +1,18 @@
 #!/usr/bin/env python
 
+import argparse
 import json
+import re
 import sys
+from collections import defaultdict
+from fnmatch import fnmatchcase
+from functools import cache
+from pathlib import Path
+from types import MappingProxyType
+
+import corpus_scan
+import rule_db
+from rule_registry import RuleRegistry, prefix_name
 
 
 eslint_rules = {
@@ -1410,6 +1421,8 @@ typescript_eslint_rules = {
 # from_js* lists come directly from the npm packages; fill these from get_eslint_rules.js etc.
 rule_sources = {
     "eslint": {
+        "package": "eslint",
+        "parser": "espree",
         "prefix": "",
         "rules": eslint_rules,
         "updated": "2023-01-28",
@@ -1418,6 +1431,8 @@ rule_sources = {
         "from_js_deprecated": ["callback-return", "global-require", "handle-callback-err", "id-blacklist", "indent-legacy", "lines-around-directive", "newline-after-var", "newline-before-return", "no-buffer-constructor", "no-catch-shadow", "no-mixed-requires", "no-native-reassign", "no-negated-in-lhs", "no-new-require", "no-path-concat", "no-process-env", "no-process-exit", "no-restricted-modules", "no-spaced-func", "no-sync", "prefer-reflect", "require-jsdoc", "valid-jsdoc"],
     },
     "svelte": {
+        "package": "eslint-plugin-svelte",
+        "parser": "svelte-eslint-parser",
         "prefix": "svelte",
         "rules": svelte_rules,
         "updated": "2023-01-28",
@@ -1426,6 +1441,8 @@ rule_sources = {
         "from_js_deprecated": ["@typescript-eslint/no-unnecessary-condition"],
     },
     "typescript-eslint": {
+        "package": "@typescript-eslint/eslint-plugin",
+        "parser": "@typescript-eslint/parser",
         "prefix": "@typescript-eslint",
         "rules": typescript_eslint_rules,
         "updated": "2023-01-28",
@@ -1436,10 +1453,459 @@ rule_sources = {
 }
 
 
-def prefix_name(name, prefix):
-    if not prefix:
-        return name
-    return f"{prefix}/{name}"
+# Rules that need type information (meta.docs.requiresTypeChecking), and so a
+# TypeScript program built from parserOptions.project.
+type_aware_rules = {
+    "@typescript-eslint/await-thenable",
+    "@typescript-eslint/consistent-type-exports",
+    "@typescript-eslint/dot-notation",
+    "@typescript-eslint/naming-convention",
+    "@typescript-eslint/no-base-to-string",
+    "@typescript-eslint/no-confusing-void-expression",
+    "@typescript-eslint/no-floating-promises",
+    "@typescript-eslint/no-for-in-array",
+    "@typescript-eslint/no-implied-eval",
+    "@typescript-eslint/no-meaningless-void-operator",
+    "@typescript-eslint/no-misused-promises",
+    "@typescript-eslint/no-redundant-type-constituents",
+    "@typescript-eslint/no-throw-literal",
+    "@typescript-eslint/no-unnecessary-boolean-literal-compare",
+    "@typescript-eslint/no-unnecessary-condition",
+    "@typescript-eslint/no-unnecessary-qualifier",
+    "@typescript-eslint/no-unnecessary-type-arguments",
+    "@typescript-eslint/no-unnecessary-type-assertion",
+    "@typescript-eslint/no-unsafe-argument",
+    "@typescript-eslint/no-unsafe-assignment",
+    "@typescript-eslint/no-unsafe-call",
+    "@typescript-eslint/no-unsafe-member-access",
+    "@typescript-eslint/no-unsafe-return",
+    "@typescript-eslint/non-nullable-type-assertion-style",
+    "@typescript-eslint/prefer-includes",
+    "@typescript-eslint/prefer-nullish-coalescing",
+    "@typescript-eslint/prefer-readonly",
+    "@typescript-eslint/prefer-readonly-parameter-types",
+    "@typescript-eslint/prefer-reduce-type-parameter",
+    "@typescript-eslint/prefer-regexp-exec",
+    "@typescript-eslint/prefer-return-this-type",
+    "@typescript-eslint/prefer-string-starts-ends-with",
+    "@typescript-eslint/promise-function-async",
+    "@typescript-eslint/require-array-sort-compare",
+    "@typescript-eslint/require-await",
+    "@typescript-eslint/restrict-plus-operands",
+    "@typescript-eslint/restrict-template-expressions",
+    "@typescript-eslint/return-await",
+    "@typescript-eslint/strict-boolean-expressions",
+    "@typescript-eslint/switch-exhaustiveness-check",
+    "@typescript-eslint/unbound-method",
+}
+
+# Kinds of files that only get a reduced rule set, written as overrides by
+# --path-classes. Each names a profile from path_profiles.
+path_classes = {
+    "tests": {
+        "files": ["**/*.test.*", "**/*.spec.*", "**/__tests__/**", "**/test/**", "**/tests/**"],
+        "profile": "relaxed",
+    },
+    "stories": {
+        "files": ["**/*.stories.*", "**/*.story.*"],
+        "profile": "relaxed",
+    },
+    "declarations": {
+        "files": ["**/*.d.ts", "**/*.d.mts", "**/*.d.cts"],
+        "profile": "declarations",
+    },
+    "generated": {
+        "files": ["**/generated/**", "**/__generated__/**", "**/*.generated.*", "**/*.gen.*"],
+        "profile": "generated",
+    },
+}
+
+# Rules turned off by each profile, as fnmatch patterns. With "type_aware" the
+# type-aware rules are off too and the files are parsed without a program.
+# With "ignore" the files go to ignorePatterns instead: an override with every
+# rule off would still parse them, and build a program for them.
+path_profiles = {
+    "relaxed": {
+        "rules": [
+            "complexity",
+            "id-length",
+            "max-*",
+            "*no-magic-numbers",
+            "@typescript-eslint/naming-convention",
+        ],
+        "type_aware": True,
+    },
+    "declarations": {
+        "rules": [
+            "complexity",
+            "max-*",
+            "no-var",
+            "*no-redeclare",
+            "*no-unused-vars",
+            "@typescript-eslint/naming-convention",
+            "@typescript-eslint/no-namespace",
+        ],
+        "type_aware": True,
+    },
+    "generated": {
+        "ignore": True,
+    },
+}
+
+# Rules that the TypeScript compiler already enforces in .ts files, given the
+# compilerOptions listed for each. "uncovered_options" are rule options that
+# tsc does not check; the rule is kept if any of them is enabled.
+tsc_checked_rules = {
+    "@typescript-eslint/no-dupe-class-members": {"reason": "ts(2300), ts(2393)"},
+    "@typescript-eslint/no-invalid-this": {
+        "compiler_options": {"noImplicitThis": True},
+        "reason": "ts(2683)",
+    },
+    "@typescript-eslint/no-redeclare": {"reason": "ts(2451)"},
+    "constructor-super": {"reason": "ts(2335), ts(2377)"},
+    "getter-return": {"reason": "ts(2378)"},
+    "no-const-assign": {"reason": "ts(2588)"},
+    "no-dupe-args": {"reason": "ts(2300)"},
+    "no-dupe-keys": {"reason": "ts(1117)"},
+    "no-fallthrough": {
+        "compiler_options": {"noFallthroughCasesInSwitch": True},
+        "reason": "ts(7029)",
+    },
+    "no-func-assign": {"reason": "ts(2630)"},
+    "no-import-assign": {"reason": "ts(2539), ts(2540)"},
+    "no-new-native-nonconstructor": {
+        "compiler_options": {"noImplicitAny": True},
+        "reason": "ts(7009)",
+    },
+    "no-new-symbol": {
+        "compiler_options": {"noImplicitAny": True},
+        "reason": "ts(7009)",
+    },
+    "no-obj-calls": {"reason": "ts(2349)"},
+    "no-setter-return": {"reason": "ts(2408)"},
+    "no-this-before-super": {"reason": "ts(2376), ts(17009)"},
+    "no-undef": {"reason": "ts(2304)"},
+    "no-unreachable": {
+        "compiler_options": {"allowUnreachableCode": False},
+        "reason": "ts(7027)",
+    },
+    "no-unsafe-negation": {
+        "reason": "ts(2358), ts(2360), ts(2365)",
+        "uncovered_options": ["enforceForOrderingRelations"],
+    },
+    "no-unused-labels": {
+        "compiler_options": {"allowUnusedLabels": False},
+        "reason": "ts(7028)",
+    },
+    "valid-typeof": {
+        "reason": "ts(2367)",
+        "uncovered_options": ["requireStringLiterals"],
+    },
+}
+
+# Options that `strict` turns on unless they are set explicitly.
+strict_compiler_options = [
+    "alwaysStrict",
+    "noImplicitAny",
+    "noImplicitThis",
+    "strictBindCallApply",
+    "strictFunctionTypes",
+    "strictNullChecks",
+    "strictPropertyInitialization",
+    "useUnknownInCatchVariables",
+]
+
+ts_file_patterns = ["*.ts", "*.mts", "*.cts", "*.tsx"]
+
+# Svelte rules that run the Svelte compiler on components, with what they
+# compile. Rules with "svelte_check" are covered by svelte-check, which compiles
+# the same components; the others are kept and their compile cost noted.
+svelte_compiler_rules = {
+    "svelte/no-unused-svelte-ignore": {"compile_cost": "only compiles components with svelte-ignore comments"},
+    "svelte/valid-compile": {
+        "compile_cost": "compiles every component",
+        "svelte_check": "svelte-check reports the same compiler errors and warnings",
+    },
+}
+
+# Rules that can only report on code using a syntax family found by corpus_scan.py.
+syntax_family_rules = {
+    "async": [
+        "@typescript-eslint/require-await",
+        "@typescript-eslint/return-await",
+        "no-async-promise-executor",
+        "no-await-in-loop",
+        "no-return-await",
+        "require-atomic-updates",
+    ],
+    "classes": [
+        "@typescript-eslint/class-literal-property-style",
+        "@typescript-eslint/explicit-member-accessibility",
+        "@typescript-eslint/lines-between-class-members",
+        "@typescript-eslint/member-ordering",
+        "@typescript-eslint/no-dupe-class-members",
+        "@typescript-eslint/no-extraneous-class",
+        "@typescript-eslint/no-useless-constructor",
+        "@typescript-eslint/parameter-properties",
+        "@typescript-eslint/prefer-readonly",
+        "class-methods-use-this",
+        "constructor-super",
+        "lines-between-class-members",
+        "max-classes-per-file",
+        "no-class-assign",
+        "no-constructor-return",
+        "no-dupe-class-members",
+        "no-empty-static-block",
+        "no-this-before-super",
+        "no-unused-private-class-members",
+        "no-useless-constructor",
+    ],
+    "debugger": ["no-debugger"],
+    "enums": [
+        "@typescript-eslint/no-duplicate-enum-values",
+        "@typescript-eslint/prefer-enum-initializers",
+        "@typescript-eslint/prefer-literal-enum-member",
+    ],
+    "for-in": ["@typescript-eslint/no-for-in-array", "guard-for-in"],
+    "generators": ["generator-star-spacing", "require-atomic-updates", "require-yield", "yield-star-spacing"],
+    "getters-setters": ["accessor-pairs", "getter-return", "grouped-accessor-pairs", "no-setter-return"],
+    "jsx": ["jsx-quotes"],
+    "labels": ["no-extra-label", "no-label-var", "no-labels", "no-unused-labels"],
+    "namespaces": [
+        "@typescript-eslint/no-namespace",
+        "@typescript-eslint/no-unnecessary-qualifier",
+        "@typescript-eslint/prefer-namespace-keyword",
+    ],
+    "octal": ["no-octal", "no-octal-escape"],
+    "switch": [
+        "@typescript-eslint/switch-exhaustiveness-check",
+        "default-case",
+        "default-case-last",
+        "no-case-declarations",
+        "no-duplicate-case",
+        "no-fallthrough",
+        "switch-colon-spacing",
+    ],
+    "templates": [
+        "@typescript-eslint/restrict-template-expressions",
+        "template-curly-spacing",
+        "template-tag-spacing",
+    ],
+    "triple-slash": ["@typescript-eslint/triple-slash-reference"],
+    "with": ["no-with"],
+}
+
+# Rule settings whose autofixes undo each other, so `eslint --fix` needs extra
+# passes over the whole rule set. Each entry conflicts when all rules in
+# "rules" are enabled with options starting with the given ones (None matches
+# any option, dicts match a subset), unless a rule matches its "unless" options.
+# fix_convergence.py suggests new entries.
+conflicting_fixers = [
+    *(
+        {
+            "rules": {rule: [], f"@typescript-eslint/{rule}": []},
+            "reason": "the base rule and its extension rule fix the same code",
+        }
+        for rule in [
+            "brace-style",
+            "comma-dangle",
+            "comma-spacing",
+            "func-call-spacing",
+            "indent",
+            "keyword-spacing",
+            "lines-between-class-members",
+            "no-extra-parens",
+            "no-extra-semi",
+            "object-curly-spacing",
+            "padding-line-between-statements",
+            "quotes",
+            "semi",
+            "space-before-blocks",
+            "space-before-function-paren",
+            "space-infix-ops",
+        ]
+    ),
+    *(
+        {
+            "rules": {rule: [], "no-mixed-operators": []},
+            "unless": {rule: [None, {"nestedBinaryExpressions": False}]},
+            "reason": "no-mixed-operators adds parentheses that no-extra-parens removes",
+        }
+        for rule in ["no-extra-parens", "@typescript-eslint/no-extra-parens"]
+    ),
+    {
+        "rules": {"multiline-ternary": ["always"], "operator-linebreak": ["none"]},
+        "reason": "multiline-ternary adds line breaks around ?: that operator-linebreak removes",
+    },
+]
+
+# Options of @typescript-eslint extension rules that the base ESLint rule
+# does not accept.
+ts_only_rule_options = {
+    "comma-dangle": ["enums", "generics", "tuples"],
+    "dot-notation": [
+        "allowIndexSignaturePropertyAccess",
+        "allowPrivateClassPropertyAccess",
+        "allowProtectedClassPropertyAccess",
+    ],
+    "lines-between-class-members": ["exceptAfterOverload"],
+    "no-magic-numbers": [
+        "ignoreEnums",
+        "ignoreNumericLiteralTypes",
+        "ignoreReadonlyClassProperties",
+        "ignoreTypeIndexes",
+    ],
+    "no-redeclare": ["ignoreDeclarationMerge"],
+    "no-shadow": ["ignoreFunctionTypeParameterNameValueShadow", "ignoreTypeValueShadow"],
+    "no-use-before-define": ["enums", "ignoreTypeReferences", "typedefs"],
+}
+
+# Overrides that parse plain JavaScript with espree instead of the TypeScript parser.
+js_parser_overrides = [
+    {
+        "files": ["*.js", "*.mjs", "*.cjs"],
+        "parser": "espree",
+        "parserOptions": {"ecmaVersion": "latest", "sourceType": "module"},
+    },
+    {
+        "files": ["*.cjs"],
+        "env": {"commonjs": True},
+        "parserOptions": {"sourceType": "script"},
+    },
+]
+
+# Rules that oxlint implements for JavaScript and TypeScript files. "name" is
+# the oxlint rule when it differs, "options" lists the option strings and
+# object keys oxlint accepts; a rule configured with anything else stays in
+# ESLint. oxlint does not see Svelte markup, so .svelte files keep ESLint.
+oxlint_rules = {
+    "array-callback-return": {"options": ["allowImplicit", "checkForEach"]},
+    "constructor-super": {},
+    "default-case-last": {},
+    "eqeqeq": {"options": ["always", "smart", "null"]},
+    "for-direction": {},
+    "getter-return": {},
+    "no-alert": {},
+    "no-async-promise-executor": {},
+    "no-await-in-loop": {},
+    "no-caller": {},
+    "no-case-declarations": {},
+    "no-class-assign": {},
+    "no-compare-neg-zero": {},
+    "no-cond-assign": {},
+    "no-const-assign": {},
+    "no-constant-binary-expression": {},
+    "no-constant-condition": {},
+    "no-constructor-return": {},
+    "no-control-regex": {},
+    "no-debugger": {},
+    "no-delete-var": {},
+    "no-dupe-else-if": {},
+    "no-dupe-keys": {},
+    "no-duplicate-case": {},
+    "no-duplicate-imports": {},
+    "no-else-return": {},
+    "no-empty": {},
+    "no-empty-character-class": {},
+    "no-empty-pattern": {},
+    "no-empty-static-block": {},
+    "no-eval": {},
+    "no-ex-assign": {},
+    "no-extend-native": {},
+    "no-extra-boolean-cast": {"options": ["enforceForLogicalOperands"]},
+    "no-fallthrough": {},
+    "no-func-assign": {},
+    "no-global-assign": {},
+    "no-import-assign": {},
+    "no-inner-declarations": {"options": ["functions", "both"]},
+    "no-invalid-regexp": {},
+    "no-irregular-whitespace": {"options": []},
+    "no-iterator": {},
+    "no-label-var": {},
+    "no-labels": {"options": ["allowLoop", "allowSwitch"]},
+    "no-lone-blocks": {},
+    "no-lonely-if": {},
+    "no-multi-assign": {},
+    "no-nested-ternary": {},
+    "no-new": {},
+    "no-new-func": {},
+    "no-new-native-nonconstructor": {},
+    "no-new-wrappers": {},
+    "no-nonoctal-decimal-escape": {},
+    "no-obj-calls": {},
+    "no-param-reassign": {},
+    "no-plusplus": {},
+    "no-proto": {},
+    "no-prototype-builtins": {},
+    "no-regex-spaces": {},
+    "no-return-assign": {},
+    "no-self-assign": {},
+    "no-self-compare": {},
+    "no-setter-return": {},
+    "no-shadow-restricted-names": {},
+    "no-sparse-arrays": {},
+    "no-this-before-super": {},
+    "no-undef": {"options": ["typeof"]},
+    "no-unexpected-multiline": {},
+    "no-unneeded-ternary": {"options": ["defaultAssignment"]},
+    "no-unreachable": {},
+    "no-unsafe-finally": {},
+    "no-unsafe-negation": {},
+    "no-unsafe-optional-chaining": {"options": ["disallowArithmeticOperators"]},
+    "no-unused-labels": {},
+    "no-unused-private-class-members": {},
+    "no-useless-call": {},
+    "no-useless-catch": {},
+    "no-useless-computed-key": {"options": []},
+    "no-useless-concat": {},
+    "no-useless-escape": {},
+    "no-useless-rename": {},
+    "no-var": {},
+    "no-void": {"options": ["allowAsStatement"]},
+    "no-with": {},
+    "operator-assignment": {},
+    "prefer-const": {},
+    "prefer-exponentiation-operator": {},
+    "prefer-numeric-literals": {},
+    "prefer-object-has-own": {},
+    "prefer-object-spread": {},
+    "prefer-promise-reject-errors": {},
+    "prefer-rest-params": {},
+    "prefer-spread": {},
+    "radix": {},
+    "require-yield": {},
+    "sort-imports": {},
+    "symbol-description": {},
+    "unicode-bom": {},
+    "use-isnan": {"options": ["enforceForIndexOf", "enforceForSwitchCase"]},
+    "valid-typeof": {"options": ["requireStringLiterals"]},
+    "yoda": {},
+    "@typescript-eslint/adjacent-overload-signatures": {"name": "typescript/adjacent-overload-signatures"},
+    "@typescript-eslint/no-empty-interface": {"name": "typescript/no-empty-interface"},
+    "@typescript-eslint/no-explicit-any": {"name": "typescript/no-explicit-any"},
+    "@typescript-eslint/no-extra-non-null-assertion": {"name": "typescript/no-extra-non-null-assertion"},
+    "@typescript-eslint/no-misused-new": {"name": "typescript/no-misused-new"},
+    "@typescript-eslint/no-namespace": {"name": "typescript/no-namespace"},
+    "@typescript-eslint/no-non-null-asserted-nullish-coalescing": {"name": "typescript/no-non-null-asserted-nullish-coalescing"},
+    "@typescript-eslint/no-non-null-asserted-optional-chain": {"name": "typescript/no-non-null-asserted-optional-chain"},
+    "@typescript-eslint/no-non-null-assertion": {"name": "typescript/no-non-null-assertion"},
+    "@typescript-eslint/no-this-alias": {"name": "typescript/no-this-alias"},
+    "@typescript-eslint/no-unnecessary-type-constraint": {"name": "typescript/no-unnecessary-type-constraint"},
+    "@typescript-eslint/no-unsafe-declaration-merging": {"name": "typescript/no-unsafe-declaration-merging"},
+    "@typescript-eslint/no-var-requires": {"name": "typescript/no-var-requires"},
+    "@typescript-eslint/prefer-as-const": {"name": "typescript/prefer-as-const"},
+    "@typescript-eslint/prefer-enum-initializers": {"name": "typescript/prefer-enum-initializers"},
+    "@typescript-eslint/prefer-function-type": {"name": "typescript/prefer-function-type"},
+    "@typescript-eslint/prefer-namespace-keyword": {"name": "typescript/prefer-namespace-keyword"},
+    "@typescript-eslint/prefer-ts-expect-error": {"name": "typescript/prefer-ts-expect-error"},
+}
+
+oxlint_file_patterns = ["*.js", "*.mjs", "*.cjs", "*.jsx", "*.ts", "*.mts", "*.cts", "*.tsx"]
+
+@cache
+def get_rule_registry():
+    load_registered_sources()
+    return RuleRegistry(rule_sources)
 
 
 def prefix_rules(rule_dict, prefix):
@@ -1459,127 +1925,716 @@ def get_rules_prefixed(source_names):
     return rules
 
 
+def rule_severity(value):
+    severity = value[0] if isinstance(value, list) else value
+    return {0: "off", 1: "warn", 2: "error"}.get(severity, severity)
+
+
+def options_match(value, expected_options):
+    options = value[1:] if isinstance(value, list) else []
+    if len(options) < len(expected_options):
+        return False
+    for option, expected in zip(options, expected_options):
+        if expected is None:
+            continue
+        if isinstance(expected, dict):
+            if not isinstance(option, dict) or any(
+                option.get(key) != expected_value for key, expected_value in expected.items()
+            ):
+                return False
+        elif option != expected:
+            return False
+    return True
+
+
+def find_conflicting_fixers(rules):
+    conflicts = []
+    for conflict in conflicting_fixers:
+        if all(
+            rule_severity(rules.get(rule, "off")) != "off" and options_match(rules[rule], expected_options)
+            for rule, expected_options in conflict["rules"].items()
+        ) and not any(
+            rule in rules and options_match(rules[rule], expected_options)
+            for rule, expected_options in conflict.get("unless", {}).items()
+        ):
+            conflicts.append(conflict)
+    return conflicts
+
+
 def run_checks():
-    errors = False
-    error_messages = ["Some errors were found:"]
-
-    # Initialize with all rules, assert to be empty after loops
-    extraneous_rules = set(get_rules_prefixed(rule_sources))
-
-    missing_rules = set()
-    duplicate_rules_in_from_js = set()
-
-    for source_name, source in rule_sources.items():
-        # Check that rules are sorted.
-        if list(source["rules"]) != sorted(source["rules"]):
-            errors = True
-            error_messages.append(f"- Rules in '{source_name}' are not sorted correctly")
-
-        # Check that all rules are specified.
-        for rule_name in source["from_js"]:
-            rule_name_prefixed = prefix_name(rule_name, source["prefix"])
-            try:
-                extraneous_rules.remove(rule_name_prefixed)
-            except KeyError:
-                if rule_name not in source["rules"]:
-                    missing_rules.add(rule_name_prefixed)
-                else:
-                    duplicate_rules_in_from_js.add(rule_name_prefixed)
-
-    if missing_rules:
-        errors = True
-        missing_rules_list = "\n".join(f"  - {rule}" for rule in missing_rules)
-        error_messages.append(f"- Some rules are missing:\n{missing_rules_list}")
-
-    if duplicate_rules_in_from_js:
-        errors = True
-        duplicate_rules_list = "\n".join(f"  - {rule}" for rule in duplicate_rules_in_from_js)
-        error_messages.append(f"- Some rules are duplicated in `from_js`:\n{duplicate_rules_list}")
-
-    if extraneous_rules:
-        errors = True
-
-        all_deprecated_rules_prefixed = set()
-        for source in rule_sources.values():
-            all_deprecated_rules_prefixed |= {
-                prefix_name(name, source["prefix"]) for name in source["from_js_deprecated"]
-            }
-
-        deprecated_rules = set()
-        other_extraneous_rules = set()
-        for rule_name in extraneous_rules:
-            if rule_name in all_deprecated_rules_prefixed:
-                deprecated_rules.add(rule_name)
-            else:
-                other_extraneous_rules.add(rule_name)
-
-        if deprecated_rules:
-            deprecated_rules_list = "\n".join(f" - {rule}" for rule in deprecated_rules)
-            error_messages.append(f"- Some deprecated rules were used:\n{deprecated_rules_list}")
-
-        if other_extraneous_rules:
-            extraneous_rules_list = "\n".join(f"  - {rule}" for rule in other_extraneous_rules)
-            error_messages.append(f"- Some rules were not found in any sources:\n{extraneous_rules_list}")
-
-    if errors:
-        print("\n\n".join(error_messages), file=sys.stderr)
+    error_messages = get_rule_registry().validate()
+
+    conflicts = find_conflicting_fixers(get_rule_registry().rules)
+    if conflicts:
+        conflicts_list = "\n".join(
+            f"  - {' + '.join(conflict['rules'])}: {conflict['reason']}" for conflict in conflicts
+        )
+        error_messages.append(f"- Some rules have conflicting fixes:\n{conflicts_list}")
+
+    if error_messages:
+        print("\n\n".join(["Some errors were found:", *error_messages]), file=sys.stderr)
         sys.exit(1)
 
 
-if __name__ == "__main__":
-    configs = {
-        "svelte": {
-            "rule_sources": ["eslint", "svelte", "typescript-eslint"],
-            "eslint_base": {
-                "overrides": [
-                    {
-                        "files": ["*.svelte"],
-                        "parser": "svelte-eslint-parser",
-                        "parserOptions": {"parser": "@typescript-eslint/parser"},
-                        "rules": {
-                            "no-inner-declarations": "off",
-                            "no-trailing-spaces": "off",
-                            "@typescript-eslint/indent": "off",
-                        },
+def run_checks_once():
+    # For entry points, before anything reads rule_sources or configs. The
+    # checks run when the compiled rule database (rule_db.py) is out of date
+    # with this file, and are skipped otherwise.
+    try:
+        load_registered_sources()
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        sys.exit(1)
+    rule_db.compile_if_stale(sys.modules[__name__])
+
+
+configs = {
+    "svelte": {
+        "rule_sources": ["eslint", "svelte", "typescript-eslint"],
+        "extensions": [".js", ".ts", ".svelte"],
+        "eslint_base": {
+            "overrides": [
+                {
+                    "files": ["*.svelte"],
+                    "parser": "svelte-eslint-parser",
+                    "parserOptions": {"parser": "@typescript-eslint/parser"},
+                    "rules": {
+                        "no-inner-declarations": "off",
+                        "no-trailing-spaces": "off",
+                        "@typescript-eslint/indent": "off",
                     },
-                ],
-                "parser": "@typescript-eslint/parser",
-                "parserOptions": {
-                    "extraFileExtensions": [".svelte"],
-                    "project": "tsconfig.json",
                 },
-                "root": True,
+            ],
+            "parser": "@typescript-eslint/parser",
+            "parserOptions": {
+                "extraFileExtensions": [".svelte"],
+                "project": "tsconfig.json",
             },
+            "root": True,
         },
-        "typescript-node": {
-            "rule_sources": ["eslint", "typescript-eslint"],
-            "eslint_base": {
-                "env": {"node": True},
-                "overrides": [
-                    {"files": ["*.ts"]},
-                ],
-                "parser": "@typescript-eslint/parser",
-                "parserOptions": {
-                    "project": "tsconfig.json",
-                },
-                "plugins": ["@typescript-eslint"],
-                "root": True,
+    },
+    "typescript-node": {
+        "rule_sources": ["eslint", "typescript-eslint"],
+        "extensions": [".js", ".ts"],
+        "eslint_base": {
+            "env": {"node": True},
+            "overrides": [
+                {"files": ["*.ts"]},
+            ],
+            "parser": "@typescript-eslint/parser",
+            "parserOptions": {
+                "project": "tsconfig.json",
             },
+            "plugins": ["@typescript-eslint"],
+            "root": True,
         },
+    },
+}
+
+
+# Variants of every config. Only rules at the given severities are kept, the
+# others are left out, which ESLint treats as off.
+config_profiles = {
+    "errors-only": {"severities": ["error"]},
+}
+
+
+# The composed rules are shared by every config built from the same sources,
+# so they are read-only and the functions that derive configs return new
+# dicts instead of modifying config["rules"].
+@cache
+def composed_rules(source_names, profile=None):
+    rules = get_rules_prefixed(source_names)
+    if profile is not None:
+        severities = config_profiles[profile]["severities"]
+        rules = {rule: value for rule, value in rules.items() if rule_severity(value) in severities}
+    return MappingProxyType(rules)
+
+
+# Plugin sources registered by onboard_source.py, one JSON file each in
+# sources/, named after the source. They are added to the configs they list.
+registered_sources_dir = Path(__file__).resolve().parent / "sources"
+
+
+registered_source_keys = ["package", "parser", "prefix", "rules", "updated", "version", "from_js", "from_js_deprecated", "configs"]
+
+
+def registered_source_errors(name, source, known):
+    if not isinstance(source, dict):
+        return ["not a JSON object"]
+    errors = [f"missing '{key}'" for key in registered_source_keys if key not in source]
+    if name in known:
+        errors.append(f"'{name}' is already a rule source")
+    errors += [f"unknown config '{config_name}'" for config_name in source.get("configs", []) if config_name not in configs]
+    errors += [
+        f"prefix '{source['prefix']}' is already used by '{source_name}'"
+        for source_name, other in known.items()
+        if "prefix" in source and other["prefix"] == source["prefix"]
+    ]
+    return errors
+
+
+@cache
+def load_registered_sources():
+    # Called on first use instead of at import, so that importing this module
+    # never fails or changes configs. Raises ValueError for an invalid file,
+    # before any source is added.
+    known = dict(rule_sources)
+    registered = {}
+    for path in sorted(registered_sources_dir.glob("*.json")):
+        try:
+            source = json.loads(path.read_text())
+        except ValueError as error:
+            raise ValueError(f"Cannot read rule source {path}: {error}") from error
+        errors = registered_source_errors(path.stem, source, known)
+        if errors:
+            raise ValueError(f"Invalid rule source {path}: {'; '.join(errors)}")
+        known[path.stem] = registered[path.stem] = source
+    for name, source in registered.items():
+        rule_sources[name] = source
+        for config_name in source["configs"]:
+            base = configs[config_name]["eslint_base"]
+            configs[config_name]["rule_sources"].append(name)
+            if source["prefix"] not in base.get("plugins", []):
+                base["plugins"] = base.get("plugins", []) + [source["prefix"]]
+
+
+def make_config(config_name, profile=None):
+    # A new top-level dict and overrides list; the rules are the read-only
+    # composed_rules mapping. Serialize with json_default.
+    load_registered_sources()
+    config = configs[config_name]
+    base = config["eslint_base"]
+    fresh = {"overrides": list(base["overrides"])} if "overrides" in base else {}
+    return base | fresh | {"rules": composed_rules(tuple(config["rule_sources"]), profile)}
+
+
+def json_default(value):
+    # For json.dump(s)(config, default=json_default): rules that no pass
+    # changed are still the read-only composed_rules mapping.
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def add_overrides(config, overrides):
+    return config | {"overrides": config.get("overrides", []) + overrides}
+
+
+glob_characters = re.compile(r"([\\\[\]{}()*?!+@])")
+
+
+def escape_glob(path):
+    # Override "files" are minimatch patterns; a literal path such as
+    # src/routes/[slug]/+page.svelte must only match itself.
+    return glob_characters.sub(r"\\\1", path)
+
+
+def add_watchdog_overrides(config, watchdog):
+    # watchdog is the output of rule_watchdog.py: {"files": {path: {rule: ms}}}
+    report = []
+    paths_by_rules = defaultdict(list)
+    for path, rules in sorted(watchdog["files"].items()):
+        rules = {rule: duration for rule, duration in rules.items() if rule in config["rules"]}
+        if not rules:
+            continue
+        paths_by_rules[tuple(sorted(rules))].append(escape_glob(path))
+        report += [f"  - {path}: {rule} ({duration:.0f} ms)" for rule, duration in sorted(rules.items())]
+
+    overrides = [
+        {"files": paths, "rules": {rule: "off" for rule in rules}}
+        for rules, paths in paths_by_rules.items()
+    ]
+    return add_overrides(config, overrides), report
+
+
+def read_json_with_comments(path):
+    # tsconfig.json allows comments and trailing commas.
+    string = r'"(?:\\.|[^"\\])*"'
+    text = Path(path).read_text()
+    text = re.sub(rf"({string})|//[^\n]*|/\*.*?\*/", lambda m: m.group(1) or "", text, flags=re.S)
+    text = re.sub(rf"({string})|,(\s*[}}\]])", lambda m: m.group(1) or m.group(2), text)
+    return json.loads(text)
+
+
+def resolve_tsconfig_extends(name, tsconfig_dir):
+    if name.startswith(".") or Path(name).is_absolute():
+        path = tsconfig_dir / name
+        return path if path.suffix == ".json" else path.with_name(f"{path.name}.json")
+    for directory in (tsconfig_dir, *tsconfig_dir.parents):
+        path = directory / "node_modules" / name
+        for candidate in (path, path / "tsconfig.json", path.with_name(f"{path.name}.json")):
+            if candidate.is_file():
+                return candidate
+    raise FileNotFoundError(f"Cannot resolve tsconfig '{name}' from {tsconfig_dir}")
+
+
+def read_compiler_options(tsconfig_path):
+    tsconfig_path = Path(tsconfig_path).resolve()
+    tsconfig = read_json_with_comments(tsconfig_path)
+    extends = tsconfig.get("extends", [])
+    compiler_options = {}
+    for name in [extends] if isinstance(extends, str) else extends:
+        compiler_options |= read_compiler_options(resolve_tsconfig_extends(name, tsconfig_path.parent))
+    return compiler_options | tsconfig.get("compilerOptions", {})
+
+
+def add_tsc_overrides(config, compiler_options):
+    if compiler_options.get("strict"):
+        compiler_options = {name: True for name in strict_compiler_options} | compiler_options
+
+    rules = {}
+    report = []
+    for rule, check in tsc_checked_rules.items():
+        value = config["rules"].get(rule, "off")
+        if rule_severity(value) == "off":
+            continue
+        missing = [
+            f"{name}: {json.dumps(expected)}"
+            for name, expected in check.get("compiler_options", {}).items()
+            if compiler_options.get(name) != expected
+        ]
+        if missing:
+            report.append(f"  - {rule}: kept, needs {', '.join(missing)}")
+            continue
+        rule_options = value[1] if isinstance(value, list) and len(value) > 1 else {}
+        uncovered = [
+            option for option in check.get("uncovered_options", [])
+            if isinstance(rule_options, dict) and rule_options.get(option)
+        ]
+        if uncovered:
+            report.append(f"  - {rule}: kept, tsc does not check {', '.join(uncovered)}")
+            continue
+        rules[rule] = "off"
+        report.append(f"  - {rule}: off, checked by tsc {check['reason']}")
+
+    if not rules:
+        return config, report
+    return add_overrides(config, [{"files": ts_file_patterns, "rules": rules}]), report
+
+
+def base_rule_value(rule_name, value):
+    if not isinstance(value, list):
+        return value
+    ts_only = ts_only_rule_options.get(rule_name, [])
+    return [
+        {key: option for key, option in item.items() if key not in ts_only}
+        if isinstance(item, dict) else item
+        for item in value
+    ]
+
+
+def javascript_rules(rules):
+    # Without the TypeScript parser the @typescript-eslint rules cannot run.
+    # Extension rules are replaced by their base ESLint rule so that plain
+    # JavaScript keeps the same checks. Returns the rule changes and the base
+    # rules used instead.
+    ts_prefix = rule_sources["typescript-eslint"]["prefix"]
+    changes = {}
+    replaced = []
+    for rule, value in rules.items():
+        if not rule.startswith(f"{ts_prefix}/") or rule_severity(value) == "off":
+            continue
+        changes[rule] = "off"
+        base_rule = get_rule_registry().extensions.get(rule)
+        if base_rule and rule_severity(rules.get(base_rule, "off")) == "off":
+            changes[base_rule] = base_rule_value(base_rule, value)
+            replaced.append(base_rule)
+    return changes, replaced
+
+
+def add_parser_overrides(config):
+    rules, replaced = javascript_rules(config["rules"])
+    overrides = [dict(js_parser_overrides[0], rules=rules), *js_parser_overrides[1:]]
+    report = [
+        f"  - {', '.join(override['files'])}: parser {override['parser']}"
+        for override in overrides if "parser" in override
+    ]
+    report.append(f"  - {len(rules) - len(replaced)} @typescript-eslint rules off for JavaScript files")
+    report.append(f"  - base rules used instead: {', '.join(replaced)}")
+    return add_overrides(config, overrides), report
+
+
+def add_svelte_component_overrides(config, components):
+    # components maps paths to the kind of script they contain, see
+    # corpus_scan.scan_svelte_components(). Only TypeScript components keep the
+    # TypeScript parser and type information.
+    svelte_overrides = [override for override in config.get("overrides", []) if "*.svelte" in override["files"]]
+    if not svelte_overrides:
+        return config, ["  - the config has no *.svelte override, nothing to do"]
+
+    svelte_rules = config["rules"]
+    for override in svelte_overrides:
+        svelte_rules = svelte_rules | override.get("rules", {})
+    rules, _ = javascript_rules(svelte_rules)
+    plain = sorted(escape_glob(name) for name, kind in components.items() if kind != "ts")
+    counts = {kind: list(components.values()).count(kind) for kind in ("ts", "js", "none")}
+    report = [
+        f"  - {counts['ts']} TypeScript, {counts['js']} JavaScript and {counts['none']} markup-only components",
+    ]
+    if not plain:
+        return config, report
+    override = {"files": plain, "parserOptions": {"parser": "espree"}, "rules": rules}
+    if uses_project(config):
+        override["parserOptions"]["project"] = None
+    report.append(f"  - {len(plain)} components parsed with espree and without a program, {len(rules)} rules changed")
+    return add_overrides(config, [override]), report
+
+
+def turn_off_rules(config, rules):
+    # Rules are turned off in overrides as well, which may turn them back on.
+    off = {rule: "off" for rule in rules}
+    overrides = [
+        override | {"rules": override["rules"] | {rule: "off" for rule in override["rules"] if rule in off}}
+        if "rules" in override else override
+        for override in config.get("overrides", [])
+    ]
+    return config | {"rules": config["rules"] | off, "overrides": overrides}
+
+
+def remove_unused_syntax_rules(config, families):
+    # A rule listed in several families is kept if any of them is used.
+    used = {rule for family in families for rule in syntax_family_rules.get(family, [])}
+    rules = []
+    report = []
+    for family, family_rules in syntax_family_rules.items():
+        if family in families:
+            continue
+        enabled = [
+            rule for rule in family_rules
+            if rule not in used and rule not in rules and rule_severity(config["rules"].get(rule, "off")) != "off"
+        ]
+        if enabled:
+            rules += enabled
+            report.append(f"  - no {family}: {', '.join(enabled)}")
+    return turn_off_rules(config, rules), report
+
+
+def turn_off_svelte_check_rules(config):
+    rules = {}
+    report = []
+    for rule, compiler_rule in svelte_compiler_rules.items():
+        if rule_severity(config["rules"].get(rule, "off")) == "off":
+            continue
+        if "svelte_check" in compiler_rule:
+            rules[rule] = "off"
+            report.append(f"  - {rule}: off, {compiler_rule['svelte_check']}")
+        else:
+            report.append(f"  - {rule}: kept, not covered by svelte-check ({compiler_rule['compile_cost']})")
+    return config | {"rules": config["rules"] | rules}, report
+
+
+def read_path_classes(path):
+    # Classes from the file replace the built-in ones of the same name, null
+    # removes a built-in class.
+    classes = dict(path_classes)
+    if path:
+        with open(path) as f:
+            classes |= json.load(f)
+    classes = {name: path_class for name, path_class in classes.items() if path_class}
+    for name, path_class in classes.items():
+        if path_class["profile"] not in path_profiles:
+            print(f"Unknown profile '{path_class['profile']}' for path class '{name}'", file=sys.stderr)
+            sys.exit(1)
+    return classes
+
+
+def uses_project(config):
+    return any(
+        section.get("parserOptions", {}).get("project")
+        for section in (config, *config.get("overrides", []))
+    )
+
+
+def add_path_class_overrides(config, classes):
+    overrides = []
+    report = []
+    enabled = [rule for rule, value in config["rules"].items() if rule_severity(value) != "off"]
+    ignored = []
+    for name, path_class in classes.items():
+        profile = path_profiles[path_class["profile"]]
+        if profile.get("ignore"):
+            ignored += [pattern for pattern in path_class["files"] if pattern not in ignored]
+            report.append(f"  - {name} ({', '.join(path_class['files'])}): {path_class['profile']}, ignored")
+            continue
+        rules = {
+            rule: "off" for rule in enabled
+            if any(fnmatchcase(rule, pattern) for pattern in profile["rules"])
+            or (profile.get("type_aware") and rule in type_aware_rules)
+        }
+        override = {"files": path_class["files"], "rules": rules}
+        details = f"{len(rules)} rules off"
+        if profile.get("type_aware") and uses_project(config):
+            # Without type-aware rules the files need no TypeScript program.
+            override["parserOptions"] = {"project": None}
+            details += ", parsed without a program"
+        overrides.append(override)
+        report.append(f"  - {name} ({', '.join(path_class['files'])}): {path_class['profile']}, {details}")
+    if ignored:
+        config = config | {"ignorePatterns": config.get("ignorePatterns", []) + ignored}
+    return add_overrides(config, overrides) if overrides else config, report
+
+
+def check_option_costs(config, option_costs, min_ratio=2):
+    # option_costs is written by `benchmark.py options`. Variants that gave
+    # the same findings on the benchmarked code count as equivalent.
+    report = []
+    for rule, costs in option_costs.items():
+        value = config["rules"].get(rule, "off")
+        if rule_severity(value) == "off":
+            continue
+        configured = json.dumps(value[1:] if isinstance(value, list) else [], sort_keys=True)
+        chosen = costs["variants"].get(configured)
+        if chosen is None:
+            report.append(f"  - {rule}: options {configured} were not measured")
+            continue
+        equivalent = [
+            (variant["ms_per_file"], options) for options, variant in costs["variants"].items()
+            if options != configured and variant["findings_hash"] == chosen["findings_hash"]
+        ]
+        if not equivalent:
+            continue
+        cheapest_ms, cheapest_options = min(equivalent)
+        if chosen["ms_per_file"] > min_ratio * cheapest_ms:
+            report.append(
+                f"  - {rule}: {configured} costs {chosen['ms_per_file']:.3f} ms/file,"
+                f" {cheapest_options} finds the same for {cheapest_ms:.3f} ms/file"
+            )
+    return config, report
+
+
+def unsupported_options(value, supported):
+    unsupported = []
+    for option in value[1:] if isinstance(value, list) else []:
+        if isinstance(option, dict):
+            unsupported += [key for key in option if key not in supported]
+        elif not isinstance(option, str) or option not in supported:
+            unsupported.append(json.dumps(option))
+    return unsupported
+
+
+def oxlint_overrides(config, rule):
+    # The ESLint overrides that change a rule, as oxlint overrides. None if
+    # oxlint cannot repeat them: an override that configures the rule
+    # differently or has excludedFiles, which oxlint does not support.
+    overrides = []
+    for override in config.get("overrides", []):
+        value = override.get("rules", {}).get(rule)
+        if value is None or value == config["rules"][rule]:
+            continue
+        if rule_severity(value) != "off" or "excludedFiles" in override:
+            return None
+        overrides.append(override["files"])
+    return overrides
+
+
+def offload_to_oxlint(config):
+    # Returns the ESLint config with the offloaded rules off for the files
+    # oxlint lints, the oxlint config, and the report. Overrides that turn an
+    # offloaded rule off for some files are repeated in the oxlint config.
+    oxlint_config_rules = {}
+    oxlint_config_overrides = []
+    off = {}
+    report = []
+    for rule, value in config["rules"].items():
+        native = oxlint_rules.get(rule)
+        if native is None or rule_severity(value) == "off":
+            continue
+        unsupported = unsupported_options(value, native.get("options", []))
+        if unsupported:
+            report.append(f"  - {rule}: kept in ESLint, oxlint does not support {', '.join(unsupported)}")
+            continue
+        overrides = oxlint_overrides(config, rule)
+        if overrides is None:
+            report.append(f"  - {rule}: kept in ESLint, an override configures it differently")
+            continue
+        name = native.get("name", rule)
+        options = value[1:] if isinstance(value, list) else []
+        severity = rule_severity(value)
+        oxlint_config_rules[name] = [severity, *options] if options else severity
+        for files in overrides:
+            # Rules turned off for the same files share an override.
+            existing = next((override for override in oxlint_config_overrides if override["files"] == files), None)
+            if existing is None:
+                existing = {"files": files, "rules": {}}
+                oxlint_config_overrides.append(existing)
+            existing["rules"][name] = "off"
+        off[rule] = "off"
+
+    oxlint_config = {
+        "categories": {"correctness": "off"},
+        "plugins": ["typescript"] if any(name.startswith("typescript/") for name in oxlint_config_rules) else [],
+        "ignorePatterns": ["**/*.svelte", *config.get("ignorePatterns", [])],
+        "rules": oxlint_config_rules,
     }
+    if oxlint_config_overrides:
+        oxlint_config["overrides"] = oxlint_config_overrides
+    report.insert(0, f"  - {len(off)} rules run by oxlint for {', '.join(oxlint_file_patterns)}")
+    config = add_overrides(config, [{"files": oxlint_file_patterns, "rules": off}]) if off else config
+    return config, oxlint_config, report
 
-    try:
-        config = configs[sys.argv[1]]
-    except (IndexError, KeyError):
-        config_names = " | ".join(configs)
-        print(f"Usage: {sys.argv[0]} {{ {config_names} }}", file=sys.stderr)
-        sys.exit(1)
 
-    run_checks()
+def print_report(title, report):
+    if report:
+        print(f"{title}:\n" + "\n".join(report), file=sys.stderr)
+
+
+def add_generator_arguments(parser):
+    parser.add_argument("config", choices=configs)
+    parser.add_argument(
+        "--profile",
+        choices=config_profiles,
+        help="keep only the rules of this profile",
+    )
+    parser.add_argument(
+        "--watchdog",
+        metavar="FILE",
+        help="turn off rules for the files flagged by rule_watchdog.py",
+    )
+    parser.add_argument(
+        "--tsconfig",
+        metavar="FILE",
+        help="turn off rules in .ts files that tsc enforces with this tsconfig's compilerOptions",
+    )
+    parser.add_argument(
+        "--svelte-check",
+        action="store_true",
+        help="svelte-check runs in the pipeline, turn off rules that repeat its compile",
+    )
+    parser.add_argument(
+        "--parser-overrides",
+        action="store_true",
+        help="parse plain JavaScript files with espree instead of the TypeScript parser",
+    )
+    parser.add_argument(
+        "--svelte-components",
+        metavar="REPO",
+        help="parse the Svelte components in this repository that have no TypeScript script without type information",
+    )
+    parser.add_argument(
+        "--path-classes",
+        nargs="?",
+        const="",
+        metavar="FILE",
+        help="reduced rules for tests, stories, declarations and generated code;"
+        " FILE adds or replaces path classes, see path_classes",
+    )
+    parser.add_argument(
+        "--oxlint",
+        metavar="FILE",
+        help="write an oxlint config for the rules it implements to FILE and turn them off in ESLint",
+    )
+    parser.add_argument(
+        "--option-costs",
+        metavar="FILE",
+        help="warn about rule options that cost more than an equivalent, measured by `benchmark.py options`",
+    )
+    parser.add_argument(
+        "--prune-unused-syntax",
+        metavar="REPO",
+        help="turn off rules for syntax that the code in this repository never uses",
+    )
+
 
-    print(
-        json.dumps(
-            config["eslint_base"] | {"rules": get_rules_prefixed(config["rule_sources"])},
-            indent=4
+def build_config_with_reports(
+    config_name,
+    profile=None,
+    overrides=(),
+    watchdog=None,
+    tsconfig=None,
+    svelte_check=False,
+    parser_overrides=False,
+    prune_unused_syntax=None,
+    svelte_components=None,
+    path_classes=None,
+    option_costs=None,
+    oxlint=False,
+):
+    # Returns the config and the reports of each optimization, by title, or
+    # with oxlint the ESLint config, the oxlint config and the reports.
+    # watchdog and option_costs are the parsed JSON files, tsconfig,
+    # prune_unused_syntax and svelte_components are paths, path_classes is
+    # like the path_classes table, overrides are appended as given.
+    config = make_config(config_name, profile)
+    reports = {}
+    if watchdog:
+        config, reports["Rules turned off for slow files"] = add_watchdog_overrides(config, watchdog)
+    if tsconfig:
+        config, reports["Rules already enforced by tsc"] = add_tsc_overrides(
+            config, read_compiler_options(tsconfig)
+        )
+    if parser_overrides:
+        config, reports["Parsers per file type"] = add_parser_overrides(config)
+    if svelte_check:
+        config, reports["Rules covered by svelte-check"] = turn_off_svelte_check_rules(config)
+    if prune_unused_syntax:
+        families = corpus_scan.scan_repository(prune_unused_syntax)
+        config, reports["Rules for syntax that is never used"] = remove_unused_syntax_rules(config, families)
+    if svelte_components:
+        config, reports["Svelte components by script language"] = add_svelte_component_overrides(
+            config, corpus_scan.scan_svelte_components(svelte_components)
         )
+    if path_classes:
+        # After the other overrides, so that none of them turns the rules back on.
+        config, reports["Reduced rules by path"] = add_path_class_overrides(config, path_classes)
+    if overrides:
+        config = add_overrides(config, list(overrides))
+    if option_costs:
+        config, reports["Rule options costlier than an equivalent"] = check_option_costs(config, option_costs)
+    if oxlint:
+        # Last, so that no later override turns the offloaded rules back on.
+        config, oxlint_config, reports["Rules offloaded to oxlint"] = offload_to_oxlint(config)
+        return config, oxlint_config, reports
+    return config, reports
+
+
+def build_config(config_name, profile=None, overrides=(), **options):
+    # In-process entry point, for example:
+    #   build_config("svelte", profile="errors-only", parser_overrides=True)
+    # With oxlint=True, returns the ESLint config and the oxlint config.
+    result = build_config_with_reports(config_name, profile, overrides, **options)
+    return result[:-1] if options.get("oxlint") else result[0]
+
+
+def make_config_from_args(args):
+    watchdog = None
+    if args.watchdog:
+        with open(args.watchdog) as f:
+            watchdog = json.load(f)
+    option_costs = None
+    if args.option_costs:
+        with open(args.option_costs) as f:
+            option_costs = json.load(f)
+    result = build_config_with_reports(
+        args.config,
+        profile=args.profile,
+        watchdog=watchdog,
+        tsconfig=args.tsconfig,
+        svelte_check=args.svelte_check,
+        parser_overrides=args.parser_overrides,
+        prune_unused_syntax=args.prune_unused_syntax,
+        svelte_components=args.svelte_components,
+        path_classes=read_path_classes(args.path_classes) if args.path_classes is not None else None,
+        option_costs=option_costs,
+        oxlint=bool(args.oxlint),
     )
+    if not args.oxlint:
+        return result
+    config, oxlint_config, reports = result
+    with open(args.oxlint, "w") as f:
+        f.write(json.dumps(oxlint_config, indent=4) + "\n")
+    return config, reports
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    add_generator_arguments(parser)
+    args = parser.parse_args()
+
+    run_checks_once()
+
+    config, reports = make_config_from_args(args)
+    for title, report in reports.items():
+        print_report(title, report)
+
+    print(json.dumps(config, indent=4, default=json_default))
@@ -0,0 +1,333 @@
+#!/usr/bin/env python
+
+# Record the heap during a lint run with a generated config, to find out what
+# makes type-aware linting run out of memory.
+#
+#   memory_profile.py run CONFIG --cwd REPO [--gc] [--snapshot-mb 1024 2048]
+#       Lint and summarize the heap; accepts the make_eslintrc.py options and
+#       writes summary.json into --out.
+#
+#   memory_profile.py analyze SNAPSHOT...
+#       Summarize existing .heapsnapshot files by package.
+#
+# The heap is sampled after every file (see "memory" in lint-instrumented.js),
+# with the TypeScript programs created for parserOptions.project and the files
+# in each. The growth of the heap is attributed to the program each file was
+# linted with and to the config sections (base or override) that set the
+# file's parserOptions.project, to point at the tsconfig or override that causes
+# it. --gc collects garbage before every sample, slower but the deltas are then
+# retained memory instead of allocations. Heap snapshots written at --snapshot-mb
+# thresholds are summarized by package.
+
+import argparse
+import json
+import shutil
+import sys
+from array import array
+from collections import Counter, deque
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+from profile_cpu import node_modules_re
+
+
+def project_key(project):
+    if project is None:
+        return "(no project)"
+    return json.dumps(project) if not isinstance(project, str) else project
+
+
+def project_sections(config):
+    # The config sections that set parserOptions.project, by project value.
+    sections = {}
+    for index, section in enumerate((config, *config.get("overrides", []))):
+        parser_options = section.get("parserOptions", {})
+        if "project" not in parser_options:
+            continue
+        label = "base config" if index == 0 else f"overrides[{index - 1}] ({', '.join(section['files'])})"
+        sections.setdefault(project_key(parser_options["project"]), []).append(label)
+    return sections
+
+
+def attribute_growth(results, config):
+    memory = results["memory"]
+    programs = [
+        program | {"heap_growth_mb": 0, "linted_files": 0}
+        for program in memory["programs"]
+    ]
+    projects = {}
+    sections = project_sections(config)
+    for stats in results["files"].values():
+        delta = stats.get("heap_delta_mb", 0)
+        if stats.get("program") is not None and stats["program"] >= 0:
+            programs[stats["program"]]["heap_growth_mb"] += delta
+            programs[stats["program"]]["linted_files"] += 1
+        key = project_key(stats.get("project"))
+        project = projects.setdefault(key, {
+            "heap_growth_mb": 0,
+            "files": 0,
+            "sections": sections.get(key, ["(not set in the config)"]) if key != "(no project)" else [],
+        })
+        project["heap_growth_mb"] += delta
+        project["files"] += 1
+    for entry in (*programs, *projects.values()):
+        entry["heap_growth_mb"] = round(entry["heap_growth_mb"], 1)
+    return programs, projects
+
+
+def package_of(script_name):
+    if not script_name:
+        return "(native)"
+    if script_name.startswith("node:"):
+        return "(node)"
+    match = node_modules_re.match(script_name.removeprefix("file://"))
+    return match.group(1) if match else "(project)"
+
+
+def read_snapshot(path, chunk_size=1 << 24):
+    # Returns the meta, nodes, edges and strings of a .heapsnapshot. The nodes
+    # and edges, most of the file, are streamed into 32-bit arrays: as Python
+    # lists of ints they would take several times the size of the snapshots
+    # this tool takes at 1-2 GB of heap. V8 writes the sections in the order
+    # snapshot, nodes, edges, trace and sample arrays, strings.
+    with open(path) as f:
+        buffer = ""
+
+        def more():
+            nonlocal buffer
+            chunk = f.read(chunk_size)
+            if not chunk:
+                raise ValueError(f"{path} ends early, not a complete heap snapshot")
+            buffer += chunk
+
+        def skip_to(marker):
+            # Returns the text before the marker, which is consumed.
+            nonlocal buffer
+            while (index := buffer.find(marker)) < 0:
+                more()
+            text, buffer = buffer[:index], buffer[index + len(marker):]
+            return text
+
+        def read_numbers():
+            # The numbers up to the closing bracket of the array.
+            nonlocal buffer
+            numbers = array("I")
+            while (end := buffer.find("]")) < 0:
+                # Keep the number that may continue in the next chunk.
+                last = buffer.rfind(",")
+                numbers.extend(map(int, filter(str.strip, buffer[:max(last, 0)].split(","))))
+                buffer = buffer[last + 1:]
+                more()
+            numbers.extend(map(int, filter(str.strip, buffer[:end].split(","))))
+            buffer = buffer[end + 1:]
+            return numbers
+
+        header = skip_to('"nodes":[')
+        meta = json.loads(header.strip().removesuffix(",") + "}")["snapshot"]["meta"]
+        nodes = read_numbers()
+        skip_to('"edges":[')
+        edges = read_numbers()
+        skip_to('"strings":')
+        strings, _ = json.JSONDecoder().raw_decode((buffer + f.read()).lstrip())
+    return meta, nodes, edges, strings
+
+
+def summarize_snapshot(path, top):
+    # Each object is labelled with the package that defines its constructor.
+    # Objects without one (arrays, strings, plain objects such as ESTree nodes)
+    # take the label of the object retaining them on the shortest path from the
+    # roots, so memory is counted for the package that holds on to it.
+    meta, nodes, edges, strings = read_snapshot(path)
+    node_fields, edge_fields = meta["node_fields"], meta["edge_fields"]
+    node_types, edge_types = meta["node_types"][0], meta["edge_types"][0]
+    node_size, edge_size = len(node_fields), len(edge_fields)
+    type_field, name_field = node_fields.index("type"), node_fields.index("name")
+    self_size_field, edge_count_field = node_fields.index("self_size"), node_fields.index("edge_count")
+    edge_type_field, edge_name_field = edge_fields.index("type"), edge_fields.index("name_or_index")
+    to_node_field = edge_fields.index("to_node")
+    node_count = len(nodes) // node_size
+
+    first_edges = array("Q", bytes(8 * (node_count + 1)))
+    for ordinal in range(node_count):
+        first_edges[ordinal + 1] = first_edges[ordinal] + nodes[ordinal * node_size + edge_count_field] * edge_size
+
+    def node_type(ordinal):
+        return node_types[nodes[ordinal * node_size + type_field]]
+
+    def named_edge(ordinal, names):
+        for offset in range(first_edges[ordinal], first_edges[ordinal + 1], edge_size):
+            edge_type = edge_types[edges[offset + edge_type_field]]
+            if edge_type not in ("element", "hidden") and strings[edges[offset + edge_name_field]] in names:
+                return edges[offset + to_node_field] // node_size
+        return None
+
+    closure_packages = {}
+
+    def closure_package(ordinal):
+        if ordinal not in closure_packages:
+            shared = named_edge(ordinal, {"shared"})
+            script = named_edge(shared, {"script", "script_or_debug_info"}) if shared is not None else None
+            name = strings[nodes[script * node_size + name_field]] if script is not None else ""
+            closure_packages[ordinal] = package_of(name)
+        return closure_packages[ordinal]
+
+    map_packages = {}
+
+    def own_package(ordinal):
+        # The package of an object's constructor, None for plain objects and
+        # everything that is not an object.
+        if node_type(ordinal) == "closure":
+            return closure_package(ordinal)
+        if node_type(ordinal) != "object":
+            return None
+        object_map = named_edge(ordinal, {"map"})
+        if object_map is None:
+            return None
+        if object_map not in map_packages:
+            # Maps of objects that gained properties point back to the
+            # constructor's initial map.
+            constructor = None
+            current = object_map
+            while current is not None and constructor is None:
+                constructor = named_edge(current, {"constructor"})
+                current = named_edge(current, {"back_pointer"})
+            package = closure_package(constructor) if constructor is not None else None
+            map_packages[object_map] = package if package not in ("(native)", "(node)") else None
+        return map_packages[object_map]
+
+    labels = [None] * node_count
+    labels[0] = "(roots)"
+    queue = deque([0])
+    packages = Counter()
+    constructors = Counter()
+    while queue:
+        ordinal = queue.popleft()
+        size = nodes[ordinal * node_size + self_size_field]
+        packages[labels[ordinal]] += size
+        constructors[(node_type(ordinal), strings[nodes[ordinal * node_size + name_field]])] += size
+        for offset in range(first_edges[ordinal], first_edges[ordinal + 1], edge_size):
+            if edge_types[edges[offset + edge_type_field]] == "weak":
+                continue
+            child = edges[offset + to_node_field] // node_size
+            if labels[child] is None:
+                labels[child] = own_package(child) or labels[ordinal]
+                queue.append(child)
+
+    total = sum(nodes[ordinal * node_size + self_size_field] for ordinal in range(node_count))
+    return {
+        "total_mb": round(total / 1024 / 1024, 1),
+        "packages_mb": {package: round(size / 1024 / 1024, 1) for package, size in packages.most_common(top)},
+        "constructors_mb": {
+            f"{name} ({kind})": round(size / 1024 / 1024, 1) for (kind, name), size in constructors.most_common(top)
+        },
+    }
+
+
+def timeline(samples, rows):
+    step = max(len(samples) // rows, 1)
+    picked = samples[::step]
+    if picked[-1] is not samples[-1]:
+        picked.append(samples[-1])
+    return picked
+
+
+def make_summary(results, config, top):
+    memory = results["memory"]
+    programs, projects = attribute_growth(results, config)
+    limit_mb = memory["heap_statistics"]["heap_size_limit"] / 1024 / 1024
+    return {
+        "peak_heap_mb": memory["peak_heap_mb"],
+        "heap_limit_mb": round(limit_mb, 1),
+        "files": len(results["files"]),
+        "programs": sorted(programs, key=lambda program: -program["heap_growth_mb"]),
+        "projects": dict(sorted(projects.items(), key=lambda item: -item[1]["heap_growth_mb"])),
+        "files_by_growth": dict(sorted(
+            ((path, stats.get("heap_delta_mb", 0)) for path, stats in results["files"].items()),
+            key=lambda item: -item[1],
+        )[:top]),
+        "samples": memory["samples"],
+        "snapshots": memory["snapshots"],
+    }
+
+
+def format_summary(summary, rows):
+    lines = [
+        f"Peak heap {summary['peak_heap_mb']} MB of {summary['heap_limit_mb']} MB,"
+        f" {len(summary['programs'])} TypeScript programs for {summary['files']} files",
+        "",
+        "Heap over time:",
+        f"  {'ms':>8} {'heap MB':>9} {'RSS MB':>9} {'programs':>9} {'program files':>14}  file",
+    ]
+    for sample in timeline(summary["samples"], rows):
+        lines.append(
+            f"  {sample['t_ms']:>8} {sample['heap_used_mb']:>9} {sample['rss_mb']:>9}"
+            f" {sample['programs']:>9} {sample['program_files']:>14}  {sample['file'] or ''}"
+        )
+    lines += ["", "Programs by heap growth:"]
+    for program in summary["programs"]:
+        lines.append(
+            f"  {program['heap_growth_mb']:>9} MB  {program['tsconfig']}: {program['files']} files"
+            f" ({program['project_files']} outside node_modules and lib), linted {program['linted_files']},"
+            f" created at {program['created_at_ms'] / 1000:.1f} s by {program['created_by']}"
+        )
+    lines += ["", "parserOptions.project by heap growth:"]
+    for project, entry in summary["projects"].items():
+        sections = f", set by {'; '.join(entry['sections'])}" if entry["sections"] else ""
+        lines.append(f"  {entry['heap_growth_mb']:>9} MB  {project}: {entry['files']} files{sections}")
+    lines += ["", "Files by heap growth:"]
+    lines += [f"  {delta:>9} MB  {path}" for path, delta in summary["files_by_growth"].items()]
+    return "\n".join(lines)
+
+
+def format_snapshot(path, snapshot):
+    lines = [f"Heap snapshot {path}: {snapshot['total_mb']} MB", "  By package:"]
+    lines += [f"    {size:>9} MB  {package}" for package, size in snapshot["packages_mb"].items()]
+    lines.append("  By constructor:")
+    lines += [f"    {size:>9} MB  {name}" for name, size in snapshot["constructors_mb"].items()]
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Record heap usage and TypeScript programs during a lint run.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="lint and record the heap")
+    make_eslintrc.add_generator_arguments(run_parser)
+    run_parser.add_argument("patterns", nargs="*", default=["."])
+    run_parser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+    run_parser.add_argument("--out", type=Path, default=Path("memory-profile"), help="output directory")
+    run_parser.add_argument("--gc", action="store_true", help="collect garbage before every sample")
+    run_parser.add_argument("--snapshot-mb", type=int, nargs="+", default=[], help="write heap snapshots at these heap sizes")
+    run_parser.add_argument("--rows", type=int, default=30, help="samples to show in the timeline")
+
+    analyze_parser = subparsers.add_parser("analyze", help="summarize existing heap snapshots")
+    analyze_parser.add_argument("snapshots", nargs="+", metavar="SNAPSHOT", help=".heapsnapshot files")
+
+    for subparser in (run_parser, analyze_parser):
+        subparser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    if args.command == "analyze":
+        for path in args.snapshots:
+            print(format_snapshot(path, summarize_snapshot(path, args.top)))
+        sys.exit(0)
+
+    make_eslintrc.run_checks_once()
+    out = args.out.resolve()
+    shutil.rmtree(out / "snapshots", ignore_errors=True)
+    (out / "snapshots").mkdir(parents=True)
+    config, _ = make_eslintrc.make_config_from_args(args)
+    results = lint_runner.run_instrumented(args.cwd.resolve(), args.config, config, args.patterns, memory={
+        "gc": args.gc,
+        "snapshot_thresholds_mb": args.snapshot_mb,
+        "snapshot_dir": str(out / "snapshots"),
+    })
+
+    summary = make_summary(results, config, args.top)
+    print(format_summary(summary, args.rows))
+    for snapshot in summary["snapshots"]:
+        snapshot["summary"] = summarize_snapshot(snapshot["path"], args.top)
+        print(f"\nAt {snapshot['threshold_mb']} MB, after {snapshot['file']}:")
+        print(format_snapshot(snapshot["path"], snapshot["summary"]))
+    (out / "summary.json").write_text(json.dumps(summary, indent=4) + "\n")
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+# Register a new plugin as a rule source:
+#
+#   onboard_source.py NAME PACKAGE --prefix PREFIX --configs svelte --corpus DIR
+#
+# The plugin's rules and their metadata are read from the corpus's
+# node_modules, and the corpus (see benchmark.py corpus) is linted with every
+# rule of the plugin enabled to measure what each one costs per file. The
+# source is written to sources/NAME.json, which make_eslintrc.py loads into
+# rule_sources and adds to the listed configs. Rules the plugin recommends are
+# enabled as errors unless they cost more than --max-ms-per-file or fail on
+# the corpus, everything else is "off". Running it again refreshes the
+# metadata and costs and keeps the severities already in the file, except that
+# rules over the cost gate are turned off again.
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+from upgrade_report import rule_metadata
+
+
+def read_source(path):
+    return json.loads(path.read_text()) if path.exists() else None
+
+
+def plugin_rules(metadata, prefix):
+    rules = {}
+    for rule, rule_metadata in metadata["rules"].items():
+        plugin_prefix, _, name = rule.rpartition("/")
+        if plugin_prefix == prefix:
+            rules[name] = rule_metadata
+    return rules
+
+
+def benchmark_config(config_name, prefix, rule_names):
+    # The config without the plugin, plus the given rules of the plugin.
+    config = make_eslintrc.make_config(config_name)
+    plugins = config.get("plugins", [])
+    return config | {
+        "plugins": plugins if prefix in plugins else [*plugins, prefix],
+        "rules": config["rules"] | {make_eslintrc.prefix_name(name, prefix): "warn" for name in rule_names},
+    }
+
+
+def measure_rules(corpus, config_name, package, prefix, rule_names, patterns):
+    # Returns ms per file for each rule, None for the rules ESLint rejected.
+    sources = [make_eslintrc.rule_sources[name] for name in make_eslintrc.configs[config_name]["rule_sources"]]
+    plugins = {source["package"]: source["prefix"] for source in sources if source["prefix"]} | {package: prefix}
+
+    def run(names):
+        config = benchmark_config(config_name, prefix, names)
+        results = lint_runner.run_instrumented(corpus, config_name, config, patterns, check=False, plugins=plugins)
+        if results is None:
+            return None
+        files = max(len(results["files"]), 1)
+        return {
+            name: round(
+                sum(stats["rules"].get(make_eslintrc.prefix_name(name, prefix), 0) for stats in results["files"].values())
+                / files,
+                4,
+            )
+            for name in names
+        }
+
+    costs = run(rule_names)
+    if costs is not None:
+        return costs
+    # One rule broke the run, measure them separately to find it.
+    costs = {}
+    for name in rule_names:
+        cost = run([name])
+        costs[name] = cost[name] if cost is not None else None
+    return costs
+
+
+def gate_rules(rules, costs, previous, max_ms_per_file):
+    # Returns the severities and the reason of every rule that was turned off
+    # for its cost.
+    severities = {}
+    gated = {}
+    for name, rule_metadata in sorted(rules.items()):
+        if rule_metadata["deprecated"]:
+            continue
+        cost = costs.get(name)
+        if cost is None:
+            gated[name] = "rejected by ESLint on the corpus"
+        elif cost > max_ms_per_file:
+            gated[name] = f"{cost:.3f} ms/file"
+        if name in gated:
+            severities[name] = "off"
+        elif name in previous:
+            severities[name] = previous[name]
+        elif not rule_metadata["recommended"]:
+            severities[name] = "off"
+        else:
+            severities[name] = "error"
+    return severities, gated
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Register a plugin as a rule source, with its rules gated by cost.")
+    parser.add_argument("name", help="name of the rule source")
+    parser.add_argument("package", help="npm package of the plugin")
+    parser.add_argument("--prefix", required=True, help="prefix of the plugin's rules")
+    parser.add_argument("--parser", help="parser package the plugin needs, if any")
+    parser.add_argument("--configs", nargs="+", choices=make_eslintrc.configs, required=True)
+    parser.add_argument("--corpus", type=Path, required=True, help="benchmark corpus with the plugin installed")
+    parser.add_argument("--patterns", nargs="+", default=["src"])
+    parser.add_argument("--max-ms-per-file", type=float, default=0.5, help="cost above which rules default to off")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    path = make_eslintrc.registered_sources_dir / f"{args.name}.json"
+    previous = read_source(path)
+    if args.name in make_eslintrc.rule_sources and previous is None:
+        print(f"'{args.name}' is already a rule source in make_eslintrc.py", file=sys.stderr)
+        sys.exit(1)
+    for source_name, source in make_eslintrc.rule_sources.items():
+        if source_name != args.name and source["prefix"] == args.prefix:
+            print(f"Prefix '{args.prefix}' is already used by '{source_name}'", file=sys.stderr)
+            sys.exit(1)
+
+    corpus = args.corpus.resolve()
+    metadata = rule_metadata(corpus / "node_modules", {args.package: args.prefix})
+    rules = plugin_rules(metadata, args.prefix)
+    if not rules:
+        print(f"{args.package} exports no rules", file=sys.stderr)
+        sys.exit(1)
+    active = sorted(name for name, rule_metadata in rules.items() if not rule_metadata["deprecated"])
+
+    # Measured without the previous version of the source, so that it does not
+    # also enable the rules.
+    if previous is not None:
+        for config_name in previous["configs"]:
+            make_eslintrc.configs[config_name]["rule_sources"].remove(args.name)
+        del make_eslintrc.rule_sources[args.name]
+    costs = measure_rules(corpus, args.configs[0], args.package, args.prefix, active, args.patterns)
+    severities, gated = gate_rules(rules, costs, previous["rules"] if previous else {}, args.max_ms_per_file)
+
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(json.dumps({
+        "package": args.package,
+        "parser": args.parser,
+        "prefix": args.prefix,
+        "rules": severities,
+        "updated": date.today().isoformat(),
+        "version": metadata["packages"][args.package],
+        "from_js": active,
+        "from_js_deprecated": sorted(name for name in rules if name not in severities),
+        "configs": args.configs,
+        "costs": {name: costs[name] for name in active},
+        "max_ms_per_file": args.max_ms_per_file,
+    }, indent=4) + "\n")
+
+    enabled = [name for name, severity in severities.items() if make_eslintrc.rule_severity(severity) != "off"]
+    print(f"Wrote {path}: {len(active)} rules, {len(enabled)} enabled")
+    if gated:
+        print(f"Off for their cost on {corpus.name} ({len(gated)}):")
+        for name, reason in gated.items():
+            was = previous["rules"].get(name, "off") if previous else "off"
+            changed = f", was {json.dumps(was)} in {path.name}" if make_eslintrc.rule_severity(was) != "off" else ""
+            print(f"  - {args.prefix}/{name}: {reason}{changed}")
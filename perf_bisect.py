@@ -0,0 +1,302 @@
+#!/usr/bin/env python
+
+# Find the commit and the rule entry that made linting slower:
+#
+#   perf_bisect.py GOOD BAD --corpus DIR [--config svelte] [--generator-args "--parser-overrides"]
+#
+# Only commits between GOOD and BAD that change the rule tables (make_eslintrc.py,
+# sources/) or the dependencies (package.json, pnpm-lock.yaml) can change lint
+# time. The config is regenerated at each of them from the repository as it was
+# then, and the benchmark corpus (see benchmark.py corpus) is linted with it,
+# with the dependencies of that commit installed if they differ. Commits whose
+# config and dependencies match an already measured one are not linted again.
+#
+# Once the first slow commit is found, its config is diffed against the one
+# before, per rule and per other top-level key, and the changes are applied to
+# the fast config half at a time until the one entry that brings back the
+# slowdown is left.
+
+import argparse
+import copy
+import hashlib
+import json
+import shlex
+import shutil
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+import benchmark
+import lint_runner
+import make_eslintrc
+import upgrade_report
+
+
+repository = lint_runner.here
+table_paths = ["make_eslintrc.py", "sources"]
+dependency_paths = ["package.json", "pnpm-lock.yaml"]
+installs_dir = repository / "build" / "bisect"
+
+
+def git(*args):
+    result = subprocess.run(["git", *args], cwd=repository, capture_output=True, text=True)
+    if result.returncode != 0:
+        print(f"git {' '.join(args)} failed:\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    return result.stdout
+
+
+def candidate_commits(good, bad):
+    good, bad = git("rev-parse", good).strip(), git("rev-parse", bad).strip()
+    commits = git("rev-list", "--reverse", "--ancestry-path", f"{good}..{bad}", "--", *table_paths, *dependency_paths)
+    return [good, *commits.split()] if commits.strip() else [good]
+
+
+def describe(commit):
+    return git("log", "-1", "--format=%h %s", commit).strip()
+
+
+def dependencies_hash(commit):
+    digest = hashlib.sha256()
+    for path in dependency_paths:
+        result = subprocess.run(["git", "show", f"{commit}:{path}"], cwd=repository, capture_output=True)
+        digest.update(path.encode() + b"\0" + result.stdout)
+    return digest.hexdigest()[:16]
+
+
+def generate_config(commit, config_name, generator_args):
+    # Returns None if the generator fails at this commit.
+    with tempfile.TemporaryDirectory() as tmp:
+        archive = subprocess.run(["git", "archive", commit], cwd=repository, capture_output=True, check=True)
+        archive_path = Path(tmp) / "tree.tar"
+        archive_path.write_bytes(archive.stdout)
+        with tarfile.open(archive_path) as tar:
+            tar.extractall(Path(tmp) / "tree", filter="data")
+        result = subprocess.run(
+            [sys.executable, "make_eslintrc.py", config_name, *generator_args],
+            cwd=Path(tmp) / "tree",
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        return None
+    return json.loads(result.stdout)
+
+
+def install_dependencies(commit, deps_hash):
+    # One installation per distinct package.json and lockfile, kept between runs.
+    install_dir = installs_dir / deps_hash
+    if (install_dir / "node_modules").exists():
+        return install_dir / "node_modules"
+    if shutil.which("pnpm") is None:
+        print(f"{describe(commit)} changes the dependencies, but pnpm is not installed", file=sys.stderr)
+        sys.exit(1)
+    install_dir.mkdir(parents=True, exist_ok=True)
+    for path in dependency_paths:
+        (install_dir / path).write_text(git("show", f"{commit}:{path}"))
+    result = subprocess.run(["pnpm", "install", "--frozen-lockfile"], cwd=install_dir)
+    if result.returncode != 0:
+        print(f"Cannot install the dependencies of {describe(commit)}", file=sys.stderr)
+        sys.exit(1)
+    return install_dir / "node_modules"
+
+
+def measure(corpus, config_name, config, node_modules, repeat):
+    # node_modules is None to lint with the corpus's own installation.
+    if node_modules is not None:
+        return upgrade_report.run_on_tree(corpus, node_modules, config_name, config, repeat)
+    runs = []
+    for _ in range(repeat):
+        results = lint_runner.run_instrumented(corpus, config_name, config, ["src"], check=False)
+        if results is None:
+            return None
+        runs.append(benchmark.summarize_run(results))
+    return min(runs, key=lambda run: run["wall_ms"])
+
+
+class Bisection:
+    def __init__(self, corpus, config_name, generator_args, repeat, install):
+        self.corpus = corpus
+        self.config_name = config_name
+        self.generator_args = generator_args
+        self.repeat = repeat
+        self.install = install
+        self.states = {}
+        self.runs = {}
+
+    def state(self, commit):
+        # (config, dependencies hash), config None if it cannot be generated.
+        if commit not in self.states:
+            self.states[commit] = (
+                generate_config(commit, self.config_name, self.generator_args),
+                dependencies_hash(commit),
+            )
+        return self.states[commit]
+
+    def run(self, commit):
+        config, deps_hash = self.state(commit)
+        if config is None:
+            return None
+        key = (lint_runner.config_fingerprint(config), deps_hash if self.install else None)
+        if key not in self.runs:
+            node_modules = install_dependencies(commit, deps_hash) if self.install else None
+            self.runs[key] = measure(self.corpus, self.config_name, config, node_modules, self.repeat)
+            result = self.runs[key]
+            timing = f"{result['wall_ms']:.0f} ms" if result else "lint failed"
+            print(f"  {describe(commit)}: {timing}", file=sys.stderr)
+        return self.runs[key]
+
+    def node_modules(self, commit):
+        return install_dependencies(commit, self.state(commit)[1]) if self.install else None
+
+
+def bisect_commits(bisection, commits, slow_ms):
+    # commits[0] is fast and commits[-1] slow; returns the index of the first
+    # slow commit. Commits that cannot be generated or linted are skipped.
+    low, high = 0, len(commits) - 1
+    while high - low > 1:
+        middle = (low + high) // 2
+        probe = middle
+        while probe < high and bisection.run(commits[probe]) is None:
+            probe += 1
+        if probe == high:
+            probe = middle - 1
+            while probe > low and bisection.run(commits[probe]) is None:
+                probe -= 1
+            if probe == low:
+                break
+        if bisection.run(commits[probe])["wall_ms"] >= slow_ms:
+            high = probe
+        else:
+            low = probe
+    return low, high
+
+
+def config_changes(before, after):
+    # (key, rule or None, before value, after value); a missing value is None.
+    changes = []
+    for rule in sorted(set(before.get("rules", {})) | set(after.get("rules", {}))):
+        old, new = before.get("rules", {}).get(rule), after.get("rules", {}).get(rule)
+        if old != new:
+            changes.append(("rules", rule, old, new))
+    for key in sorted((set(before) | set(after)) - {"rules"}):
+        if before.get(key) != after.get(key):
+            changes.append((key, None, before.get(key), after.get(key)))
+    return changes
+
+
+def apply_changes(config, changes):
+    config = copy.deepcopy(config)
+    for key, rule, _, new in changes:
+        target, name = (config.setdefault("rules", {}), rule) if rule else (config, key)
+        if new is None:
+            target.pop(name, None)
+        else:
+            target[name] = new
+    return config
+
+
+def narrow_changes(bisection, before, changes, node_modules, slow_ms):
+    # Returns the smallest group of changes found that is slow on its own, and
+    # whether narrowing stopped because a half could not be linted. A half
+    # that fails, e.g. a rule removed without its options, is never chosen.
+    def slow(group):
+        # None if the lint failed.
+        result = measure(bisection.corpus, bisection.config_name, apply_changes(before, group), node_modules, bisection.repeat)
+        return None if result is None else result["wall_ms"] >= slow_ms
+
+    while len(changes) > 1:
+        half = len(changes) // 2
+        first = slow(changes[:half])
+        if first:
+            changes = changes[:half]
+            continue
+        second = slow(changes[half:])
+        if second:
+            changes = changes[half:]
+            continue
+        # Only slow together, e.g. an option and the rule it configures in an
+        # override, or inconclusive.
+        return changes, first is None or second is None
+    return changes, False
+
+
+def format_change(change):
+    key, rule, old, new = change
+    name = rule if rule else key
+    return f"{name}: {json.dumps(old) if old is not None else '(not set)'} -> {json.dumps(new) if new is not None else '(not set)'}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bisect a lint-time regression to a commit and a rule entry.")
+    parser.add_argument("good", help="revision with the expected lint time")
+    parser.add_argument("bad", help="revision that lints slower")
+    parser.add_argument("--corpus", type=Path, required=True, help="benchmark corpus to lint")
+    parser.add_argument("--config", choices=make_eslintrc.configs, default="svelte")
+    parser.add_argument("--generator-args", default="", help="make_eslintrc.py options, as one string")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.05, help="slowdown to bisect, 0.05 = 5%%")
+    parser.add_argument("--top", type=int, default=5, help="rules with the largest change to show")
+    args = parser.parse_args()
+
+    commits = candidate_commits(args.good, args.bad)
+    if len(commits) < 2:
+        print("No commit between the revisions changes the rule tables or the dependencies", file=sys.stderr)
+        sys.exit(1)
+    # The corpus's own installation is used unless the dependencies change.
+    install = len({dependencies_hash(commit) for commit in commits}) > 1
+    bisection = Bisection(args.corpus.resolve(), args.config, shlex.split(args.generator_args), args.repeat, install)
+    print(f"Bisecting {len(commits) - 1} commits that change the rule tables or the dependencies", file=sys.stderr)
+
+    good_run, bad_run = bisection.run(commits[0]), bisection.run(commits[-1])
+    if good_run is None or bad_run is None:
+        print(f"Cannot lint with the config at {'GOOD' if good_run is None else 'BAD'}", file=sys.stderr)
+        sys.exit(1)
+    change = bad_run["wall_ms"] / good_run["wall_ms"] - 1
+    if change <= args.threshold:
+        print(f"No regression: {good_run['wall_ms']:.0f} ms -> {bad_run['wall_ms']:.0f} ms ({change:+.1%})")
+        sys.exit(0)
+    # Halfway between the two, so that noise on either side is tolerated.
+    slow_ms = (good_run["wall_ms"] + bad_run["wall_ms"]) / 2
+
+    low, high = bisect_commits(bisection, commits, slow_ms)
+    fast_run, slow_run = bisection.run(commits[low]), bisection.run(commits[high])
+    print(
+        f"First slow commit: {describe(commits[high])}"
+        f" ({fast_run['wall_ms']:.0f} ms -> {slow_run['wall_ms']:.0f} ms)"
+    )
+    if high - low > 1:
+        print(f"  (the commits since {describe(commits[low])} could not be linted)")
+
+    before, before_deps = bisection.state(commits[low])
+    after, after_deps = bisection.state(commits[high])
+    changes = config_changes(before, after)
+    rules_ms = sorted(
+        set(fast_run["rules_ms"]) | set(slow_run["rules_ms"]),
+        key=lambda rule: fast_run["rules_ms"].get(rule, 0) - slow_run["rules_ms"].get(rule, 0),
+    )
+    if before_deps != after_deps:
+        print("  The dependencies changed; rules with the largest change:")
+        for rule in rules_ms[:args.top]:
+            print(
+                f"    {rule}: {fast_run['rules_ms'].get(rule, 0):.1f} ms -> {slow_run['rules_ms'].get(rule, 0):.1f} ms"
+            )
+    if not changes:
+        sys.exit(1)
+
+    # Toggle the config changes on the fast config, with the slow commit's
+    # dependencies so that only the config differs.
+    culprits, failed = narrow_changes(bisection, before, changes, bisection.node_modules(commits[high]), slow_ms)
+    if failed:
+        print(f"  Linting with part of these {len(culprits)} config changes failed, so they were not narrowed further:")
+    elif len(culprits) == len(changes) and len(changes) > 1:
+        print(f"  The slowdown needs all {len(changes)} config changes of the commit together:")
+    elif len(culprits) > 1:
+        print(f"  The slowdown needs these {len(culprits)} config changes together:")
+    else:
+        print("  Responsible config entry:")
+    for culprit in culprits:
+        print(f"    {format_change(culprit)}")
+    sys.exit(1)
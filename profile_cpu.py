@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+
+# Run ESLint with a generated config under `node --cpu-prof` and attribute the
+# samples to packages, modules, rules and lint phases (parse / rules / other).
+#
+# Writes summary.json and profile.collapsed (for flamegraph.pl, speedscope, etc.)
+# into the output directory and prints the summary.
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+from collections import Counter
+from functools import cache
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+node_modules_re = re.compile(r"^.*/node_modules/((?:@[^/]+/)?[^/]+)/(.*)$")
+rule_module_re = re.compile(r"^(?:lib|dist)/rules/([^/]+)\.js$")
+
+parser_packages = {
+    "espree",
+    "@typescript-eslint/parser",
+    "@typescript-eslint/typescript-estree",
+    "svelte-eslint-parser",
+}
+
+@cache
+def rule_packages():
+    # After run_checks_once, which loads the registered sources.
+    return {source["package"]: source["prefix"] for source in make_eslintrc.rule_sources.values()}
+
+
+def locate_frame(call_frame):
+    url = call_frame["url"]
+    if not url:
+        # (program), (idle), (garbage collector), (root)
+        return call_frame["functionName"], ""
+    if url.startswith("node:"):
+        return "(node)", url[len("node:"):]
+    path = url.removeprefix("file://")
+    match = node_modules_re.match(path)
+    if not match:
+        return "(project)", path
+    return match.group(1), match.group(2)
+
+
+def frame_rule(package, module):
+    packages = rule_packages()
+    if package not in packages:
+        return None
+    match = rule_module_re.match(module)
+    if not match:
+        return None
+    return make_eslintrc.prefix_name(match.group(1), packages[package])
+
+
+def frame_label(call_frame, package, module):
+    name = call_frame["functionName"] or "(anonymous)"
+    if not module:
+        return name
+    line = call_frame["lineNumber"] + 1
+    return f"{name} ({package}/{module}:{line})".replace(";", ",")
+
+
+def sample_durations(profile):
+    timestamps = []
+    time = profile["startTime"]
+    for delta in profile["timeDeltas"]:
+        time += delta
+        timestamps.append(time)
+    timestamps.append(max(profile["endTime"], time))
+    return [timestamps[i + 1] - timestamps[i] for i in range(len(profile["samples"]))]
+
+
+def analyze_profile(profile, totals):
+    nodes = {node["id"]: node for node in profile["nodes"]}
+    parents = {}
+    for node in profile["nodes"]:
+        for child_id in node.get("children", []):
+            parents[child_id] = node["id"]
+
+    located = {
+        node_id: locate_frame(node["callFrame"]) for node_id, node in nodes.items()
+    }
+    stacks = {}
+
+    def stack_of(node_id):
+        # Walks up to the nearest known stack and fills in the path down,
+        # without recursion: parser and TypeScript stacks can be thousands of
+        # frames deep.
+        path = []
+        current = node_id
+        while current is not None and current not in stacks:
+            path.append(current)
+            current = parents.get(current)
+        stack = stacks[current] if current is not None else ()
+        for frame_id in reversed(path):
+            stack = (*stack, frame_id)
+            stacks[frame_id] = stack
+        return stacks[node_id]
+
+    for node_id, duration in zip(profile["samples"], sample_durations(profile)):
+        # Drop the synthetic (root) frame.
+        stack = stack_of(node_id)[1:]
+        if not stack:
+            continue
+        package, module = located[node_id]
+        totals["total"] += duration
+        totals["packages"][package] += duration
+        totals["modules"][f"{package}/{module}" if module else package] += duration
+
+        # The outermost rule frame is the rule the linter called; extension
+        # rules in plugins call into the base ESLint rule further down.
+        rule = next(
+            (rule for rule in (frame_rule(*located[frame]) for frame in stack) if rule),
+            None,
+        )
+        if any(located[frame][0] in parser_packages for frame in stack):
+            phase = "parse"
+        elif rule:
+            phase = "rules"
+        else:
+            phase = "other"
+        totals["phases"][phase] += duration
+        if package == "typescript":
+            totals["phases_typescript"][phase] += duration
+        if rule:
+            totals["rules"][rule] += duration
+            if package == "typescript":
+                totals["rules_typescript"][rule] += duration
+
+        collapsed = ";".join(
+            frame_label(nodes[frame]["callFrame"], *located[frame]) for frame in stack
+        )
+        totals["collapsed"][collapsed] += duration
+
+
+def analyze_profiles(profile_paths):
+    totals = {
+        "total": 0,
+        "phases": Counter(),
+        "phases_typescript": Counter(),
+        "packages": Counter(),
+        "modules": Counter(),
+        "rules": Counter(),
+        "rules_typescript": Counter(),
+        "collapsed": Counter(),
+    }
+    for path in profile_paths:
+        with open(path) as f:
+            analyze_profile(json.load(f), totals)
+    return totals
+
+
+def ms(microseconds):
+    return round(microseconds / 1000, 1)
+
+
+def make_summary(totals, top):
+    summary = {
+        "total_ms": ms(totals["total"]),
+        "phases": {
+            phase: {
+                "ms": ms(duration),
+                "typescript_ms": ms(totals["phases_typescript"][phase]),
+            }
+            for phase, duration in totals["phases"].most_common()
+        },
+        "packages": {
+            package: ms(duration) for package, duration in totals["packages"].most_common()
+        },
+        "modules": {
+            module: ms(duration) for module, duration in totals["modules"].most_common(top)
+        },
+        "rules": {
+            rule: {
+                "ms": ms(duration),
+                "typescript_ms": ms(totals["rules_typescript"][rule]),
+            }
+            for rule, duration in totals["rules"].most_common(top)
+        },
+    }
+    return summary
+
+
+def format_summary(summary):
+    total = summary["total_ms"] or 1
+    lines = [f"Total sampled time: {summary['total_ms']} ms", "", "Phases:"]
+    for phase, data in summary["phases"].items():
+        lines.append(
+            f"  {phase:<8} {data['ms']:>10} ms {100 * data['ms'] / total:5.1f}%"
+            f"  (typescript {data['typescript_ms']} ms)"
+        )
+    lines += ["", "Packages (self time):"]
+    for package, duration in summary["packages"].items():
+        lines.append(f"  {duration:>10} ms {100 * duration / total:5.1f}%  {package}")
+    lines += ["", "Modules (self time):"]
+    for module, duration in summary["modules"].items():
+        lines.append(f"  {duration:>10} ms {100 * duration / total:5.1f}%  {module}")
+    lines += ["", "Rules (inclusive time):"]
+    for rule, data in summary["rules"].items():
+        lines.append(
+            f"  {data['ms']:>10} ms {100 * data['ms'] / total:5.1f}%  {rule}"
+            f"  (typescript {data['typescript_ms']} ms)"
+        )
+    return "\n".join(lines)
+
+
+def write_collapsed(collapsed, path):
+    with open(path, "w") as f:
+        for stack, duration in sorted(collapsed.items()):
+            # Weights are in microseconds.
+            f.write(f"{stack} {round(duration)}\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Profile an ESLint run with a generated config and attribute CPU time."
+    )
+    parser.add_argument("config", choices=make_eslintrc.configs)
+    parser.add_argument("patterns", nargs="*", default=["."])
+    parser.add_argument("--cwd", default=".", help="repository to lint")
+    parser.add_argument("--out", default="cpu-profile", help="output directory")
+    parser.add_argument("--top", type=int, default=30, help="number of modules and rules to show")
+    parser.add_argument(
+        "--analyze",
+        nargs="+",
+        metavar="PROFILE",
+        help="only analyze existing .cpuprofile files instead of running ESLint",
+    )
+    args = parser.parse_args()
+
+    # Also for --analyze, which attributes frames to the registered plugins.
+    make_eslintrc.run_checks_once()
+    out = Path(args.out).resolve()
+    if args.analyze:
+        profile_paths = args.analyze
+    else:
+        shutil.rmtree(out / "profiles", ignore_errors=True)
+        (out / "profiles").mkdir(parents=True)
+        with lint_runner.generated_config_file(
+            make_eslintrc.make_config(args.config), args.cwd
+        ) as config_path:
+            result = lint_runner.run_eslint(
+                args.cwd,
+                args.config,
+                config_path,
+                args.patterns,
+                node_args=["--cpu-prof", f"--cpu-prof-dir={out / 'profiles'}"],
+                eslint_extra_args=["--format", "json"],
+                stdout=subprocess.DEVNULL,
+            )
+        # ESLint exits with 1 when there are lint errors, which is fine here.
+        if result.returncode not in (0, 1):
+            print(f"ESLint failed with exit code {result.returncode}", file=sys.stderr)
+            sys.exit(result.returncode)
+        profile_paths = sorted((out / "profiles").glob("*.cpuprofile"))
+
+    if not profile_paths:
+        print("No CPU profiles were written", file=sys.stderr)
+        sys.exit(1)
+
+    totals = analyze_profiles(profile_paths)
+    summary = make_summary(totals, args.top)
+    out.mkdir(parents=True, exist_ok=True)
+    with open(out / "summary.json", "w") as f:
+        json.dump(summary, f, indent=4)
+    write_collapsed(totals["collapsed"], out / "profile.collapsed")
+    print(format_summary(summary))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+
+# Compiled rule database.
+#
+# The rule tables in make_eslintrc.py are compiled into build/rules/: one JSON
+# file with the prefixed rules of each rule source, and index.json with the
+# configs, the source metadata and the hash of make_eslintrc.py they were
+# compiled from, together with the registered sources in sources/ and the code
+# that compiles them. run_checks() runs once, when compiling, and loading a
+# config only reads the sources it uses without importing make_eslintrc.py.
+# Only base_config() reads from the database; make_eslintrc.py itself still
+# builds its tables at import, because its optimizations need them.
+#
+#   rule_db.py compile
+#   rule_db.py config svelte [--profile errors-only]
+#
+# The database is recompiled automatically when any of them changes.
+
+import argparse
+import copy
+import hashlib
+import json
+import sys
+from functools import cache
+from pathlib import Path
+
+
+format_version = 2
+
+here = Path(__file__).resolve().parent
+tables_path = here / "make_eslintrc.py"
+# The code that turns the tables into the database.
+compiler_paths = [here / "rule_registry.py", Path(__file__).resolve()]
+registered_sources_dir = here / "sources"
+database_dir = here / "build" / "rules"
+index_path = database_dir / "index.json"
+
+source_keys = ["package", "parser", "prefix", "updated", "version"]
+
+
+def source_hash():
+    digest = hashlib.sha256(tables_path.read_bytes())
+    for path in compiler_paths:
+        digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    for path in sorted(registered_sources_dir.glob("*.json")):
+        digest.update(path.name.encode() + b"\0" + path.read_bytes())
+    return digest.hexdigest()
+
+
+def read_index():
+    try:
+        return json.loads(index_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(index, current_hash):
+    return (
+        index is not None
+        and index.get("format_version") == format_version
+        and index.get("source_hash") == current_hash
+    )
+
+
+def write_json(path, data):
+    # Write next to the target and rename, so readers never see a partial file.
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(json.dumps(data, separators=(",", ":")))
+    temp_path.replace(path)
+
+
+def compile_database(tables=None):
+    # tables is the make_eslintrc module, passed in when it is already loaded
+    # (possibly as __main__) to avoid importing it a second time.
+    if tables is None:
+        import make_eslintrc as tables
+    current_hash = source_hash()
+    tables.run_checks()
+
+    database_dir.mkdir(parents=True, exist_ok=True)
+    sources = {}
+    for source_name, source in tables.rule_sources.items():
+        file_name = f"{source_name}.json"
+        write_json(database_dir / file_name, {
+            "rules": tables.get_rules_prefixed([source_name]),
+            "deprecated": [tables.prefix_name(name, source["prefix"]) for name in source["from_js_deprecated"]],
+        })
+        sources[source_name] = {key: source[key] for key in source_keys} | {"file": file_name}
+
+    # The index is written last, so a database with a current index is complete.
+    index = {
+        "format_version": format_version,
+        "source_hash": current_hash,
+        "configs": tables.configs,
+        "profiles": tables.config_profiles,
+        "sources": sources,
+    }
+    write_json(index_path, index)
+    load_index.cache_clear()
+    load_source.cache_clear()
+    return index
+
+
+def compile_if_stale(tables=None):
+    index = read_index()
+    if not is_fresh(index, source_hash()):
+        index = compile_database(tables)
+    return index
+
+
+@cache
+def load_index():
+    return compile_if_stale()
+
+
+@cache
+def load_source(source_name):
+    source = load_index()["sources"][source_name]
+    return json.loads((database_dir / source["file"]).read_text())
+
+
+def get_rules_prefixed(source_names):
+    rules = {}
+    for source_name in source_names:
+        rules |= load_source(source_name)["rules"]
+    return rules
+
+
+def rule_severity(value):
+    # As make_eslintrc.rule_severity, which this module does not import.
+    severity = value[0] if isinstance(value, list) else value
+    return {0: "off", 1: "warn", 2: "error"}.get(severity, severity)
+
+
+def base_config(config_name, profile=None):
+    # The config as make_eslintrc.make_config() builds it, before any of the
+    # generator's optimizations. A copy, the index and sources are cached.
+    index = load_index()
+    config = index["configs"][config_name]
+    rules = get_rules_prefixed(config["rule_sources"])
+    if profile is not None:
+        severities = index["profiles"][profile]["severities"]
+        rules = {rule: value for rule, value in rules.items() if rule_severity(value) in severities}
+    return copy.deepcopy(config["eslint_base"] | {"rules": rules})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compile the rule tables or print a config from them.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("compile", help="compile make_eslintrc.py's rule tables")
+    config_parser = subparsers.add_parser("config", help="print a config without optimizations")
+    config_parser.add_argument("config")
+    config_parser.add_argument("--profile", help="keep only the rules of this profile")
+    args = parser.parse_args()
+
+    if args.command == "compile":
+        index = compile_database()
+        print(f"Compiled {len(index['sources'])} rule sources into {database_dir}", file=sys.stderr)
+    else:
+        configs = load_index()["configs"]
+        if args.config not in configs:
+            print(f"Unknown config '{args.config}', expected one of: {', '.join(configs)}", file=sys.stderr)
+            sys.exit(1)
+        profiles = load_index()["profiles"]
+        if args.profile is not None and args.profile not in profiles:
+            print(f"Unknown profile '{args.profile}', expected one of: {', '.join(profiles)}", file=sys.stderr)
+            sys.exit(1)
+        print(json.dumps(base_config(args.config, args.profile), indent=4))
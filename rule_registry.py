@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+# Index of the rules of every rule source, validated in a single pass.
+# `benchmark.py registry` measures it on synthetic sources.
+
+
+# The plugin whose rules extend the core rule of the same name. Other plugins
+# may reuse a core rule's name for an unrelated rule.
+extension_prefix = "@typescript-eslint"
+
+
+def prefix_name(name, prefix):
+    if not prefix:
+        return name
+    return f"{prefix}/{name}"
+
+
+class RuleRegistry:
+    def __init__(self, rule_sources):
+        self.rule_sources = rule_sources
+        # Prefixed rule name -> configured value, and -> name of its source.
+        self.rules = {}
+        self.source_of = {}
+        # Prefixed names of the rules the plugins deprecated -> source name.
+        self.deprecated = {}
+        # Prefixed extension rule -> core ESLint rule it extends.
+        self.extensions = {}
+        # Names of sources whose rules are not sorted.
+        self.unsorted = []
+
+        core_rules = set()
+        for source_name, source in rule_sources.items():
+            if not source["prefix"]:
+                core_rules |= set(source["rules"])
+
+        for source_name, source in rule_sources.items():
+            prefix = source["prefix"]
+            previous = None
+            for name, value in source["rules"].items():
+                if previous is not None and name < previous and source_name not in self.unsorted:
+                    self.unsorted.append(source_name)
+                previous = name
+                prefixed = prefix_name(name, prefix)
+                self.rules[prefixed] = value
+                self.source_of[prefixed] = source_name
+                if prefix == extension_prefix and name in core_rules:
+                    self.extensions[prefixed] = name
+            for name in source["from_js_deprecated"]:
+                self.deprecated[prefix_name(name, prefix)] = source_name
+
+    def base_rule(self, rule):
+        return self.extensions.get(rule, rule)
+
+    def validate(self):
+        # Returns the error messages, empty if the tables are consistent.
+        error_messages = []
+        for source_name in self.unsorted:
+            error_messages.append(f"- Rules in '{source_name}' are not sorted correctly")
+
+        # Every rule the plugins export must be configured exactly once, and
+        # every configured rule must be exported.
+        exported = set()
+        missing_rules = []
+        duplicate_rules_in_from_js = []
+        for source_name, source in self.rule_sources.items():
+            for name in source["from_js"]:
+                prefixed = prefix_name(name, source["prefix"])
+                if prefixed in exported:
+                    duplicate_rules_in_from_js.append(prefixed)
+                elif self.source_of.get(prefixed) == source_name:
+                    exported.add(prefixed)
+                else:
+                    missing_rules.append(prefixed)
+
+        if missing_rules:
+            missing_rules_list = "\n".join(f"  - {rule}" for rule in missing_rules)
+            error_messages.append(f"- Some rules are missing:\n{missing_rules_list}")
+
+        if duplicate_rules_in_from_js:
+            duplicate_rules_list = "\n".join(f"  - {rule}" for rule in duplicate_rules_in_from_js)
+            error_messages.append(f"- Some rules are duplicated in `from_js`:\n{duplicate_rules_list}")
+
+        if len(exported) < len(self.rules):
+            extraneous_rules = [rule for rule in self.rules if rule not in exported]
+            deprecated_rules = [rule for rule in extraneous_rules if rule in self.deprecated]
+            other_extraneous_rules = [rule for rule in extraneous_rules if rule not in self.deprecated]
+            if deprecated_rules:
+                deprecated_rules_list = "\n".join(f" - {rule}" for rule in deprecated_rules)
+                error_messages.append(f"- Some deprecated rules were used:\n{deprecated_rules_list}")
+            if other_extraneous_rules:
+                extraneous_rules_list = "\n".join(f"  - {rule}" for rule in other_extraneous_rules)
+                error_messages.append(f"- Some rules were not found in any sources:\n{extraneous_rules_list}")
+
+        return error_messages
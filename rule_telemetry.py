@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+
+# Rule hit-rate telemetry.
+#
+#   rule_telemetry.py record CONFIG --cwd REPO [--repo NAME]
+#       Lint a repository and append, for every enabled rule of the generated
+#       config, how many diagnostics it produced and how long it took.
+#
+#   rule_telemetry.py report CONFIG [--write-configs DIR]
+#       Rank the expensive rules that (almost) never report across all
+#       recorded runs. Optionally write a config with those rules turned off
+#       and a nightly config that keeps them.
+
+import argparse
+import datetime
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+default_telemetry = lint_runner.here / "rule-telemetry.json"
+
+
+def enabled_rules(config_name):
+    return [
+        rule
+        for rule, value in make_eslintrc.get_rules_prefixed(
+            make_eslintrc.configs[config_name]["rule_sources"]
+        ).items()
+        if make_eslintrc.rule_severity(value) != "off"
+    ]
+
+
+def record(cwd, config_name, repo, patterns):
+    results = lint_runner.run_instrumented(
+        cwd, config_name, make_eslintrc.make_config(config_name), patterns
+    )
+    hits = Counter()
+    durations = Counter()
+    for stats in results["files"].values():
+        durations.update(stats["rules"])
+        for rule, counts in stats["messages"].items():
+            hits[rule] += counts["error"] + counts["warning"]
+    return {
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "repo": repo,
+        "config": config_name,
+        "files": len(results["files"]),
+        "rules": {
+            rule: {"hits": hits[rule], "ms": round(durations[rule], 2)}
+            for rule in enabled_rules(config_name)
+        },
+    }
+
+
+def aggregate(telemetry, config_name):
+    files = 0
+    hits = Counter()
+    durations = Counter()
+    for entry in telemetry:
+        if entry["config"] != config_name:
+            continue
+        files += entry["files"]
+        for rule, data in entry["rules"].items():
+            hits[rule] += data["hits"]
+            durations[rule] += data["ms"]
+    return files, hits, durations
+
+
+def rank_rules(telemetry, config_name, max_hit_rate, min_ms_per_file):
+    files, hits, durations = aggregate(telemetry, config_name)
+    if not files:
+        return []
+    ranked = []
+    # Rules that are no longer enabled in the config are dropped.
+    for rule in enabled_rules(config_name):
+        hit_rate = 1000 * hits[rule] / files
+        ms_per_file = durations[rule] / files
+        if hit_rate <= max_hit_rate and ms_per_file >= min_ms_per_file:
+            ranked.append({
+                "rule": rule,
+                "hits": hits[rule],
+                "hits_per_1000_files": round(hit_rate, 3),
+                "ms_per_file": round(ms_per_file, 3),
+                "total_ms": round(durations[rule], 1),
+            })
+    return sorted(ranked, key=lambda item: -item["total_ms"])
+
+
+def write_tier_configs(config_name, nightly_rules, directory):
+    directory.mkdir(parents=True, exist_ok=True)
+    config = make_eslintrc.make_config(config_name)
+    default_config = config | {
+        "rules": config["rules"] | {rule: "off" for rule in nightly_rules}
+    }
+    (directory / f".eslintrc.{config_name}.json").write_text(json.dumps(default_config, indent=4, default=make_eslintrc.json_default) + "\n")
+    (directory / f".eslintrc.{config_name}.nightly.json").write_text(json.dumps(config, indent=4, default=make_eslintrc.json_default) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rule hit-rate telemetry.")
+    parser.add_argument("--telemetry", type=Path, default=default_telemetry)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="lint a repository and record hits per rule")
+    record_parser.add_argument("config", choices=make_eslintrc.configs)
+    record_parser.add_argument("patterns", nargs="*", default=["."])
+    record_parser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+    record_parser.add_argument("--repo", help="repository name (default: directory name)")
+
+    report_parser = subparsers.add_parser("report", help="rank costly rules that never report")
+    report_parser.add_argument("config", choices=make_eslintrc.configs)
+    report_parser.add_argument(
+        "--max-hit-rate", type=float, default=0.5, help="maximum diagnostics per 1000 files"
+    )
+    report_parser.add_argument(
+        "--min-ms-per-file", type=float, default=0.05, help="minimum average cost per file"
+    )
+    report_parser.add_argument(
+        "--write-configs",
+        type=Path,
+        metavar="DIR",
+        help="write a config without the ranked rules and a nightly config with them",
+    )
+
+    args = parser.parse_args()
+    telemetry = json.loads(args.telemetry.read_text()) if args.telemetry.exists() else []
+
+    if args.command == "record":
+        make_eslintrc.run_checks_once()
+        cwd = args.cwd.resolve()
+        entry = record(cwd, args.config, args.repo or cwd.name, args.patterns)
+        telemetry.append(entry)
+        args.telemetry.write_text(json.dumps(telemetry, indent=4) + "\n")
+        silent = sum(1 for data in entry["rules"].values() if not data["hits"])
+        print(f"Recorded {len(entry['rules'])} rules over {entry['files']} files, {silent} without hits")
+    else:
+        ranked = rank_rules(telemetry, args.config, args.max_hit_rate, args.min_ms_per_file)
+        if not ranked:
+            print("No costly rules with a low hit rate found", file=sys.stderr)
+        for item in ranked:
+            print(
+                f"{item['total_ms']:>10.1f} ms  {item['ms_per_file']:>8.3f} ms/file"
+                f"  {item['hits_per_1000_files']:>7.3f} hits/1000 files  {item['rule']}"
+            )
+        if args.write_configs:
+            write_tier_configs(args.config, [item["rule"] for item in ranked], args.write_configs)
+            print(f"Wrote configs to {args.write_configs}", file=sys.stderr)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+
+# Lint a repository with a generated config and flag every file/rule pair that
+# takes longer than a time limit. The flagged pairs are written to a watchdog
+# file, which `make_eslintrc.py <config> --watchdog <file>` turns into overrides.
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import lint_runner
+import make_eslintrc
+
+
+def find_slow_rules(results, limit_ms):
+    slow = {}
+    for path, stats in results["files"].items():
+        rules = {
+            rule: round(duration, 1)
+            for rule, duration in stats["rules"].items()
+            if duration > limit_ms
+        }
+        if rules:
+            slow[path] = rules
+    return slow
+
+
+def merge_watchdog(previous, results, slow, cwd):
+    # Files linted in this run are replaced by the new measurements. Entries
+    # for other files are kept as long as the files still exist.
+    files = {
+        path: rules
+        for path, rules in previous.get("files", {}).items()
+        if path not in results["files"] and (cwd / path).exists()
+    }
+    return dict(sorted((files | slow).items()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Find files where single rules are too slow.")
+    parser.add_argument("config", choices=make_eslintrc.configs)
+    parser.add_argument("patterns", nargs="*", default=["."])
+    parser.add_argument("--cwd", default=".", help="repository to lint")
+    parser.add_argument("--limit-ms", type=float, default=5000, help="time limit per file and rule")
+    parser.add_argument(
+        "--output",
+        help="watchdog file to update (default: lint-watchdog.json in the linted repository)",
+    )
+    args = parser.parse_args()
+
+    cwd = Path(args.cwd).resolve()
+    output = Path(args.output) if args.output else cwd / "lint-watchdog.json"
+
+    make_eslintrc.run_checks_once()
+    results = lint_runner.run_instrumented(
+        cwd, args.config, make_eslintrc.make_config(args.config), args.patterns
+    )
+    slow = find_slow_rules(results, args.limit_ms)
+
+    previous = json.loads(output.read_text()) if output.exists() else {}
+    watchdog = {
+        "config": args.config,
+        "limit_ms": args.limit_ms,
+        "files": merge_watchdog(previous, results, slow, cwd),
+    }
+    output.write_text(json.dumps(watchdog, indent=4) + "\n")
+
+    if slow:
+        print(f"File/rule pairs over {args.limit_ms:.0f} ms:")
+        for path, rules in slow.items():
+            total = results["files"][path]["total_ms"]
+            print(f"  {path} ({total:.0f} ms total)")
+            for rule, duration in sorted(rules.items(), key=lambda item: -item[1]):
+                print(f"    - {rule}: {duration:.0f} ms")
+    else:
+        print(f"No file/rule pairs over {args.limit_ms:.0f} ms", file=sys.stderr)
+    print(f"Wrote {output}", file=sys.stderr)
@@ -0,0 +1,294 @@
+#!/usr/bin/env python
+
+# Split a repository's lint into CI shards that take about the same time.
+#
+#   shard_planner.py record CONFIG --cwd REPO [make_eslintrc.py options]
+#       Lint the repository and add every file's lint time to the durations
+#       file, under the fingerprint of the generated config.
+#
+#   shard_planner.py plan CONFIG --cwd REPO --shards N [make_eslintrc.py options]
+#       Estimate every file's lint time from the recorded durations, split the
+#       files into N shards and write the generated config, one file list per
+#       shard and shards.json with the estimates and commands.
+#
+# Files without recorded durations are estimated from their size, with the
+# median time per byte of recorded files with the same extension, or from the
+# predictions of `cost_model.py predict --output` when given. Files that
+# share a tsconfig program, found from the parserOptions.project the config
+# gives them, are kept in the same shard unless the program alone is more than
+# a shard's share, because every shard pays for building the programs of its
+# files.
+
+import argparse
+import datetime
+import json
+import shlex
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path, PurePosixPath
+
+import lint_runner
+import make_eslintrc
+
+
+# Samples kept per file and fingerprint; the median is used.
+max_samples = 5
+
+
+def durations_path(cwd):
+    return cwd / "lint-durations.json"
+
+
+def record(cwd, config_name, config, patterns, durations):
+    results = lint_runner.run_instrumented(cwd, config_name, config, patterns)
+    entry = durations.setdefault(lint_runner.config_fingerprint(config), {"config": config_name, "files": {}})
+    entry["date"] = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+    for path, stats in results["files"].items():
+        samples = entry["files"].get(path, []) + [round(stats["total_ms"], 1)]
+        entry["files"][path] = samples[-max_samples:]
+    return len(results["files"])
+
+
+def known_durations(durations, fingerprint):
+    if fingerprint in durations:
+        return durations[fingerprint]["files"]
+    # Another config's timings are still a better estimate than file sizes.
+    if durations:
+        latest = max(durations, key=lambda key: durations[key].get("date", ""))
+        print(f"No durations for this config, using those recorded on {durations[latest]['date']}", file=sys.stderr)
+        return durations[latest]["files"]
+    print("No durations recorded, estimating from file sizes only", file=sys.stderr)
+    return {}
+
+
+def estimate_durations(cwd, files, known, predicted=None):
+    # Unmeasured files get a weight, their predicted time or else their size,
+    # times the median ms per unit of weight of measured files with the same
+    # kind of weight and extension, which accounts for the machine and what
+    # the weight misses. Predicted ms and bytes are never mixed in one ratio.
+    predicted = predicted or {}
+    weights = {
+        name: ("predicted", predicted[name]) if predicted.get(name) else ("bytes", max((cwd / name).stat().st_size, 1))
+        for name in files
+    }
+    measured = {name: statistics.median(known[name]) for name in files if name in known}
+
+    per_weight = defaultdict(list)
+    for name, ms in measured.items():
+        kind, weight = weights[name]
+        per_weight[kind, PurePosixPath(name).suffix].append(ms / weight)
+    default_ratios = {}
+    for kind in ("predicted", "bytes"):
+        ratios = [ratio for (ratio_kind, _), kind_ratios in per_weight.items() if ratio_kind == kind for ratio in kind_ratios]
+        default_ratios[kind] = statistics.median(ratios) if ratios else None
+    # Predictions are already in ms. Without measured sizes, bytes are turned
+    # into ms with the ms per byte of the predicted files, so that all
+    # estimates are in ms; only without any predictions either are they all
+    # relative sizes.
+    if default_ratios["predicted"] is None:
+        default_ratios["predicted"] = 1.0
+    if default_ratios["bytes"] is None:
+        predicted_names = [name for name, (kind, _) in weights.items() if kind == "predicted"]
+        default_ratios["bytes"] = statistics.median(
+            weights[name][1] * default_ratios["predicted"] / max((cwd / name).stat().st_size, 1)
+            for name in predicted_names
+        ) if predicted_names else 1.0
+
+    estimates = {}
+    for name in files:
+        if name in measured:
+            estimates[name] = measured[name]
+        else:
+            kind, weight = weights[name]
+            ratios = per_weight.get((kind, PurePosixPath(name).suffix))
+            estimates[name] = weight * (statistics.median(ratios) if ratios else default_ratios[kind])
+    return estimates, len(files) - len(measured)
+
+
+def config_projects(cwd, config, files):
+    # The parserOptions.project of each file, with the overrides applied by
+    # ESLint itself so that override patterns match as they do when linting.
+    if not make_eslintrc.uses_project(config):
+        return {name: None for name in files}
+    with tempfile.TemporaryDirectory() as tmp, lint_runner.generated_config_file(config, cwd) as config_path:
+        options_path = Path(tmp) / "options.json"
+        options_path.write_text(json.dumps({"config": str(config_path), "files": files}))
+        result = subprocess.run(
+            ["node", str(lint_runner.here / "config-projects.js"), str(options_path)],
+            cwd=cwd,
+            capture_output=True,
+            text=True,
+        )
+    if result.returncode != 0:
+        print(f"Cannot resolve parserOptions.project of the files:\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    return json.loads(result.stdout)
+
+
+def program_of(cwd, name, settings):
+    # The tsconfig typescript-eslint builds the file's program from: of the
+    # tsconfigs parserOptions.project lists, the nearest one above the file,
+    # which is the one whose program includes it in a usual layout.
+    if not settings or not settings["project"]:
+        return None
+    root = Path(settings["tsconfigRootDir"] or cwd)
+    projects = settings["project"] if isinstance(settings["project"], list) else [settings["project"]]
+    tsconfigs = []
+    for project in projects:
+        matches = sorted(root.glob(project)) if any(char in project for char in "*?[") else [root / project]
+        tsconfigs += [repository_path(path, cwd) for path in matches]
+    if not tsconfigs:
+        return None
+    parents = list(PurePosixPath(name).parents)
+    containing = [path for path in tsconfigs if PurePosixPath(path.parent.as_posix()) in parents]
+    nearest = max(containing, key=lambda path: len(path.parts), default=tsconfigs[0])
+    return nearest.as_posix()
+
+
+def split_group(files, estimates, limit):
+    # Consecutive files in path order, so that split programs stay as close
+    # to whole directories as possible.
+    chunks = [[]]
+    chunk_ms = 0
+    for name in sorted(files):
+        if chunks[-1] and chunk_ms + estimates[name] > limit:
+            chunks.append([])
+            chunk_ms = 0
+        chunks[-1].append(name)
+        chunk_ms += estimates[name]
+    return chunks
+
+
+def plan_shards(cwd, files, estimates, shard_count, projects):
+    target_ms = sum(estimates.values()) / shard_count
+    groups = defaultdict(list)
+    units = []
+    for name in files:
+        program = program_of(cwd, name, projects.get(name))
+        if program:
+            groups[program].append(name)
+        else:
+            # Files outside any program can go anywhere on their own.
+            units.append([name])
+
+    split_programs = []
+    for program, group_files in groups.items():
+        group_ms = sum(estimates[name] for name in group_files)
+        if group_ms <= target_ms:
+            units.append(group_files)
+        else:
+            # Smaller pieces of an oversized program balance better.
+            units += split_group(group_files, estimates, target_ms / 2)
+            split_programs.append(program)
+
+    # Longest processing time first: each unit goes to the least loaded shard.
+    shards = [{"files": [], "estimated_ms": 0} for _ in range(shard_count)]
+    for unit in sorted(units, key=lambda unit: -sum(estimates[name] for name in unit)):
+        shard = min(shards, key=lambda shard: shard["estimated_ms"])
+        shard["files"] += unit
+        shard["estimated_ms"] += sum(estimates[name] for name in unit)
+
+    # Files of programs that are split anyway can move one at a time from the
+    # busiest shard to the least busy one while that shortens the critical path.
+    movable = {name for program in split_programs for name in groups[program]}
+    while True:
+        busiest = max(shards, key=lambda shard: shard["estimated_ms"])
+        idlest = min(shards, key=lambda shard: shard["estimated_ms"])
+        gap = busiest["estimated_ms"] - idlest["estimated_ms"]
+        candidates = [name for name in busiest["files"] if name in movable and 0 < estimates[name] < gap]
+        if not candidates:
+            break
+        name = min(candidates, key=lambda name: abs(gap / 2 - estimates[name]))
+        busiest["files"].remove(name)
+        idlest["files"].append(name)
+        busiest["estimated_ms"] -= estimates[name]
+        idlest["estimated_ms"] += estimates[name]
+
+    for shard in shards:
+        shard["files"].sort()
+        shard["estimated_ms"] = round(shard["estimated_ms"], 1)
+    return shards, split_programs
+
+
+def repository_path(path, cwd):
+    # Commands run from the repository root.
+    path = path.resolve()
+    return path.relative_to(cwd) if path.is_relative_to(cwd) else path
+
+
+def write_plan(cwd, output, config_name, config, shards, fingerprint):
+    output.mkdir(parents=True, exist_ok=True)
+    config_path = output / "eslintrc.json"
+    config_path.write_text(json.dumps(config, indent=4, default=make_eslintrc.json_default) + "\n")
+    relative_config = repository_path(config_path, cwd)
+
+    plan = {"config": config_name, "fingerprint": fingerprint, "shards": []}
+    for index, shard in enumerate(shards, 1):
+        list_path = output / f"shard-{index}.txt"
+        list_path.write_text("".join(f"{name}\n" for name in shard["files"]))
+        eslint = ["npx", "eslint", *lint_runner.eslint_args(config_name, relative_config, [])]
+        relative_list = repository_path(list_path, cwd)
+        plan["shards"].append(shard | {
+            "file_list": str(relative_list),
+            "command": f"xargs -r -d '\\n' -a {shlex.quote(str(relative_list))} {shlex.join(eslint)}",
+        })
+    (output / "shards.json").write_text(json.dumps(plan, indent=4) + "\n")
+    return plan
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Plan balanced lint shards from recorded durations.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="record per-file lint durations")
+    make_eslintrc.add_generator_arguments(record_parser)
+    record_parser.add_argument("--patterns", nargs="+", default=["."], help="files to lint")
+
+    plan_parser = subparsers.add_parser("plan", help="split the files into shards")
+    make_eslintrc.add_generator_arguments(plan_parser)
+    plan_parser.add_argument("--shards", type=int, required=True)
+    plan_parser.add_argument("--predicted", type=Path, help="per-file predictions from cost_model.py predict --output")
+    plan_parser.add_argument("--output", type=Path, help="directory for the plan (default: lint-shards/ in the repository)")
+
+    for subparser in (record_parser, plan_parser):
+        subparser.add_argument("--cwd", type=Path, default=Path("."), help="repository to lint")
+        subparser.add_argument("--durations", type=Path, help="durations file (default: lint-durations.json in the repository)")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    cwd = args.cwd.resolve()
+    config, reports = make_eslintrc.make_config_from_args(args)
+    for title, report in reports.items():
+        make_eslintrc.print_report(title, report)
+    path = args.durations or durations_path(cwd)
+    durations = json.loads(path.read_text()) if path.exists() else {}
+
+    if args.command == "record":
+        linted = record(cwd, args.config, config, args.patterns, durations)
+        path.write_text(json.dumps(durations, indent=4) + "\n")
+        print(f"Recorded durations of {linted} files in {path}")
+    else:
+        if args.shards < 1:
+            print("--shards must be at least 1", file=sys.stderr)
+            sys.exit(1)
+        fingerprint = lint_runner.config_fingerprint(config)
+        files = lint_runner.lint_files(cwd, args.config, config)
+        predicted = json.loads(args.predicted.read_text()) if args.predicted else None
+        estimates, unseen = estimate_durations(cwd, files, known_durations(durations, fingerprint), predicted)
+        projects = config_projects(cwd, config, files)
+        shards, split_programs = plan_shards(cwd, files, estimates, args.shards, projects)
+        plan = write_plan(cwd, args.output or cwd / "lint-shards", args.config, config, shards, fingerprint)
+
+        for index, shard in enumerate(plan["shards"], 1):
+            print(f"shard {index}: {len(shard['files']):>6} files, {shard['estimated_ms'] / 1000:>8.1f} s estimated")
+        loads = [shard["estimated_ms"] for shard in shards]
+        if loads and max(loads) > 0:
+            print(f"Critical path {max(loads) / 1000:.1f} s, {max(loads) / (sum(loads) / len(loads)) - 1:.1%} over the mean")
+        if unseen:
+            source = "predicted time" if args.predicted else "size"
+            print(f"{unseen} files had no recorded duration and were estimated from their {source}")
+        if split_programs:
+            print(f"Programs split across shards: {', '.join(split_programs)}")
@@ -0,0 +1,42 @@
+import pytest
+
+import corpus_scan
+import make_eslintrc
+
+
+# A missed family turns off rules that should run, so each of these must be found.
+@pytest.mark.parametrize("family, extension, text", [
+    ("labels", ".js", "outer: if (ready) {\n    break outer;\n}\n"),
+    ("labels", ".js", "block: {\n    break block;\n}\n"),
+    ("labels", ".js", "if (ready) done: { break done; }\n"),
+    ("jsx", ".js", "export const App = () => <div className=\"app\" />;\n"),
+    ("jsx", ".mjs", "render(<>\n    <App />\n</>);\n"),
+    ("for-in", ".js", "for(k in(obj)) count++;\n"),
+    ("for-in", ".ts", "for (const key in\n    object) {}\n"),
+    ("generators", ".js", "const api = { *gen() { return 1; } };\n"),
+    ("generators", ".ts", "class Tree { static *walk() {} }\n"),
+    ("generators", ".js", "function* numbers() {}\n"),
+])
+def test_scan_text_finds_family(family, extension, text):
+    assert family in corpus_scan.scan_text(text, extension)
+
+
+def test_jsx_is_not_looked_for_in_typescript():
+    assert "jsx" not in corpus_scan.scan_text("const list = <string[]>items;\n", ".ts")
+
+
+def test_require_atomic_updates_kept_for_generators():
+    config = {"rules": {"require-atomic-updates": "error", "no-await-in-loop": "error", "require-yield": "error"}}
+    families = corpus_scan.scan_text("function* tasks() { yield 1; }\n", ".js")
+    assert "async" not in families
+    config, _ = make_eslintrc.remove_unused_syntax_rules(config, families)
+    assert config["rules"]["require-atomic-updates"] == "error"
+    assert config["rules"]["require-yield"] == "error"
+    assert config["rules"]["no-await-in-loop"] == "off"
+
+
+def test_require_atomic_updates_off_without_async_and_generators():
+    config = {"rules": {"require-atomic-updates": "error"}}
+    config, report = make_eslintrc.remove_unused_syntax_rules(config, ["classes"])
+    assert make_eslintrc.rule_severity(config["rules"]["require-atomic-updates"]) == "off"
+    assert sum("require-atomic-updates" in line for line in report) == 1
@@ -0,0 +1,16 @@
+import fix_convergence
+
+
+def passes(count):
+    return [[{"ruleId": "semi", "line": 1}] for _ in range(count)]
+
+
+def test_converging_on_the_last_pass_is_not_reported():
+    results = {"files": {
+        "last.ts": {"fix_passes": passes(fix_convergence.max_fix_passes)},
+        "stuck.ts": {"fix_passes": passes(fix_convergence.max_fix_passes + 1)},
+        "clean.ts": {},
+    }}
+    analysis = fix_convergence.analyze(results)
+    assert analysis["not_converged"] == ["stuck.ts"]
+    assert analysis["passes"] == {fix_convergence.max_fix_passes: 2, 0: 1}
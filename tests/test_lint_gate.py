@@ -0,0 +1,14 @@
+import lint_gate
+
+
+def test_eslint_report_errors_skips_files_outside_the_repository(tmp_path):
+    repository = tmp_path / "repo"
+    report = [
+        {"filePath": str(repository / "src" / "app.ts"), "messages": [
+            {"ruleId": "no-undef", "severity": 2},
+            {"ruleId": "no-console", "severity": 1},
+            {"ruleId": None, "severity": 2},
+        ]},
+        {"filePath": str(tmp_path / "other" / "app.ts"), "messages": [{"ruleId": "no-undef", "severity": 2}]},
+    ]
+    assert lint_gate.eslint_report_errors(report, repository) == {"src/app.ts": {"no-undef", "(fatal)"}}
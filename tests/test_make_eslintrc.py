@@ -0,0 +1,101 @@
+import json
+
+import pytest
+
+import make_eslintrc
+
+
+def test_build_config_returns_independent_copies():
+    config = make_eslintrc.build_config("svelte", parser_overrides=True)
+    expected = make_eslintrc.build_config("svelte", parser_overrides=True)
+    config["overrides"].append({"files": ["*.js"], "rules": {}})
+    config["parserOptions"] = {}
+    assert make_eslintrc.build_config("svelte", parser_overrides=True) == expected
+
+
+def test_make_config_shares_composed_rules_read_only():
+    config = make_eslintrc.make_config("svelte")
+    assert config["rules"] is make_eslintrc.make_config("svelte")["rules"]
+    with pytest.raises(TypeError):
+        config["rules"]["no-undef"] = "off"
+    config["overrides"].clear()
+    assert make_eslintrc.make_config("svelte")["overrides"]
+    assert json.loads(json.dumps(config, default=make_eslintrc.json_default))["rules"] == dict(config["rules"])
+
+
+def test_registered_source_errors_reports_unknown_configs():
+    source = {"prefix": "example", "configs": ["svelte", "missing"]}
+    errors = make_eslintrc.registered_source_errors("example", source, make_eslintrc.rule_sources)
+    assert "unknown config 'missing'" in errors
+    assert "missing 'package'" in errors
+    assert "'svelte' is already a rule source" in make_eslintrc.registered_source_errors("svelte", source, make_eslintrc.rule_sources)
+
+
+def test_invalid_registered_source_raises_without_changing_configs(tmp_path, monkeypatch):
+    (tmp_path / "example.json").write_text(json.dumps({"prefix": "example", "configs": ["missing"]}))
+    monkeypatch.setattr(make_eslintrc, "registered_sources_dir", tmp_path)
+    make_eslintrc.load_registered_sources.cache_clear()
+    source_names = list(make_eslintrc.configs["svelte"]["rule_sources"])
+    try:
+        with pytest.raises(ValueError, match="unknown config 'missing'"):
+            make_eslintrc.load_registered_sources()
+        assert "example" not in make_eslintrc.rule_sources
+        assert make_eslintrc.configs["svelte"]["rule_sources"] == source_names
+    finally:
+        make_eslintrc.load_registered_sources.cache_clear()
+
+
+def oxlint_test_config():
+    return {
+        "rules": {
+            "no-debugger": "error",
+            "eqeqeq": ["error", "smart"],
+            "array-callback-return": ["error", {"allowImplicit": True, "allowVoid": True}],
+            "no-alert": "warn",
+            "no-caller": "error",
+            "no-await-in-loop": "off",
+            "complexity": "error",
+            "@typescript-eslint/no-empty-interface": "error",
+        },
+        "overrides": [
+            {"files": ["**/generated/**"], "rules": {"no-debugger": "off", "no-caller": "off"}},
+            {"files": ["*.test.js"], "rules": {"no-alert": "error"}},
+            {"files": ["scripts/**"], "excludedFiles": ["scripts/keep.js"], "rules": {"no-caller": "off"}},
+        ],
+    }
+
+
+def test_offload_to_oxlint_moves_supported_rules():
+    config, oxlint_config, _ = make_eslintrc.offload_to_oxlint(oxlint_test_config())
+    assert oxlint_config["rules"] == {
+        "no-debugger": "error",
+        "eqeqeq": ["error", "smart"],
+        "typescript/no-empty-interface": "error",
+    }
+    assert oxlint_config["plugins"] == ["typescript"]
+    # Turned off in ESLint for the files oxlint lints, and kept elsewhere.
+    assert config["overrides"][-1] == {
+        "files": make_eslintrc.oxlint_file_patterns,
+        "rules": {"no-debugger": "off", "eqeqeq": "off", "@typescript-eslint/no-empty-interface": "off"},
+    }
+    assert config["rules"]["no-debugger"] == "error"
+    assert oxlint_config["overrides"] == [{"files": ["**/generated/**"], "rules": {"no-debugger": "off"}}]
+
+
+def test_offload_to_oxlint_keeps_rules_it_cannot_repeat():
+    _, oxlint_config, report = make_eslintrc.offload_to_oxlint(oxlint_test_config())
+    # Unsupported options, an override with another severity, excludedFiles,
+    # rules that are off and rules oxlint does not have.
+    for rule in ("array-callback-return", "no-alert", "no-caller", "no-await-in-loop", "complexity"):
+        assert rule not in oxlint_config["rules"]
+    assert "  - array-callback-return: kept in ESLint, oxlint does not support allowVoid" in report
+    assert "  - no-alert: kept in ESLint, an override configures it differently" in report
+    assert "  - no-caller: kept in ESLint, an override configures it differently" in report
+
+
+def test_oxlint_overrides():
+    config = oxlint_test_config()
+    assert make_eslintrc.oxlint_overrides(config, "no-debugger") == [["**/generated/**"]]
+    assert make_eslintrc.oxlint_overrides(config, "eqeqeq") == []
+    assert make_eslintrc.oxlint_overrides(config, "no-alert") is None
+    assert make_eslintrc.oxlint_overrides(config, "no-caller") is None
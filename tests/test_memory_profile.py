@@ -0,0 +1,40 @@
+import json
+
+import memory_profile
+
+
+def write_snapshot(path):
+    # Two objects with one edge from the first to the second, in V8's layout:
+    # one section per line, numbers split over lines.
+    meta = {
+        "node_fields": ["type", "name", "id", "self_size", "edge_count"],
+        "node_types": [["hidden", "object"], "string", "number", "number", "number"],
+        "edge_fields": ["type", "name_or_index", "to_node"],
+        "edge_types": [["element", "property"], "string_or_number", "node"],
+    }
+    snapshot = {
+        "snapshot": {"meta": meta, "node_count": 2, "edge_count": 1},
+        "nodes": [0, 0, 1, 100, 1, 1, 1, 3, 4000000000, 0],
+        "edges": [1, 2, 5],
+        "trace_function_infos": [],
+        "trace_tree": [],
+        "strings": ["(root)", "Thing", "child", "with ] and \"nodes\":["],
+    }
+    lines = ["{" + f'"snapshot":{json.dumps(snapshot["snapshot"])},']
+    for key in ("nodes", "edges", "trace_function_infos", "trace_tree"):
+        values = ",".join(str(value) for value in snapshot[key]).replace(",1,", ",1\n,")
+        lines.append(f'"{key}":[{values}],')
+    lines.append(f'"strings":{json.dumps(snapshot["strings"])}' + "}")
+    path.write_text("\n".join(lines))
+    return snapshot
+
+
+def test_read_snapshot_streams_in_small_chunks(tmp_path):
+    path = tmp_path / "small.heapsnapshot"
+    snapshot = write_snapshot(path)
+    for chunk_size in (1, 3, 7, 1 << 16):
+        meta, nodes, edges, strings = memory_profile.read_snapshot(path, chunk_size)
+        assert meta == snapshot["snapshot"]["meta"]
+        assert list(nodes) == snapshot["nodes"]
+        assert list(edges) == snapshot["edges"]
+        assert strings == snapshot["strings"]
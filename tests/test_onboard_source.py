@@ -0,0 +1,14 @@
+import onboard_source
+
+
+def test_gate_rules_turns_off_previously_kept_rules_over_the_cost():
+    rules = {
+        "cheap": {"deprecated": False, "recommended": True},
+        "slow": {"deprecated": False, "recommended": True},
+        "kept": {"deprecated": False, "recommended": False},
+    }
+    costs = {"cheap": 0.1, "slow": 2.0, "kept": 0.1}
+    previous = {"slow": "error", "kept": "warn"}
+    severities, gated = onboard_source.gate_rules(rules, costs, previous, 0.5)
+    assert severities == {"cheap": "error", "slow": "off", "kept": "warn"}
+    assert gated == {"slow": "2.000 ms/file"}
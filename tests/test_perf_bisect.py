@@ -0,0 +1,58 @@
+import perf_bisect
+
+
+class FakeBisection:
+    corpus = None
+    config_name = "svelte"
+    repeat = 1
+
+    def __init__(self, runs=None):
+        self.runs = runs or {}
+
+    def run(self, commit):
+        return self.runs[commit]
+
+
+def rule_change(rule):
+    return ("rules", rule, None, "error")
+
+
+def fake_measure(slow_rules, broken_rules=()):
+    # Each rule in slow_rules adds 100 ms; any rule in broken_rules fails the lint.
+    def measure(corpus, config_name, config, node_modules, repeat):
+        rules = config.get("rules", {})
+        if any(rule in rules for rule in broken_rules):
+            return None
+        return {"wall_ms": 100 + 100 * sum(rule in rules for rule in slow_rules)}
+    return measure
+
+
+def test_narrow_changes_finds_the_slow_entry(monkeypatch):
+    monkeypatch.setattr(perf_bisect, "measure", fake_measure({"c"}))
+    changes = [rule_change(rule) for rule in "abcd"]
+    assert perf_bisect.narrow_changes(FakeBisection(), {}, changes, None, 150) == ([rule_change("c")], False)
+
+
+def test_narrow_changes_never_picks_a_half_that_fails(monkeypatch):
+    monkeypatch.setattr(perf_bisect, "measure", fake_measure({"c"}, broken_rules={"a"}))
+    changes = [rule_change(rule) for rule in "abcd"]
+    assert perf_bisect.narrow_changes(FakeBisection(), {}, changes, None, 150) == ([rule_change("c")], False)
+
+
+def test_narrow_changes_stops_when_both_halves_fail(monkeypatch):
+    monkeypatch.setattr(perf_bisect, "measure", fake_measure({"b"}, broken_rules={"a", "d"}))
+    changes = [rule_change(rule) for rule in "abcd"]
+    assert perf_bisect.narrow_changes(FakeBisection(), {}, changes, None, 150) == (changes, True)
+
+
+def test_bisect_commits_skips_commits_that_cannot_be_linted():
+    fast, slow = {"wall_ms": 100}, {"wall_ms": 200}
+    commits = ["c0", "c1", "c2", "c3", "c4", "c5"]
+    runs = {"c0": fast, "c1": fast, "c2": None, "c3": slow, "c4": slow, "c5": slow}
+    assert perf_bisect.bisect_commits(FakeBisection(runs), commits, 150) == (1, 3)
+
+
+def test_bisect_commits_gives_up_when_nothing_between_can_be_linted():
+    fast, slow = {"wall_ms": 100}, {"wall_ms": 200}
+    runs = {"c0": fast, "c1": None, "c2": None, "c3": slow}
+    assert perf_bisect.bisect_commits(FakeBisection(runs), ["c0", "c1", "c2", "c3"], 150) == (0, 3)
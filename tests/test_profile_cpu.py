@@ -0,0 +1,23 @@
+import json
+
+import profile_cpu
+
+
+def chain_profile(depth):
+    # (root) -> f1 -> f2 -> ... -> f{depth}, one sample in the deepest frame.
+    nodes = [{"id": 1, "callFrame": {"functionName": "(root)", "url": "", "lineNumber": -1}, "children": [2]}]
+    for node_id in range(2, depth + 2):
+        nodes.append({
+            "id": node_id,
+            "callFrame": {"functionName": f"f{node_id}", "url": "file:///repo/src/deep.js", "lineNumber": node_id},
+            "children": [node_id + 1] if node_id < depth + 1 else [],
+        })
+    return {"nodes": nodes, "samples": [depth + 1], "timeDeltas": [1000], "startTime": 0, "endTime": 2000}
+
+
+def test_analyze_profiles_handles_deep_stacks(tmp_path):
+    path = tmp_path / "deep.cpuprofile"
+    path.write_text(json.dumps(chain_profile(3000)))
+    totals = profile_cpu.analyze_profiles([path])
+    assert totals["packages"]["(project)"] > 0
+    assert totals["phases"]["other"] == totals["total"]
@@ -0,0 +1,23 @@
+import json
+
+import make_eslintrc
+import rule_db
+
+
+def test_base_config_matches_make_config():
+    for profile in (None, *make_eslintrc.config_profiles):
+        expected = json.loads(json.dumps(make_eslintrc.make_config("svelte", profile), default=make_eslintrc.json_default))
+        assert rule_db.base_config("svelte", profile) == expected
+
+
+def test_base_config_returns_copies():
+    expected = rule_db.base_config("svelte")
+    config = rule_db.base_config("svelte")
+    config["overrides"][0]["parserOptions"]["project"] = "other.json"
+    config["overrides"].clear()
+    config["rules"].clear()
+    assert rule_db.base_config("svelte") == expected
+
+
+def test_source_hash_covers_the_compiler():
+    assert {path.name for path in rule_db.compiler_paths} == {"rule_registry.py", "rule_db.py"}
@@ -0,0 +1,16 @@
+from rule_registry import RuleRegistry
+
+
+def source(prefix, rules):
+    return {"prefix": prefix, "rules": rules, "from_js": list(rules), "from_js_deprecated": []}
+
+
+def test_only_typescript_eslint_rules_extend_core_rules():
+    registry = RuleRegistry({
+        "eslint": source("", {"indent": "off", "no-shadow": "error"}),
+        "svelte": source("svelte", {"indent": "error"}),
+        "typescript-eslint": source("@typescript-eslint", {"indent": "off", "no-shadow": "error"}),
+    })
+    assert registry.extensions == {"@typescript-eslint/indent": "indent", "@typescript-eslint/no-shadow": "no-shadow"}
+    assert registry.base_rule("svelte/indent") == "svelte/indent"
+    assert registry.validate() == []
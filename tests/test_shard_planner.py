@@ -0,0 +1,75 @@
+import pytest
+
+import shard_planner
+
+
+def write_files(root, sizes):
+    for name, size in sizes.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x" * size)
+    return sorted(sizes)
+
+
+def test_estimates_without_measurements_are_relative_sizes(tmp_path):
+    files = write_files(tmp_path, {"a.ts": 100, "b.ts": 300})
+    estimates, unseen = shard_planner.estimate_durations(tmp_path, files, {})
+    assert estimates == {"a.ts": 100, "b.ts": 300}
+    assert unseen == 2
+
+
+def test_estimates_from_sizes_use_the_measured_ms_per_byte(tmp_path):
+    files = write_files(tmp_path, {"a.ts": 100, "b.ts": 300, "c.js": 200})
+    estimates, unseen = shard_planner.estimate_durations(tmp_path, files, {"a.ts": [50]})
+    # .ts files at the measured 0.5 ms/byte, .js with the same median.
+    assert estimates == {"a.ts": 50, "b.ts": 150, "c.js": 100}
+    assert unseen == 2
+
+
+def test_mixed_estimates_are_all_in_ms_without_measured_sizes(tmp_path):
+    files = write_files(tmp_path, {"a.ts": 100, "b.ts": 400})
+    estimates, _ = shard_planner.estimate_durations(tmp_path, files, {}, {"a.ts": 20})
+    # b.ts has no prediction; it gets the 0.2 ms/byte of the predicted file.
+    assert estimates == {"a.ts": 20, "b.ts": pytest.approx(80)}
+
+
+def test_mixed_estimates_keep_predicted_and_byte_ratios_apart(tmp_path):
+    files = write_files(tmp_path, {"a.ts": 100, "b.ts": 100, "c.ts": 100, "d.ts": 100})
+    known = {"a.ts": [40], "b.ts": [10]}
+    predicted = {"a.ts": 20, "c.ts": 30}
+    estimates, _ = shard_planner.estimate_durations(tmp_path, files, known, predicted)
+    # c.ts scales its prediction by a.ts's 2 ms per predicted ms, d.ts its
+    # size by b.ts's 0.1 ms per byte.
+    assert estimates == {"a.ts": 40, "b.ts": 10, "c.ts": 60, "d.ts": pytest.approx(10)}
+
+
+def test_plan_shards_balances_and_keeps_programs_together(tmp_path):
+    files = [f"src/file{index}.ts" for index in range(12)]
+    estimates = {name: 10 + index for index, name in enumerate(files)}
+    projects = {name: {"project": None, "tsconfigRootDir": None} for name in files}
+    shards, split_programs = shard_planner.plan_shards(tmp_path, files, estimates, 3, projects)
+    loads = [shard["estimated_ms"] for shard in shards]
+    assert sorted(name for shard in shards for name in shard["files"]) == sorted(files)
+    assert max(loads) - min(loads) <= max(estimates.values())
+    assert split_programs == []
+
+    (tmp_path / "packages" / "a").mkdir(parents=True)
+    (tmp_path / "packages" / "a" / "tsconfig.json").write_text("{}")
+    small = {"packages/a/x.ts": 5, "packages/a/y.ts": 5}
+    settings = {"project": "packages/*/tsconfig.json", "tsconfigRootDir": None}
+    shards, split_programs = shard_planner.plan_shards(
+        tmp_path, [*files, *small], estimates | small, 3, projects | {name: settings for name in small},
+    )
+    # A program smaller than a shard's share stays in one shard.
+    assert any(set(small) <= set(shard["files"]) for shard in shards)
+    assert split_programs == []
+
+
+def test_plan_shards_splits_oversized_programs(tmp_path):
+    (tmp_path / "tsconfig.json").write_text("{}")
+    files = [f"src/file{index}.ts" for index in range(8)]
+    estimates = {name: 10 for name in files}
+    projects = {name: {"project": "tsconfig.json", "tsconfigRootDir": None} for name in files}
+    shards, split_programs = shard_planner.plan_shards(tmp_path, files, estimates, 2, projects)
+    assert split_programs == ["tsconfig.json"]
+    assert [shard["estimated_ms"] for shard in shards] == [40, 40]
@@ -0,0 +1,188 @@
+#!/usr/bin/env python
+
+# Report what upgrading ESLint or a plugin changes, between two installed
+# node_modules trees:
+#
+#   upgrade_report.py OLD/node_modules NEW/node_modules --corpus DIR
+#
+# The rule metadata of every rule source is diffed: versions, added, removed
+# and newly deprecated rules, and changes to fixable and type-aware status,
+# with the from_js lists to paste into make_eslintrc.py. Then the benchmark
+# corpus (see benchmark.py corpus) is linted with the generated configs on
+# both trees, and the time change per rule and phase and the peak RSS change
+# give the verdict. Exits with 1 if the upgrade is slower than the threshold.
+
+import argparse
+import json
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+import benchmark
+import lint_runner
+import make_eslintrc
+
+
+def source_of(rule):
+    prefix, _, _ = rule.rpartition("/")
+    for source_name, source in make_eslintrc.rule_sources.items():
+        if source["prefix"] == prefix:
+            return source_name
+    return None
+
+
+def rule_metadata(node_modules, plugins=None):
+    if plugins is None:
+        plugins = {source["package"]: source["prefix"] for source in make_eslintrc.rule_sources.values() if source["prefix"]}
+    result = subprocess.run(
+        ["node", str(lint_runner.here / "get-rule-metadata.js"), json.dumps(plugins)],
+        cwd=node_modules.parent,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        print(f"Cannot read the rules in {node_modules}:\n{result.stderr}", file=sys.stderr)
+        sys.exit(1)
+    return json.loads(result.stdout)
+
+
+def diff_metadata(old, new):
+    configured = make_eslintrc.get_rules_prefixed(make_eslintrc.rule_sources)
+    enabled = {rule for rule, value in configured.items() if make_eslintrc.rule_severity(value) != "off"}
+    diff = defaultdict(lambda: defaultdict(list))
+    for rule in sorted(set(old["rules"]) | set(new["rules"])):
+        source_name = source_of(rule)
+        before, after = old["rules"].get(rule), new["rules"].get(rule)
+        if before is None:
+            diff[source_name]["added" if not after["deprecated"] else "added deprecated"].append(rule)
+        elif after is None:
+            key = "removed, configured" if rule in enabled else "removed"
+            diff[source_name][key].append(rule)
+        else:
+            if after["deprecated"] and not before["deprecated"]:
+                replaced_by = f" (use {', '.join(after['replaced_by'])})" if after["replaced_by"] else ""
+                key = "deprecated, configured" if rule in enabled else "deprecated"
+                diff[source_name][key].append(rule + replaced_by)
+            for field in ("fixable", "type_aware", "has_suggestions"):
+                if before[field] != after[field]:
+                    diff[source_name][f"{field} changed"].append(f"{rule}: {before[field]} -> {after[field]}")
+    return diff
+
+
+def from_js_lists(metadata, source_name):
+    # The from_js and from_js_deprecated lists of a source, as in make_eslintrc.py.
+    lists = {"from_js": [], "from_js_deprecated": []}
+    prefix = make_eslintrc.rule_sources[source_name]["prefix"]
+    for rule, rule_metadata in metadata["rules"].items():
+        if source_of(rule) == source_name:
+            name = rule.removeprefix(f"{prefix}/") if prefix else rule
+            lists["from_js_deprecated" if rule_metadata["deprecated"] else "from_js"].append(name)
+    return lists
+
+
+def format_metadata_diff(old, new, diff):
+    lines = []
+    for source_name, source in make_eslintrc.rule_sources.items():
+        old_version = old["packages"].get(source["package"])
+        new_version = new["packages"].get(source["package"])
+        changes = diff.get(source_name, {})
+        if old_version == new_version and not changes:
+            continue
+        lines.append(f"{source_name}: {old_version} -> {new_version} (tables have {source['version']})")
+        for kind, rules in changes.items():
+            lines.append(f"  {kind} ({len(rules)}):")
+            lines += [f"    - {rule}" for rule in rules]
+        if changes:
+            lists = from_js_lists(new, source_name)
+            for key, names in lists.items():
+                lines.append(f'  "{key}": {json.dumps(names)}')
+    return "\n".join(lines) or "No rule changes"
+
+
+def run_on_tree(corpus, node_modules, config_name, config, repeat):
+    # The corpus links node_modules to an installation, point it at the tree.
+    link = corpus / "node_modules"
+    previous = link.readlink() if link.is_symlink() else None
+    if link.exists() and previous is None:
+        print(f"{link} is not a symlink, cannot switch it between trees", file=sys.stderr)
+        sys.exit(1)
+    try:
+        if previous is not None:
+            link.unlink()
+        link.symlink_to(node_modules.resolve())
+        runs = []
+        for _ in range(repeat):
+            results = lint_runner.run_instrumented(corpus, config_name, config, ["src"], check=False)
+            if results is None:
+                return None
+            runs.append(benchmark.summarize_run(results))
+        return min(runs, key=lambda run: run["wall_ms"])
+    finally:
+        link.unlink()
+        if previous is not None:
+            link.symlink_to(previous)
+
+
+def format_performance(config_name, old_run, new_run, threshold, top):
+    change = new_run["wall_ms"] / old_run["wall_ms"] - 1
+    rss_change = new_run["peak_rss_mb"] - old_run["peak_rss_mb"]
+    if change > threshold:
+        verdict = "slower"
+    elif change < -threshold:
+        verdict = "faster"
+    else:
+        verdict = "no significant change"
+    lines = [
+        f"{config_name}: {verdict}, {old_run['wall_ms']:.0f} ms -> {new_run['wall_ms']:.0f} ms ({change:+.1%}),"
+        f" peak RSS {old_run['peak_rss_mb']:.0f} MB -> {new_run['peak_rss_mb']:.0f} MB ({rss_change:+.0f} MB)",
+    ]
+    for phase, old_ms in old_run["phases_ms"].items():
+        lines.append(f"  {phase:<36} {old_ms:>10.0f} ms {new_run['phases_ms'][phase]:>10.0f} ms")
+    rules = set(old_run["rules_ms"]) | set(new_run["rules_ms"])
+    changes = sorted(
+        ((new_run["rules_ms"].get(rule, 0) - old_run["rules_ms"].get(rule, 0), rule) for rule in rules),
+        key=lambda item: -abs(item[0]),
+    )
+    lines.append("  rules with the largest change:")
+    lines += [
+        f"    {rule:<34} {old_run['rules_ms'].get(rule, 0):>10.1f} ms {new_run['rules_ms'].get(rule, 0):>10.1f} ms {delta:>+10.1f} ms"
+        for delta, rule in changes[:top]
+    ]
+    return "\n".join(lines), verdict == "slower"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Diff rules and performance between two node_modules trees.")
+    parser.add_argument("old", type=Path, help="node_modules before the upgrade")
+    parser.add_argument("new", type=Path, help="node_modules after the upgrade")
+    parser.add_argument("--corpus", type=Path, help="benchmark corpus to lint with both trees")
+    parser.add_argument("--configs", nargs="+", choices=make_eslintrc.configs, default=list(make_eslintrc.configs))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.05, help="change counted as significant, 0.05 = 5%%")
+    parser.add_argument("--top", type=int, default=10, help="rules to list per config")
+    args = parser.parse_args()
+
+    make_eslintrc.run_checks_once()
+    old = rule_metadata(args.old.resolve())
+    new = rule_metadata(args.new.resolve())
+    diff = diff_metadata(old, new)
+    print(format_metadata_diff(old, new, diff))
+
+    if not args.corpus:
+        sys.exit(0)
+    slower = False
+    for config_name in args.configs:
+        config = make_eslintrc.make_config(config_name)
+        old_run = run_on_tree(args.corpus.resolve(), args.old, config_name, config, args.repeat)
+        new_run = run_on_tree(args.corpus.resolve(), args.new, config_name, config, args.repeat)
+        if old_run is None or new_run is None:
+            tree = "old" if old_run is None else "new"
+            print(f"{config_name}: lint failed with the {tree} tree, see the removed rules above", file=sys.stderr)
+            slower = True
+            continue
+        report, config_slower = format_performance(config_name, old_run, new_run, args.threshold, args.top)
+        print(f"\n{report}")
+        slower = slower or config_slower
+    if slower:
+        sys.exit(1)